@@ -16,6 +16,10 @@ from .automation_creation import (
     load_new_automation_data,
 )
 
+# The `bulk_import.py` script imports all automations of a directory or an `automations.yaml` file at once.
+from .bulk_import import import_automations
+
 __all__ = [
     "load_new_automation_data",
+    "import_automations",
 ]
@@ -64,7 +64,7 @@ def _action_entities(
     action_part: dict,
     position: int,
     real_position: int,
-    script_path: str,
+    script: asg.ScriptBuilder | str,
     parent: int = None,
     indentation_level: int = 1,
     first_element: bool = True,
@@ -98,7 +98,7 @@ def _action_entities(
     # processes a conditional action
     if SCRIPT_ACTION_IF in action_part:
         indentation_level = asg.start_action_condition_block(
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             first_element=first_element,
             not_condition=False,
@@ -129,7 +129,7 @@ def _action_entities(
                 position=position,
                 parent=new_parent,
                 real_position=real_position,
-                script_path=script_path,
+                script=script,
                 indentation_level=indentation_level,
                 first_element=first_element,
                 source=CONF_ACTION,
@@ -151,7 +151,7 @@ def _action_entities(
 
         # close the condition block
         asg.close_action_condition_block(
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             no_condition=no_entities,
         )
@@ -182,7 +182,7 @@ def _action_entities(
                     position=position,
                     parent=new_parent,
                     real_position=real_position,
-                    script_path=script_path,
+                    script=script,
                     indentation_level=indentation_level,
                     first_element=first_element,
                     loop_action=loop_action,
@@ -203,11 +203,11 @@ def _action_entities(
 
             if len(then_entities) == 0:
                 asg.create_empty_action_section(
-                    filepath=script_path, indentation_lvl=indentation_level
+                    script=script, indentation_lvl=indentation_level
                 )
         else:
             asg.create_empty_action_section(
-                filepath=script_path, indentation_lvl=indentation_level
+                script=script, indentation_lvl=indentation_level
             )
 
         if CONF_ELSE in action_part:
@@ -215,7 +215,7 @@ def _action_entities(
                 position += 1
 
             asg.create_else_action_section(
-                filepath=script_path, indentation_lvl=indentation_level
+                script=script, indentation_lvl=indentation_level
             )
 
             else_entities = []
@@ -240,7 +240,7 @@ def _action_entities(
                     position=position,
                     parent=new_parent,
                     real_position=real_position,
-                    script_path=script_path,
+                    script=script,
                     indentation_level=indentation_level,
                     first_element=first_element,
                     loop_action=loop_action,
@@ -261,7 +261,7 @@ def _action_entities(
 
             if len(else_entities) == 0:
                 asg.create_empty_action_section(
-                    filepath=script_path, indentation_lvl=indentation_level
+                    script=script, indentation_lvl=indentation_level
                 )
 
             indentation_level -= 1
@@ -283,7 +283,7 @@ def _action_entities(
                     first_element = False
 
                 indentation_level = asg.start_action_condition_block(
-                    filepath=script_path,
+                    script=script,
                     indentation_lvl=indentation_level,
                     first_element=first_element,
                     not_condition=False,
@@ -311,7 +311,7 @@ def _action_entities(
                         condition_part=condition,
                         position=position,
                         parent=new_parent,
-                        script_path=script_path,
+                        script=script,
                         real_position=real_position,
                         indentation_level=indentation_level,
                         first_element=first_element,
@@ -335,7 +335,7 @@ def _action_entities(
 
                 # close the condition block
                 asg.close_action_condition_block(
-                    filepath=script_path,
+                    script=script,
                     indentation_lvl=indentation_level,
                     no_condition=no_entities,
                 )
@@ -365,7 +365,7 @@ def _action_entities(
                         action_part=action,
                         position=position,
                         real_position=real_position,
-                        script_path=script_path,
+                        script=script,
                         parent=new_parent,
                         indentation_level=indentation_level,
                         first_element=first_element,
@@ -384,11 +384,11 @@ def _action_entities(
                 entity_list += action_list
                 if len(action_list) == 0:
                     asg.create_empty_action_section(
-                        filepath=script_path, indentation_lvl=indentation_level
+                        script=script, indentation_lvl=indentation_level
                     )
             else:
                 asg.create_empty_action_section(
-                    filepath=script_path, indentation_lvl=indentation_level
+                    script=script, indentation_lvl=indentation_level
                 )
             indentation_level -= 1
 
@@ -397,7 +397,7 @@ def _action_entities(
             indentation_level += 1
 
             asg.create_else_action_section(
-                filepath=script_path, indentation_lvl=indentation_level
+                script=script, indentation_lvl=indentation_level
             )
 
             action_list = []
@@ -421,7 +421,7 @@ def _action_entities(
                     action_part=action,
                     position=position,
                     real_position=real_position,
-                    script_path=script_path,
+                    script=script,
                     parent=new_parent,
                     indentation_level=indentation_level,
                     first_element=first_element,
@@ -456,7 +456,7 @@ def _action_entities(
                 action_part=action,
                 position=position,
                 real_position=real_position,
-                script_path=script_path,
+                script=script,
                 parent=new_parent,
                 indentation_level=indentation_level,
                 first_element=first_element,
@@ -491,7 +491,7 @@ def _action_entities(
 
         indentation_level = asg.start_action_loop_block(
             loop_type=loop_tpye,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             loop_settings=loop_setting,
         )
@@ -503,7 +503,7 @@ def _action_entities(
                 not_condition = True
 
             indentation_level = asg.start_action_condition_block(
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 first_element=True,
                 not_condition=not_condition,
@@ -530,7 +530,7 @@ def _action_entities(
                     condition_part=condition,
                     position=position,
                     parent=new_parent,
-                    script_path=script_path,
+                    script=script,
                     real_position=real_position,
                     indentation_level=indentation_level,
                     first_element=first_element,
@@ -555,7 +555,7 @@ def _action_entities(
 
             # close the condition block
             asg.close_action_condition_block(
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 no_condition=no_entities,
             )
@@ -565,7 +565,7 @@ def _action_entities(
 
             # set the loop_is_running varible to false
             asg.create_action_loop_stop(
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 loop_type=loop_tpye,
             )
@@ -579,7 +579,7 @@ def _action_entities(
                         action_part=action,
                         position=position,
                         real_position=real_position,
-                        script_path=script_path,
+                        script=script,
                         parent=parent,
                         indentation_level=indentation_level,
                         first_element=first_element,
@@ -593,7 +593,7 @@ def _action_entities(
 
             # close the loop block
             indentation_level = asg.close_action_loop_block(
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 is_infinite=is_infinite,
                 loop_tpye=loop_tpye,
@@ -607,7 +607,7 @@ def _action_entities(
                     action_part=action,
                     position=position,
                     real_position=real_position,
-                    script_path=script_path,
+                    script=script,
                     parent=parent,
                     indentation_level=indentation_level,
                     first_element=first_element,
@@ -622,7 +622,7 @@ def _action_entities(
     # processes a condition in the action part
     elif CONF_CONDITION in action_part:
         indentation_level = asg.start_action_condition_block(
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             first_element=first_element,
             not_condition=True,
@@ -649,7 +649,7 @@ def _action_entities(
                 condition_part=condition,
                 position=position,
                 parent=new_parent,
-                script_path=script_path,
+                script=script,
                 real_position=real_position,
                 indentation_level=indentation_level,
                 first_element=first_element,
@@ -671,7 +671,7 @@ def _action_entities(
 
         # close the condition block
         asg.close_action_condition_block(
-            filepath=script_path, indentation_lvl=indentation_level, timeout=False
+            script=script, indentation_lvl=indentation_level, timeout=False
         )
 
     # processes a event action
@@ -699,7 +699,7 @@ def _action_entities(
         asg.create_action_script(
             action_type=CONF_EVENT,
             entity=entity,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             loop_action=loop_action,
         )
@@ -762,7 +762,7 @@ def _action_entities(
         asg.create_action_script(
             action_type=CONF_ACTION,
             entity=entity,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             loop_action=loop_action,
         )
@@ -770,7 +770,7 @@ def _action_entities(
     # processes a wait for a trigger action
     elif SCRIPT_ACTION_WAIT_FOR_TRIGGER in action_part:
         indentation_level = asg.start_action_condition_block(
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             first_element=True,
             not_condition=True,
@@ -797,7 +797,7 @@ def _action_entities(
             if not first_element:
                 asg.create_next_logic_condition_part(
                     condition_type=CONF_OR,
-                    filepath=script_path,
+                    script=script,
                     indentation_lvl=indentation_level,
                 )
 
@@ -805,7 +805,7 @@ def _action_entities(
                 trigger_part=trigger,
                 position=position,
                 real_position=real_position,
-                script_path=script_path,
+                script=script,
                 parent=new_parent,
                 indentation_level=indentation_level,
                 source=CONF_ACTION,
@@ -839,7 +839,7 @@ def _action_entities(
                 continue_action = False
 
             asg.close_action_condition_block(
-                script_path, indentation_level, timeout=continue_action
+                script, indentation_level, timeout=continue_action
             )
 
     # processes a device action
@@ -865,13 +865,13 @@ def _action_entities(
         asg.create_action_script(
             action_type=CONF_DEVICE,
             entity=entity,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             loop_action=loop_action,
         )
 
     elif CONF_STOP in action_part:
-        asg.create_stopping_action(script_path, indentation_level, False)
+        asg.create_stopping_action(script, indentation_level, False)
 
     # TODO add variables for more detailed template actionss
     # processes variables in the action part
@@ -886,12 +886,13 @@ def _action_entities(
     return [entity_list, position, real_position]
 
 
-def extract_all_actions(automation_config: AutomationConfig, script_path: str) -> list:
+def extract_all_actions(automation_config: AutomationConfig, script: asg.ScriptBuilder | str) -> list:
     """
     Extract the action from the data.
 
     Args:
         automation_config (AutomationConfig): The automation configuration data.
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
 
     Returns:
         list: A list of action entities extracted from the data
@@ -902,14 +903,14 @@ def extract_all_actions(automation_config: AutomationConfig, script_path: str) -
     real_position = 0
     num_action_entities = 0
 
-    asg.init_action_part(script_path)
+    asg.init_action_part(script)
 
     for action in actions:
         return_list = _action_entities(
             action_part=action,
             position=position,
             real_position=real_position,
-            script_path=script_path,
+            script=script,
             first_element=True,
             parent=None,
             loop_action=False,
@@ -929,5 +930,5 @@ def extract_all_actions(automation_config: AutomationConfig, script_path: str) -
     if num_action_entities != real_position:
         raise vol.Invalid("The amount of entities and the real position do not match")
 
-    asg.close_action_section(script_path)
+    asg.close_action_section(script)
     return action_entities
@@ -41,7 +41,12 @@ from .trigger_script_gen import (
     create_trigger_script,
 )
 from .utils import (
+    ScriptBuilder,
     create_locked_message,
+    create_script_builder,
+    discard_script,
+    get_indentation,
+    get_script_version,
     init_automation_script,
 )
 
@@ -50,6 +55,11 @@ from .utils import (
 __all__ = [
     "init_automation_script",
     "create_locked_message",
+    "create_script_builder",
+    "discard_script",
+    "get_indentation",
+    "get_script_version",
+    "ScriptBuilder",
     "close_trigger_section",
     "create_combination_trigger_script",
     "create_trigger_script",
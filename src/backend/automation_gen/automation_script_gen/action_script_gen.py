@@ -2,8 +2,6 @@
 This module is used to generate the action part for the automation script.
 """
 
-from os import path
-
 from ...ha_automation_utils.home_assistant_const import (
     CONF_ACTION,
     CONF_DEVICE,
@@ -13,46 +11,44 @@ from ...ha_automation_utils.home_assistant_const import (
     CONF_UNTIL,
     CONF_WHILE,
 )
-from ...utils.env_const import TEMPLATE_PATH
 from ...utils.env_helper_classes import Entity
-from .utils import append_script_context_to_script, close_script
+from .utils import (
+    ScriptBuilder,
+    append_script_context_to_script,
+    close_script,
+    get_indentation,
+    load_template,
+)
 
 END_IF_TEMPLATE = "):\n"
 
 
-def init_action_part(filepath: str) -> None:
+def init_action_part(script: ScriptBuilder | str) -> None:
     """
     Initialize the action part in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
-    action_template = path.join(TEMPLATE_PATH, "action_template.py")
-    try:
-        with open(action_template, "r") as file:
-            script_content = file.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Template file {action_template} not found")
-    # ! tabs aren't taken into account and are converted to 4 spaces
-    script_content = script_content.replace("    ", "\t")
+    script_content = load_template("action_template.py")
 
-    append_script_context_to_script(filepath, script_content)
+    append_script_context_to_script(script, script_content)
 
 
 def start_action_condition_block(
-    filepath: str, indentation_lvl: int = 1, first_element=True, not_condition=False
+    script: ScriptBuilder | str, indentation_lvl: int = 1, first_element=True, not_condition=False
 ) -> None:
     """
     Start the condition block in the action part of the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the condition block. Defaults to 1.
 
     Returns:
         int: The new indentation level for the conditions in the condition block and the actions afterwards.
     """
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
 
     if first_element:
         if_level = "if"
@@ -63,13 +59,13 @@ def start_action_condition_block(
         script_context = f"{indentation}{if_level} not (\n"
     else:
         script_context = f"{indentation}{if_level} (\n"
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return indentation_lvl + 1
 
 
 def close_action_condition_block(
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     no_condition: bool = False,
     timeout: bool = None,
@@ -79,84 +75,85 @@ def close_action_condition_block(
     based on additional inputs like if the condition has a timeout or no conditional expressions.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the condition block. Defaults to 1.
         no_condition (bool, optional): If no entity is given to the condition.
         timeout (bool): Is a timeout for the wait for trigger section in the automation.
     """
-    indentation = "\t" * (indentation_lvl - 1)
+    indentation = get_indentation(indentation_lvl - 1)
+    body_indentation = get_indentation(indentation_lvl)
     script_context = ""
 
     if no_condition:
-        script_context += f"{indentation}\t False\n"
+        script_context += f"{body_indentation} False\n"
 
     if timeout:
         script_context += f" or True{END_IF_TEMPLATE}"
     else:
         script_context += f"{indentation}{END_IF_TEMPLATE}"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     if timeout is not None:
-        create_stopping_action(filepath, (indentation_lvl - 1), timeout)
+        create_stopping_action(script, (indentation_lvl - 1), timeout)
 
 
 def create_stopping_action(
-    filepath: str, indentation_lvl: int, timeout: bool
+    script: ScriptBuilder | str, indentation_lvl: int, timeout: bool
 ) -> None:  #
     """
     Creates a interrupt in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the wait for trigger section in the automation script.
     """
-    indentation = "\t" * indentation_lvl
+    body_indentation = get_indentation(indentation_lvl + 1)
 
     script_context = (
-        f"{indentation}\tprint(json.dumps(action_results))\n{indentation}\treturn\n\n"
+        f"{body_indentation}print(json.dumps(action_results))\n{body_indentation}return\n\n"
     )
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
-def create_empty_action_section(filepath: str, indentation_lvl: int) -> None:
+def create_empty_action_section(script: ScriptBuilder | str, indentation_lvl: int) -> None:
     """
     Create an empty action section in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the action section in the automation script.
     """
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
 
     script_context = f"{indentation}pass\n"
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
-def create_else_action_section(filepath: str, indentation_lvl: int) -> None:
+def create_else_action_section(script: ScriptBuilder | str, indentation_lvl: int) -> None:
     """
     Create the else section in a branching part of the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the else section in the automation script.
     """
-    indentation = "\t" * (indentation_lvl - 1)
+    indentation = get_indentation(indentation_lvl - 1)
 
     script_context = f"{indentation}else:\n"
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
 def start_action_loop_block(
-    loop_type: str, filepath: str, indentation_lvl: int, loop_settings: list
+    loop_type: str, script: ScriptBuilder | str, indentation_lvl: int, loop_settings: list
 ) -> int:
     """
     Start the loop block in the action part of the automation script.
 
     Args:
         loop_type (str): The type of the loop (CONF_FOR_EACH, CONF_WHILE, CONF_UNTIL, CONF_FOR).
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the loop block.
         loop_settings (list): The settings for the loop. (the entity list for the loop or the range for the loop)
 
@@ -164,7 +161,8 @@ def start_action_loop_block(
         int: The new indentation level for the actions in the loop block.
     """
 
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
+    body_indentation = get_indentation(indentation_lvl + 1)
 
     # loop initialization with the setting variables
     script_context = f"{indentation}first_loop = True\n{indentation}infinite_loop = False \n{indentation}output_counter = []\n\n"
@@ -172,83 +170,85 @@ def start_action_loop_block(
     # creating the loop header with a counting variable for every output in the loop
     if loop_type == CONF_FOR_EACH:
         script_context += (
-            f"{indentation}for action in {loop_settings}:\n{indentation}\toutput = 0\n"
+            f"{indentation}for action in {loop_settings}:\n{body_indentation}output = 0\n"
         )
 
     # both loops get interupted by a if satetment with the condition of the loop
     elif loop_type == CONF_WHILE or loop_type == CONF_UNTIL:
-        script_context += f"{indentation}loop_is_running = True\n{indentation}while (loop_is_running):\n{indentation}\toutput = 0\n"
+        script_context += f"{indentation}loop_is_running = True\n{indentation}while (loop_is_running):\n{body_indentation}output = 0\n"
     elif loop_type == CONF_FOR:
-        script_context += f"{indentation}for x in range({loop_settings[0]},{loop_settings[1]}):\n{indentation}\toutput = 0\n"
+        script_context += f"{indentation}for x in range({loop_settings[0]},{loop_settings[1]}):\n{body_indentation}output = 0\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return indentation_lvl + 1
 
 
 def create_action_loop_stop(
-    filepath: str, indentation_lvl: int, loop_type: str
+    script: ScriptBuilder | str, indentation_lvl: int, loop_type: str
 ) -> None:
     """
     Create the interrupt for the loop block.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the loop block.
         loop_type (str): The type of the loop (CONF_FOR_EACH, CONF_WHILE, CONF_UNTIL, CONF_FOR).
     """
-    indentation = "\t" * indentation_lvl
+    body_indentation = get_indentation(indentation_lvl + 1)
 
-    script_context = f"{indentation}\tloop_is_running = False\n"
+    script_context = f"{body_indentation}loop_is_running = False\n"
 
     if loop_type == CONF_WHILE:
-        script_context += f"{indentation}\tbreak\n"
+        script_context += f"{body_indentation}break\n"
     # make space to the starting loop block
     script_context += "\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
 def close_action_loop_block(
-    filepath: str, indentation_lvl: int, is_infinite: bool, loop_tpye: str
+    script: ScriptBuilder | str, indentation_lvl: int, is_infinite: bool, loop_tpye: str
 ) -> None:
     """
     Creates a counting, combining and possible aborting of the loop block.
 
     Args:
         loop_type (str): The type of the loop (CONF_FOR_EACH, CONF_WHILE, CONF_UNTIL, CONF_FOR).
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int): The indentation level of the loop block
         is_infinite (bool): Is the loop an infinite loop by the condition of the loop.
     """
-    indentation = "\t" * (indentation_lvl - 1)
+    indentation = get_indentation(indentation_lvl - 1)
+    body_indentation = get_indentation(indentation_lvl)
+    inner_indentation = get_indentation(indentation_lvl + 1)
     script_context = ""
 
     # set the first_loop variable to False
-    script_context += f"{indentation}\tif first_loop:\n"
-    script_context += f"{indentation}\t\tfirst_loop = False\n\n"
+    script_context += f"{body_indentation}if first_loop:\n"
+    script_context += f"{inner_indentation}first_loop = False\n\n"
 
     # if the loop is infinite, the loop is running to be stopped by the condition
     if is_infinite or loop_tpye == CONF_UNTIL or loop_tpye == CONF_WHILE:
-        script_context += f"{indentation}\t# The loop could continue infinitly.\n"
-        script_context += f"{indentation}\t# Since no detection is built in, it stops after one iteration.\n"
-        script_context += f"{indentation}\tif loop_is_running:\n"
+        script_context += f"{body_indentation}# The loop could continue infinitly.\n"
+        script_context += f"{body_indentation}# Since no detection is built in, it stops after one iteration.\n"
+        script_context += f"{body_indentation}if loop_is_running:\n"
         script_context += (
-            f"{indentation}\t\tinfinite_loop = True\n{indentation}\t\tbreak\n\n"
+            f"{inner_indentation}infinite_loop = True\n{inner_indentation}break\n\n"
         )
 
     script_context += (
         f"{indentation}# map the call counters to the outputs of the loop\n"
     )
     script_context += f"{indentation}for x in range(0, len(action_results)):\n"
-    script_context += f"{indentation}\tif infinite_loop:\n"
-    script_context += f"{indentation}\t\taction_results[x]['count'] = 'infinite'\n"
-    script_context += f"{indentation}\telse:\n"
+    script_context += f"{body_indentation}if infinite_loop:\n"
+    script_context += f"{inner_indentation}action_results[x]['count'] = 'infinite'\n"
+    script_context += f"{body_indentation}else:\n"
     script_context += (
-        f"{indentation}\t\taction_results[x]['count'] = output_counter[x]\n\n"
+        f"{inner_indentation}action_results[x]['count'] = output_counter[x]\n\n"
     )
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return indentation_lvl - 1
 
@@ -256,7 +256,7 @@ def close_action_loop_block(
 def create_action_script(
     action_type: str,
     entity: Entity,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     loop_action: bool = False,
 ) -> None:
@@ -266,13 +266,14 @@ def create_action_script(
     Args:
         action_type (str): The type of the action which is an output (CONF_EVENT, CONF_DEVICE, CONF_ACTION).
         entity (Entity): The entity which is the output of the action.
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the action part. Defaults to 1.
         loop_action (bool, optional): If the action is part of a loop it need special implementation for counting its calls.
                                       Defaults to False.
     """
 
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
+    body_indentation = get_indentation(indentation_lvl + 1)
     script_context = ""
     result = ""
 
@@ -290,32 +291,35 @@ def create_action_script(
     if loop_action:
         # make a loop action with a call counter for every output
         script_context = f"{indentation}if first_loop:\n"
-        script_context += f"{indentation}\taction_results.append({result})\n"
-        script_context += f"{indentation}\toutput_counter.append(1)\n"
+        script_context += f"{body_indentation}action_results.append({result})\n"
+        script_context += f"{body_indentation}output_counter.append(1)\n"
         script_context += f"{indentation}else:\n"
-        script_context += f"{indentation}\toutput_counter[output] += 1\n"
-        script_context += f"{indentation}\toutput += 1\n\n"
+        script_context += f"{body_indentation}output_counter[output] += 1\n"
+        script_context += f"{body_indentation}output += 1\n\n"
     else:
         script_context = f"{indentation}action_results.append({result})\n\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
-def close_action_section(filepath: str) -> None:
+def close_action_section(script: ScriptBuilder | str) -> None:
     """
     Close the action section in the automation script and add the final print statement.
     It is also calling the function to close the script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
-    script_context = """
-\t# The end of the action section
-\tif action_results != []:
-\t\tprint(json.dumps(action_results))
-\telse:
-\t\tprint(json.dumps({"AutomationResult":"No action results"}))\n\n"""
+    indentation = get_indentation(1)
+    body_indentation = get_indentation(2)
+
+    script_context = f"""
+{indentation}# The end of the action section
+{indentation}if action_results != []:
+{body_indentation}print(json.dumps(action_results))
+{indentation}else:
+{body_indentation}print(json.dumps({{"AutomationResult":"No action results"}}))\n\n"""
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
-    close_script(filepath)
+    close_script(script)
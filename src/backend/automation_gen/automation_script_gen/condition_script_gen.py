@@ -2,8 +2,6 @@
 This module generates the condition part of the automation script.
 """
 
-from os import path
-
 from backend.ha_automation_utils.home_assistant_config_validation import valid_entity_id
 from backend.ha_automation_utils.home_assistant_const import (
     CONF_ABOVE,
@@ -19,34 +17,32 @@ from backend.ha_automation_utils.home_assistant_const import (
     CONF_TYPE,
     CONF_ZONE,
 )
-from backend.utils.env_const import TEMPLATE_PATH
 from backend.utils.env_helper import is_jinja_template
 from backend.utils.env_helper_classes import Entity
 
-from .utils import append_script_context_to_script
+from .utils import (
+    INDENTATION,
+    ScriptBuilder,
+    append_script_context_to_script,
+    get_indentation,
+    load_template,
+)
 
 IF_TEMPLATE = "if ("
 END_IF_TEMPLATE = "):\n"
 
 
-def init_condition_part(filepath: str) -> None:
+def init_condition_part(script: ScriptBuilder | str) -> None:
     """
     Initialize the condition part in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
 
-    condition_template = path.join(TEMPLATE_PATH, "condition_template.py")
-    try:
-        with open(condition_template, "r") as file:
-            script_content = file.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Template file {condition_template} not found")
-    # ! tabs aren't taken into account and are converted to 4 spaces
-    script_content = script_content.replace("    ", "\t")
+    script_content = load_template("condition_template.py")
 
-    append_script_context_to_script(filepath, script_content)
+    append_script_context_to_script(script, script_content)
 
 
 def _get_condition_expression(
@@ -225,7 +221,7 @@ def create_combination_condition_script(
     condition_type: str,
     entity_list: list,
     condition_pos: int,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     first_element: bool = True,
     source: str = "condition",
@@ -238,7 +234,7 @@ def create_combination_condition_script(
         condition_type (str): The type of the condition.
         entity_list (list): The list of entities of the condition.
         condition_pos (int): The real position of the condition in the automation script.
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the condition block. Defaults to 1.
         first_element (bool, optional): Determine if the condition is the first element in the condition block.
                                         Defaults to True.
@@ -249,7 +245,7 @@ def create_combination_condition_script(
         int: The new condition_pos for the next condition entity (is the next condition_pos in the automation script).
     """
     script_context = ""
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
     if combinator == CONF_NOT:
         combinator = "and not"
 
@@ -261,7 +257,7 @@ def create_combination_condition_script(
         else:
             script_context += indentation + combinator + "(\n"
 
-        indentation += "\t"
+        indentation += INDENTATION
         # cache for the condition_pos of the above condition
         above_position = None
 
@@ -309,7 +305,7 @@ def create_combination_condition_script(
         if condition_type != CONF_TRIGGER:
             condition_pos += 1
 
-    indentation = indentation_lvl * "\t"
+    indentation = get_indentation(indentation_lvl)
     script_context += indentation + ")\n"
 
     if condition_type == CONF_NUMERIC_STATE:
@@ -317,7 +313,7 @@ def create_combination_condition_script(
             script_context = script_context.replace("XXXX", str((condition_pos)))
             condition_pos += 1
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return condition_pos
 
@@ -326,7 +322,7 @@ def create_condition_script(
     condition_type: str,
     entity: Entity,
     condition_pos: int,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     first_element: bool = True,
     source: str = "condition",
@@ -339,7 +335,7 @@ def create_condition_script(
         condition_type (str): The type of the condition.
         entity (Entity): The entity of the condition.
         condition_pos (int): The position of the condition in the automation script based on former conditions.
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the condition block. Defaults to 1.
         first_element (bool, optional): Determine if the condition is the first element in the condition block.
                                         Defaults to True.
@@ -349,7 +345,7 @@ def create_condition_script(
     Returns:
         int: The new condition_pos for the next condition entity (is the next condition_pos in the automation script).
     """
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
     script_context = ""
     if combinator == CONF_NOT:
         combinator = "and not"
@@ -383,7 +379,7 @@ def create_condition_script(
             condition_pos += 1
             script_context = script_context.replace("XXXX", str((condition_pos)))
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     if condition_type == CONF_TRIGGER:
         return condition_pos
@@ -393,7 +389,7 @@ def create_condition_script(
 
 def start_logic_function_block(
     condition_type: str,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     first_element: bool = False,
 ) -> int:
@@ -403,10 +399,10 @@ def start_logic_function_block(
     Args:
         condition_type (str): The type of the condition (CONF_OR, CONF_AND, CONF_NOT).
         condition_pos (int): The position of the condition in the automation script based on former conditions.
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the function block. Defaults to 1.
     """
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
 
     if first_element:
         script_context = f"{indentation}(\n"
@@ -414,15 +410,15 @@ def start_logic_function_block(
         script_context = f"{indentation}and ("
 
     if condition_type == CONF_NOT:
-        script_context += f"{indentation}\tnot\n"
+        script_context += f"{indentation}{INDENTATION}not\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
     return indentation_lvl + 1
 
 
 def create_next_logic_condition_part(
     condition_type: str,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 2,
 ) -> None:
     """
@@ -431,42 +427,45 @@ def create_next_logic_condition_part(
     
     Args:
         condition_type (str): The type of the condition (CONF_OR, CONF_AND, CONF_NOT).
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the condition block. Defaults to 2.
     """
     
-    indentation = "\t" * (indentation_lvl)
+    indentation = get_indentation(indentation_lvl)
     
     if condition_type == CONF_OR:
         script_context = indentation + "or "
         
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
 def close_logic_function_block(
-    filepath, indentation_lvl: int = 2
+    script: ScriptBuilder | str, indentation_lvl: int = 2
 ) -> None:
     """
     Close the function block for the logic connection of condition in the automation script.
     
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): The indentation level of the function block. Defaults to 2.
     """
-    indentation = "\t" * (indentation_lvl)
+    indentation = get_indentation(indentation_lvl)
     script_context = ""
 
     script_context += f"{indentation})\n"
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
 
-def close_condition_section(filepath: str) -> None:
+def close_condition_section(script: ScriptBuilder | str) -> None:
     """
     Close the complete condition section in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
-    script_context = f"\t{END_IF_TEMPLATE}\t\tcondition_passed = True\n\t# The end of the condition section\n\treturn condition_passed\n\n"
+    indentation = get_indentation(1)
+    body_indentation = get_indentation(2)
+
+    script_context = f"{indentation}{END_IF_TEMPLATE}{body_indentation}condition_passed = True\n{indentation}# The end of the condition section\n{indentation}return condition_passed\n\n"
     
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
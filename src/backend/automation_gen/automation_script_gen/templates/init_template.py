@@ -7,11 +7,17 @@ Please only change this file if you know what you are doing.
 
 import sys
 import json
+import io
+from contextlib import redirect_stdout
 
-# read the arguments
-serialized_inputs = sys.argv[1]
+# flag to run the script with a stream of input vectors (one json list per line) from stdin
+BATCH_MODE = "--batch"
 
-input_vals = json.loads(serialized_inputs)
+# read the arguments if the script is called with a single input vector
+if __name__ == "__main__" and sys.argv[1] != BATCH_MODE:
+    serialized_inputs = sys.argv[1]
+
+    input_vals = json.loads(serialized_inputs)
 
 trigger_id: str = None
 
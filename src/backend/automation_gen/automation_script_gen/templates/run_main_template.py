@@ -1,4 +1,4 @@
-if __name__ == "__main__":
+def run_automation(input_vals) -> None:
     if trigger_check(input_vals):
         if condition_evaluation(input_vals):
             action_execution(input_vals)
@@ -6,3 +6,25 @@ if __name__ == "__main__":
             print(json.dumps({"AutomationResult":"Condition not met"}))
     else:
         print(json.dumps({"AutomationResult":"No trigger detected"}))
+
+
+def run_batch() -> None:
+    # every input vector gets exactly one result line with its json encoded output
+    for serialized_inputs in sys.stdin:
+        if serialized_inputs.strip() == "":
+            continue
+        output = io.StringIO()
+        with redirect_stdout(output):
+            try:
+                run_automation(json.loads(serialized_inputs))
+            except Exception as e:
+                print(json.dumps({"ScriptError": f"{type(e).__name__}: {e}"}))
+        sys.stdout.write(json.dumps(output.getvalue()) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == BATCH_MODE:
+        run_batch()
+    else:
+        run_automation(input_vals)
\ No newline at end of file
@@ -18,7 +18,7 @@ from ...ha_automation_utils.home_assistant_const import (
 )
 from ...utils.env_helper import is_jinja_template
 from ...utils.env_helper_classes import Entity
-from .utils import append_script_context_to_script
+from .utils import ScriptBuilder, append_script_context_to_script, get_indentation
 
 IF_TEMPLATE = "if ("
 END_IF_TEMPLATE = "):\n"
@@ -216,7 +216,7 @@ def create_combination_trigger_script(
     entity_list: list,
     trigger_pos: int,
     trigger_id: str | None,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     source: str = "trigger",
 ) -> int:
@@ -228,7 +228,7 @@ def create_combination_trigger_script(
         entity_list (list): the list of entities of the trigger
         trigger_pos (int): the position of the trigger in the automation script based on former triggers
         trigger_id (str | None):  the id of the trigger is used to identify the trigger for later call backs of which trigger was triggered
-        filepath (str): the path to the automation script file
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): the indentation level of the trigger in the automation script. Defaults to 1.
         source (str, optional): the source of the entity in the automation script. Defaults to "trigger".
 
@@ -238,7 +238,8 @@ def create_combination_trigger_script(
     # set the combinator for the if statement
     combinator = CONF_OR
     script_context = ""
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
+    body_indentation = get_indentation(indentation_lvl + 1)
 
     # create the if statement for the trigger list
     if len(entity_list) > 1:
@@ -260,7 +261,7 @@ def create_combination_trigger_script(
             else:
                 # add the trigger expression to the script with the combinator
                 script_context += (
-                    f"{indentation}\t{combinator} (" + trigger_expression[0] + ")\n"
+                    f"{body_indentation}{combinator} (" + trigger_expression[0] + ")\n"
                 )
 
             # set the trigger_pos for the next trigger expression
@@ -295,12 +296,12 @@ def create_combination_trigger_script(
         # add the trigger_id to the script and the triggered flag
         if trigger_id is None:
             script_context += (
-                f"{indentation}\ttrigger_id = None\n{indentation}\ttriggered = True\n\n"
+                f"{body_indentation}trigger_id = None\n{body_indentation}triggered = True\n\n"
             )
         else:
-            script_context += f"{indentation}\ttrigger_id = '{trigger_id}' \n{indentation}\ttriggered = True\n\n"
+            script_context += f"{body_indentation}trigger_id = '{trigger_id}' \n{body_indentation}triggered = True\n\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return trigger_pos
 
@@ -310,7 +311,7 @@ def create_trigger_script(
     entity: Entity,
     trigger_pos: int,
     trigger_id: str | None,
-    filepath: str,
+    script: ScriptBuilder | str,
     indentation_lvl: int = 1,
     source: str = "trigger",
 ) -> int:
@@ -322,14 +323,15 @@ def create_trigger_script(
         entity (Entity): the main entity of the trigger
         trigger_pos (int): the position of the trigger in the automation script based on former triggers
         trigger_id (str | None):  the id of the trigger is used to identify the trigger for later call backs of which trigger was triggered
-        filepath (str): the path to the automation script file
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         indentation_lvl (int, optional): the indentation level of the trigger in the automation script. Defaults to 1.
         source (str, optional): the source of the entity in the automation script. Defaults to "trigger".
 
     Returns:
         int: the new trigger_pos for the next trigger entity (is the next trigger_pos in the automation script)
     """
-    indentation = "\t" * indentation_lvl
+    indentation = get_indentation(indentation_lvl)
+    body_indentation = get_indentation(indentation_lvl + 1)
 
     # create the trigger expression for the entity
     trigger_expression = _get_trigger_conditional_expression(
@@ -355,23 +357,25 @@ def create_trigger_script(
         # add the trigger_id to the script and the triggered flag
         if trigger_id is None:
             script_context += (
-                f"{indentation}\ttrigger_id = None\n{indentation}\ttriggered = True\n\n"
+                f"{body_indentation}trigger_id = None\n{body_indentation}triggered = True\n\n"
             )
         else:
-            script_context += f"{indentation}\ttrigger_id = '{trigger_id}' \n{indentation}\ttriggered = True\n\n"
+            script_context += f"{body_indentation}trigger_id = '{trigger_id}' \n{body_indentation}triggered = True\n\n"
 
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
 
     return trigger_pos + 1
 
 
-def close_trigger_section(filepath: str) -> None:
+def close_trigger_section(script: ScriptBuilder | str) -> None:
     """
     Close the trigger section in the automation script.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
-    script_context = "\t# The end of the trigger section\n\treturn triggered\n\n"
+    indentation = get_indentation(1)
+
+    script_context = f"{indentation}# The end of the trigger section\n{indentation}return triggered\n\n"
     
-    append_script_context_to_script(filepath, script_context)
+    append_script_context_to_script(script, script_context)
@@ -4,11 +4,309 @@ provides basic functions for the other specialized parts.
 
 """
 
-from os import listdir, path
+import sqlite3 as sqlite
+from os import listdir, path, remove, replace
 
 from ...utils.env_const import AUTOMATION_SCRIPT, TEMPLATE_PATH
 
 
+# the indentation of one level in the automation script
+INDENTATION = "\t"
+
+
+def get_indentation(indentation_lvl: int) -> str:
+    """
+    Get the indentation of a line in the automation script.
+
+    Args:
+        indentation_lvl (int): The indentation level of the line.
+
+    Returns:
+        str: The indentation for the indentation level.
+    """
+    return INDENTATION * indentation_lvl
+
+
+class ScriptBuilder:
+    """
+    Class to collect the generated parts of an automation script in memory
+    and to write the complete script to its file at once.
+    """
+
+    filepath: str = None
+    indentation_lvl: int = 0
+
+    def __init__(self, filepath: str, script_content: str = ""):
+        """
+        Create the script builder for an automation script.
+
+        Args:
+            filepath (str): The path to the automation script file.
+            script_content (str, optional): The first content of the script. Defaults to "".
+        """
+        self.filepath = filepath
+        self.indentation_lvl = 0
+        self._script_parts = [script_content]
+
+    def indent(self) -> int:
+        """
+        Open a new block in the automation script.
+
+        Returns:
+            int: The indentation level of the new block.
+        """
+        self.indentation_lvl += 1
+        return self.indentation_lvl
+
+    def dedent(self) -> int:
+        """
+        Close the current block in the automation script.
+
+        Raises:
+            ValueError: If no block is open.
+
+        Returns:
+            int: The indentation level after the block.
+        """
+        if self.indentation_lvl == 0:
+            raise ValueError("No block of the automation script is open")
+        self.indentation_lvl -= 1
+        return self.indentation_lvl
+
+    def get_indentation(self, extra_lvl: int = 0) -> str:
+        """
+        Get the indentation of the current block in the automation script.
+
+        Args:
+            extra_lvl (int, optional): The levels to indent beyond the current block. Defaults to 0.
+
+        Returns:
+            str: The indentation of the current block.
+        """
+        return get_indentation(self.indentation_lvl + extra_lvl)
+
+    def append(self, script_context: str) -> None:
+        """
+        Append the script context to the buffered automation script.
+
+        Args:
+            script_context (str): The script context to be appended.
+        """
+        self._script_parts.append(script_context)
+
+    def get_script_content(self) -> str:
+        """
+        Get the buffered content of the automation script.
+
+        Returns:
+            str: The content of the automation script.
+        """
+        return "".join(self._script_parts)
+
+    def write(self) -> None:
+        """
+        Write the buffered automation script to its file.
+        The script is written to a temporary file first, so the script file is never incomplete.
+        """
+        temp_filepath = self.filepath + ".tmp"
+        with open(temp_filepath, "w") as script:
+            script.write(self.get_script_content())
+        replace(temp_filepath, self.filepath)
+
+
+# name of the version index, which is stored next to the automation scripts of a directory
+SCRIPT_VERSION_INDEX = "script_versions.sqlite"
+
+CREATE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS script_version (
+        automation_name TEXT PRIMARY KEY,
+        latest_version INTEGER NOT NULL
+    )
+    """
+
+# the preprocessed templates by their file names, loaded once per process
+_template_cache: dict[str, str] = {}
+
+
+def load_template(template_name: str) -> str:
+    """
+    Load a template for the automation script with tabs as indentation.
+    Every template is read only once from the template directory and then taken from the cache.
+
+    Args:
+        template_name (str): The file name of the template in the template directory.
+
+    Raises:
+        FileNotFoundError: If the template file is not found.
+
+    Returns:
+        str: The content of the template.
+    """
+    script_content = _template_cache.get(template_name)
+    if script_content is not None:
+        return script_content
+
+    template_path = path.join(TEMPLATE_PATH, template_name)
+    try:
+        with open(template_path, "r") as file:
+            script_content = file.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template file {template_path} not found")
+
+    # ! tabs aren't taken into account and are converted to 4 spaces
+    script_content = script_content.replace("    ", "\t")
+
+    _template_cache[template_name] = script_content
+    return script_content
+
+
+def _scan_latest_version(automation_name: str, dir_path: str) -> int:
+    """
+    Find the latest version of the automation script by the file names in the directory.
+    This is only needed once per automation, if the version index does not contain the automation yet.
+
+    Args:
+        automation_name (str): The name of the automation script.
+        dir_path (str): The path to the directory of the automation scripts.
+
+    Returns:
+        int: The latest version of the automation script or 0 if there is none.
+    """
+    latest_version = 0
+    prefix = f"{automation_name}_V_"
+
+    for file in listdir(dir_path):
+        if file.startswith(prefix) and file.endswith(".py"):
+            file_version = file[len(prefix) : -len(".py")]
+            if file_version.isdigit() and int(file_version) > latest_version:
+                latest_version = int(file_version)
+
+    return latest_version
+
+
+def get_script_version(filepath: str) -> int:
+    """
+    Get the version of the automation script from its file name (<name>_V_<n>.py).
+
+    Args:
+        filepath (str): The path to the automation script file.
+
+    Returns:
+        int: The version of the automation script or None if the file name has no version.
+    """
+    file_name = path.splitext(path.basename(filepath))[0]
+    version = file_name.rsplit("_V_", 1)[-1]
+    if "_V_" not in file_name or not version.isdigit():
+        return None
+    return int(version)
+
+
+def _create_script_file(filepath: str, script_content: str) -> bool:
+    """
+    Create the automation script file only if it does not exist yet.
+
+    Args:
+        filepath (str): The path to the automation script file.
+        script_content (str): The first content of the script.
+
+    Returns:
+        bool: True if the file was created, False if it already exists.
+    """
+    try:
+        with open(filepath, "x") as script:
+            script.write(script_content)
+    except FileExistsError:
+        return False
+    return True
+
+
+def _allocate_script_file(automation_name: str, dir_path: str, script_content: str) -> str:
+    """
+    Allocate the next version of the automation script and create its file.
+
+    The latest version of every automation is stored in the version index of the directory,
+    so the directory does not have to be scanned for every new version. A new version always
+    follows the latest version of the index, so a removed version is never allocated again.
+    The index is locked while a version is allocated and the file is only created if it does
+    not exist, so importers in multiple processes never get the same version.
+
+    Args:
+        automation_name (str): The name of the automation script.
+        dir_path (str): The path to the directory of the automation scripts.
+        script_content (str): The first content of the script.
+
+    Returns:
+        str: The path to the created automation script file.
+    """
+    GET_LATEST_VERSION = "SELECT latest_version FROM script_version WHERE automation_name = ?"
+    SET_LATEST_VERSION = """
+        INSERT INTO script_version (automation_name, latest_version) VALUES (?, ?)
+        ON CONFLICT (automation_name) DO UPDATE SET latest_version = MAX(latest_version, excluded.latest_version)
+        """
+
+    con = sqlite.connect(path.join(dir_path, SCRIPT_VERSION_INDEX), timeout=30, isolation_level=None)
+    try:
+        cur = con.cursor()
+        cur.execute(CREATE_VERSION_TABLE)
+        cur.execute("BEGIN IMMEDIATE")
+
+        cur.execute(GET_LATEST_VERSION, (automation_name,))
+        result = cur.fetchone()
+        latest_version = result[0] if result is not None else _scan_latest_version(automation_name, dir_path)
+
+        # skip versions which were created without the index
+        version = latest_version + 1
+        filepath = path.join(dir_path, f"{automation_name}_V_{version}.py")
+        while not _create_script_file(filepath, script_content):
+            version += 1
+            filepath = path.join(dir_path, f"{automation_name}_V_{version}.py")
+
+        cur.execute(SET_LATEST_VERSION, (automation_name, version))
+        cur.execute("COMMIT")
+    except Exception:
+        if con.in_transaction:
+            con.rollback()
+        raise
+    finally:
+        con.close()
+
+    return filepath
+
+
+def _release_script_file(filepath: str) -> None:
+    """
+    Remove the file of an automation script which was never written and give its version back
+    to the version index, as long as no later version was allocated in the meantime.
+
+    Args:
+        filepath (str): The path to the automation script file.
+    """
+    RELEASE_LATEST_VERSION = """
+        UPDATE script_version SET latest_version = latest_version - 1
+        WHERE automation_name = ? AND latest_version = ?
+        """
+
+    dir_path, file_name = path.split(filepath)
+    automation_name = file_name.rsplit("_V_", 1)[0]
+    version = get_script_version(filepath)
+
+    con = sqlite.connect(path.join(dir_path, SCRIPT_VERSION_INDEX), timeout=30, isolation_level=None)
+    try:
+        cur = con.cursor()
+        cur.execute(CREATE_VERSION_TABLE)
+        cur.execute("BEGIN IMMEDIATE")
+        if path.exists(filepath):
+            remove(filepath)
+        cur.execute(RELEASE_LATEST_VERSION, (automation_name, version))
+        cur.execute("COMMIT")
+    except Exception:
+        if con.in_transaction:
+            con.rollback()
+        raise
+    finally:
+        con.close()
+
+
 def init_automation_script(automation_name: str, dir_path: str = None) -> str:
     """
     This function creates the automation script file in the automation_script directory
@@ -27,84 +325,90 @@ def init_automation_script(automation_name: str, dir_path: str = None) -> str:
     if automation_name is None:
         raise ValueError("The automation name must be provided")
     
-    file_name = automation_name + "_V_1.py"
-        
     if dir_path is None:
         dir_path = AUTOMATION_SCRIPT
-        filepath = path.join(dir_path, file_name)
-    else:
-        # for testing purposes
-        filepath = path.join(dir_path, file_name)
-    
-    # check if the file already exists
-    if path.exists(filepath):
-        latest_version = 0
-        
-        # itterate over all files in the directory look for the latest version of the automation
-        for file in listdir(dir_path):
-            if file.startswith(f"{automation_name}_"):
-                # get the version number 
-                file_version = int(file.split("_V_")[-1].split(".")[0])
-                # update the latest version
-                if file_version > latest_version:
-                    latest_version = file_version
-        
-        # increment the version number
-        file_name = f"{automation_name}_V_{latest_version + 1}.py"
-        filepath = path.join(dir_path, file_name)
-            
-
-    init_template = path.join(TEMPLATE_PATH, "init_template.py")
-    try:
-        with open(init_template, "r") as file:
-            script_content = file.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Template file {init_template} not found")
 
-    # ! tabs aren't taken into account and are converted to 4 spaces
-    script_content = script_content.replace("    ", "\t")
+    script_content = load_template("init_template.py")
 
-    with open(filepath, "w") as script:
-        script.write(script_content)
-    return filepath
+    return _allocate_script_file(automation_name, dir_path, script_content)
 
 
-def append_script_context_to_script(filepath: str, script_context: str) -> None:
+def create_script_builder(automation_name: str, dir_path: str = None) -> ScriptBuilder:
     """
-    Append the script context to the automation script file.
+    Create the script builder for a new automation script, which is generated in memory.
+    The file of the script is only reserved and the content is written by `close_script`.
 
     Args:
-        filepath (str): The path to the automation script file.
+        automation_name (str): The name of the automation script.
+        dir_path (str, optional): The path to the directory where the automation script should be created. Defaults to None.
+
+    Raises:
+        FileNotFoundError: If the template file is not found.
+
+    Returns:
+        ScriptBuilder: The script builder of the automation script.
+    """
+    if automation_name is None:
+        raise ValueError("The automation name must be provided")
+
+    if dir_path is None:
+        dir_path = AUTOMATION_SCRIPT
+
+    script_content = load_template("init_template.py")
+    filepath = _allocate_script_file(automation_name, dir_path, "")
+
+    return ScriptBuilder(filepath, script_content)
+
+
+def append_script_context_to_script(script: ScriptBuilder | str, script_context: str) -> None:
+    """
+    Append the script context to the script builder of the automation script
+    or directly to the automation script file.
+
+    Args:
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
         script_context (str): The script context to be appended to the automation script file.
 
     Raises:
         FileNotFoundError: If the automation script file is not found.
     """
+    if isinstance(script, ScriptBuilder):
+        script.append(script_context)
+        return
+
     try:
-        with open(filepath, "a") as script:
-            script.write(script_context)
+        with open(script, "a") as script_file:
+            script_file.write(script_context)
     except FileNotFoundError:
-        raise FileNotFoundError(f"File {filepath} not found")
+        raise FileNotFoundError(f"File {script} not found")
 
 
-def close_script(filepath: str) -> None:
+def close_script(script: ScriptBuilder | str) -> None:
     """
     Close the automation script.
+    The script of a script builder is written to its file afterwards.
 
     Args:
-        filepath (str): The path to the automation script file.
+        script (ScriptBuilder | str): The script builder or the path to the automation script file.
     """
 
-    main_function_template = path.join(TEMPLATE_PATH, "run_main_template.py")
-    try:
-        with open(main_function_template, "r") as file:
-            script_content = file.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Template file {main_function_template} not found")
-    # ! tabs aren't taken into account and are converted to 4 spaces
-    script_content = script_content.replace("    ", "\t")
+    script_content = load_template("run_main_template.py")
+
+    append_script_context_to_script(script, script_content)
+
+    if isinstance(script, ScriptBuilder):
+        script.write()
+
 
-    append_script_context_to_script(filepath, script_content)
+def discard_script(script_builder: ScriptBuilder) -> None:
+    """
+    Discard an automation script generated in memory without writing it to its file.
+    The reserved file of the script is removed and its version is released again.
+
+    Args:
+        script_builder (ScriptBuilder): The script builder of the automation script.
+    """
+    _release_script_file(script_builder.filepath)
 
 
 def create_locked_message(filepath: str) -> None:
@@ -0,0 +1,186 @@
+"""
+This module is responsible for the import of many automations at once.
+
+The automations are read from a directory with one automation per yaml file or from a yaml file with a
+list of automations (like the `automations.yaml` of Home Assistant). Parsing, validating and dissecting
+the automations is done in worker processes. The results are then written into the database in one
+transaction, in which every automation has its own savepoint, so a failing automation is reported
+without aborting the import of the others.
+"""
+
+from asyncio import run as async_run
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count, listdir, path, remove
+
+from backend import ha_automation_utils as ha_utils
+from backend.automation_gen.config_dissection import create_automation
+from backend.database import add_additional_info, add_automation, transaction
+from backend.database.db_connection import savepoint
+from backend.ha_automation_utils.home_assistant_yaml_loader import load_yaml
+
+# file extensions of the automation files
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+def collect_import_tasks(source_path: str) -> list:
+    """
+    Collect the automations of the directory or the yaml file
+
+    The files of a directory are only parsed in the worker processes. A single yaml file
+    is parsed here, so that the automations of its list can be dissected in parallel.
+
+    Args:
+        source_path (str): the path to a directory with automation files or to a yaml file
+
+    Returns:
+        list: the import tasks as tuples (source, file_path, automation_yaml), where automation_yaml is None
+        if the file still has to be parsed
+    """
+    if path.isdir(source_path):
+        return [
+            (path.join(source_path, file), path.join(source_path, file), None)
+            for file in sorted(listdir(source_path))
+            if file.endswith(YAML_EXTENSIONS)
+        ]
+
+    loaded_yaml = load_yaml(source_path)
+
+    if isinstance(loaded_yaml, list):
+        return [
+            (f"{source_path}[{index}]", source_path, automation_yaml)
+            for index, automation_yaml in enumerate(loaded_yaml)
+        ]
+
+    return [(source_path, source_path, loaded_yaml)]
+
+
+def _dissect_automation(task: tuple) -> dict:
+    """
+    Parse, validate and dissect one automation in a worker process
+
+    Args:
+        task (tuple): the import task (source, file_path, automation_yaml)
+
+    Returns:
+        dict: the result with the keys "source", "automation_data" and "error"
+    """
+    source, file_path, automation_yaml = task
+    result = {"source": source, "automation_data": None, "error": None}
+
+    try:
+        if automation_yaml is None:
+            automation_yaml = ha_utils.load_yaml_dict(file_path)
+
+        if not isinstance(automation_yaml, dict) or automation_yaml == {}:
+            result["error"] = "The automation configuration is empty or not a dictionary"
+            return result
+
+        automation_config = async_run(ha_utils.async_validate_config_item(automation_yaml, False))
+        if automation_config.validation_status not in ["ok", "unknown_template"]:
+            result["error"] = (
+                f"{automation_config.validation_status}: {automation_config.validation_error}"
+            )
+            return result
+
+        result["automation_data"] = create_automation(automation_config)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def _remove_script(script_path: str) -> None:
+    """
+    Remove the automation script of an automation which is not imported
+
+    Args:
+        script_path (str): the path to the automation script
+    """
+    if path.exists(script_path):
+        remove(script_path)
+
+
+def _insert_automation(automation_data: dict, project: str) -> tuple:
+    """
+    Insert the automation with its project and version into the database
+
+    Args:
+        automation_data (dict): the automation data created by `create_automation`
+        project (str): the project of the automation
+
+    Returns:
+        tuple: the id and the version of the new automation
+    """
+    a_id, version = add_automation(automation_data)
+    add_additional_info(
+        a_id,
+        [
+            {"info_type": "project", "info_content": project},
+            {"info_type": "version", "info_content": str(version)},
+        ],
+    )
+    return a_id, version
+
+
+def import_automations(
+    source_path: str, project: str = "uncategorized", max_workers: int = None
+) -> list:
+    """
+    Import all automations of the directory or the yaml file into the database
+
+    Args:
+        source_path (str): the path to a directory with automation files or to a yaml file
+        project (str, optional): the project of the imported automations. Defaults to "uncategorized".
+        max_workers (int, optional): the number of worker processes, 1 runs the import in the current process.
+        Defaults to the cpu count.
+
+    Returns:
+        list: the results of the automations as dictionaries with the keys "source", "automation_name",
+        "a_id", "version" and "error" (None if the automation was imported)
+    """
+    tasks = collect_import_tasks(source_path)
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+
+    if max_workers == 1 or len(tasks) <= 1:
+        dissected_automations = [_dissect_automation(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            dissected_automations = list(executor.map(_dissect_automation, tasks))
+
+    results = [
+        {
+            "source": dissected_automation["source"],
+            "automation_name": None,
+            "a_id": None,
+            "version": None,
+            "error": dissected_automation["error"],
+        }
+        for dissected_automation in dissected_automations
+    ]
+
+    imported = [
+        (dissected_automation["automation_data"], result)
+        for dissected_automation, result in zip(dissected_automations, results)
+        if dissected_automation["automation_data"] is not None
+    ]
+
+    try:
+        with transaction():
+            for automation_data, result in imported:
+                result["automation_name"] = automation_data["infos"].a_name
+                try:
+                    with savepoint():
+                        result["a_id"], result["version"] = _insert_automation(automation_data, project)
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"
+                    # the script of an automation which is not in the database is not needed
+                    _remove_script(automation_data["infos"].script)
+    except BaseException:
+        # none of the automations is in the database after the rollback
+        for automation_data, _ in imported:
+            _remove_script(automation_data["infos"].script)
+        raise
+
+    return results
@@ -58,7 +58,7 @@ def _condition_entities(
     condition_part: dict,
     position: int,
     real_position: int,
-    script_path: str,
+    script: asg.ScriptBuilder | str,
     parent: int = None,
     indentation_level: int = 2,
     first_element: bool = True,
@@ -71,7 +71,7 @@ def _condition_entities(
         condition_part (dict): The condition list element
         position (int): The position of the entity in the list
         real_position (int):  The real position of the entity for the input value into the script
-        script_path (str): The path to the script file
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
         parent (int): The parent entity of the entity
 
     Returns:
@@ -109,7 +109,7 @@ def _condition_entities(
         if CONF_CONDITIONS in condition_part:
             indentation_level = asg.start_logic_function_block(
                 condition_type=condition,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
             )
@@ -127,7 +127,7 @@ def _condition_entities(
                     condition_part=sub_condition,
                     position=position,
                     parent=new_parent,
-                    script_path=script_path,
+                    script=script,
                     real_position=real_position,
                     indentation_level=indentation_level,
                     first_element=first_element,
@@ -140,7 +140,7 @@ def _condition_entities(
                 position = result_list[1]
                 real_position = result_list[2]
             asg.close_logic_function_block(
-                filepath=script_path, indentation_lvl=(indentation_level - 1)
+                script=script, indentation_lvl=(indentation_level - 1)
             )
 
     # processes a numeric state condition
@@ -283,7 +283,7 @@ def _condition_entities(
                 CONF_NUMERIC_STATE,
                 new_entity_list,
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -295,7 +295,7 @@ def _condition_entities(
                 CONF_NUMERIC_STATE,
                 new_entity_list[0],
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -398,7 +398,7 @@ def _condition_entities(
                 CONF_STATE,
                 new_entity_list,
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -430,7 +430,7 @@ def _condition_entities(
                 CONF_STATE,
                 entity,
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -472,7 +472,7 @@ def _condition_entities(
             CONF_DEVICE,
             entity,
             real_position,
-            script_path,
+            script,
             indentation_lvl=indentation_level,
             first_element=first_element,
             source=source,
@@ -504,7 +504,7 @@ def _condition_entities(
             "sun",
             entity,
             real_position,
-            script_path,
+            script,
             indentation_lvl=indentation_level,
             first_element=first_element,
             source=source,
@@ -553,7 +553,7 @@ def _condition_entities(
                     CONF_TEMPLATE,
                     new_entity_list,
                     real_position,
-                    script_path,
+                    script,
                     indentation_lvl=indentation_level,
                     first_element=first_element,
                     source=source,
@@ -581,7 +581,7 @@ def _condition_entities(
                     CONF_TEMPLATE,
                     entity,
                     real_position,
-                    script_path,
+                    script,
                     indentation_lvl=indentation_level,
                     first_element=first_element,
                     source=source,
@@ -615,7 +615,7 @@ def _condition_entities(
             CONF_TIME,
             entity,
             real_position,
-            script_path,
+            script,
             indentation_lvl=indentation_level,
             first_element=first_element,
             source=source,
@@ -649,7 +649,7 @@ def _condition_entities(
                 CONF_TRIGGER,
                 new_trigger_entity_list,
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -678,7 +678,7 @@ def _condition_entities(
                 CONF_TRIGGER,
                 entity,
                 real_position,
-                script_path,
+                script,
                 indentation_lvl=indentation_level,
                 first_element=first_element,
                 source=source,
@@ -727,7 +727,7 @@ def _condition_entities(
                     CONF_ZONE,
                     new_exp_entity_list,
                     real_position,
-                    script_path,
+                    script,
                     indentation_lvl=indentation_level,
                     first_element=first_element,
                     source=source,
@@ -761,7 +761,7 @@ def _condition_entities(
                     CONF_ZONE,
                     entity,
                     real_position,
-                    script_path,
+                    script,
                     indentation_lvl=indentation_level,
                     first_element=first_element,
                     source=source,
@@ -814,18 +814,19 @@ def _condition_entities(
 
 
 def extract_all_conditions(
-    automation_config: AutomationConfig, script_path: str
+    automation_config: AutomationConfig, script: asg.ScriptBuilder | str
 ) -> list:
     """
     Extract the condition from the data.
 
     Args:
         automation_config (AutomationConfig): The automation configuration data.
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
 
     Returns:
         list: A list of condition entities extracted from the data.
     """
-    asg.init_condition_part(script_path)
+    asg.init_condition_part(script)
     condition_entities = []
     if CONF_CONDITION in automation_config:
         conditions = automation_config[CONF_CONDITION]
@@ -842,7 +843,7 @@ def extract_all_conditions(
             first_element = True
 
         return_list = _condition_entities(
-            condition, position, real_position, script_path, first_element=first_element
+            condition, position, real_position, script, first_element=first_element
         )
         condition_entities += return_list[0]
         position = return_list[1] + 1
@@ -858,5 +859,5 @@ def extract_all_conditions(
 
     if num_condition_entities != real_position:
         raise vol.Invalid("The amount of entities and the real position do not match")
-    asg.close_condition_section(script_path)
+    asg.close_condition_section(script)
     return condition_entities
@@ -14,23 +14,23 @@ from .trigger_dissection import extract_all_trigger
 
 
 def create_procedure_list(
-    automation_config: AutomationConfig, script_path: str
+    automation_config: AutomationConfig, script: asg.ScriptBuilder | str
 ) -> list:
     """
     Create a list of entities from the automation configuration and adds them to the automation script.
 
     Args:
         automation_config (AutomationConfig): The automation configuration.
-        script_path (str): The path to the automation script.
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
 
     Returns:
         list: A list of entities.
     """
 
     entity_list = []
-    entity_list += extract_all_trigger(automation_config, script_path)
-    entity_list += extract_all_conditions(automation_config, script_path)
-    entity_list += extract_all_actions(automation_config, script_path)
+    entity_list += extract_all_trigger(automation_config, script)
+    entity_list += extract_all_conditions(automation_config, script)
+    entity_list += extract_all_actions(automation_config, script)
     return entity_list
 
 
@@ -51,7 +51,8 @@ def create_automation(automation_config: AutomationConfig, automation_name: str=
 
     if automation_name is None:
         automation_name = automation_config.automation_name
-    automation_script = asg.init_automation_script(automation_name)
+    # the script is generated in memory and only written when it is complete
+    script_builder = asg.create_script_builder(automation_name)
 
     if CONF_MODE in automation_config:
         mode_str = automation_config[CONF_MODE]
@@ -78,14 +79,20 @@ def create_automation(automation_config: AutomationConfig, automation_name: str=
 
     automation = Automation(
         automation_name=automation_name,
-        automation_script=automation_script,
+        automation_script=script_builder.filepath,
         automation_mode=mode,
         max_instances=max_instances,
+        version=asg.get_script_version(script_builder.filepath),
     )
 
-    automation_data["entities"] = create_procedure_list(
-        automation_config, automation_script
-    )
+    try:
+        automation_data["entities"] = create_procedure_list(
+            automation_config, script_builder
+        )
+    except Exception:
+        # no incomplete script is left if the dissection fails
+        asg.discard_script(script_builder)
+        raise
     automation_data["infos"] = automation
 
     return automation_data
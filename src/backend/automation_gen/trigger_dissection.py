@@ -76,7 +76,7 @@ def _trigger_entities(
     trigger_part: dict,
     position: int,
     real_position: int,
-    script_path: str,
+    script: asg.ScriptBuilder | str,
     parent: int = None,
     indentation_level: int = 1,
     source: str = "trigger",
@@ -87,7 +87,7 @@ def _trigger_entities(
         trigger_part (dict): The trigger list element
         position (int): The position of the entity in the list
         real_position (int): The real position of the entity for the input value into the script
-        script_path (str): The path to the script
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
         parent (int): The parent entity of the entity
         indentation_level (int): The indentation level of the entity in the script
         source (str): The source of the entity
@@ -157,7 +157,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -180,7 +180,7 @@ def _trigger_entities(
                 entity=entity,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -203,7 +203,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -238,7 +238,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -385,7 +385,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -396,7 +396,7 @@ def _trigger_entities(
                 entity=new_entity_list[0],
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -516,7 +516,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -547,7 +547,7 @@ def _trigger_entities(
                 entity=entity,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -585,7 +585,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -629,7 +629,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -649,7 +649,7 @@ def _trigger_entities(
                 entity=entity,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -698,7 +698,7 @@ def _trigger_entities(
                     entity_list=new_entity_list,
                     trigger_pos=real_position,
                     trigger_id=trigger_id,
-                    filepath=script_path,
+                    script=script,
                     indentation_lvl=indentation_level,
                     source=source,
                 )
@@ -730,7 +730,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -750,7 +750,7 @@ def _trigger_entities(
                 entity=entity,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -785,7 +785,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -815,7 +815,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -841,7 +841,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -866,7 +866,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -891,7 +891,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -917,7 +917,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -943,7 +943,7 @@ def _trigger_entities(
             entity=entity,
             trigger_pos=real_position,
             trigger_id=trigger_id,
-            filepath=script_path,
+            script=script,
             indentation_lvl=indentation_level,
             source=source,
         )
@@ -974,7 +974,7 @@ def _trigger_entities(
                 entity_list=new_entity_list,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -995,7 +995,7 @@ def _trigger_entities(
                 entity=entity,
                 trigger_pos=real_position,
                 trigger_id=trigger_id,
-                filepath=script_path,
+                script=script,
                 indentation_lvl=indentation_level,
                 source=source,
             )
@@ -1004,12 +1004,13 @@ def _trigger_entities(
     return [entity_list, position, real_position]
 
 
-def extract_all_trigger(automation_config: AutomationConfig, script_path: str) -> list:
+def extract_all_trigger(automation_config: AutomationConfig, script: asg.ScriptBuilder | str) -> list:
     """
     Extracts the trigger from the data.
 
     Args:
         automation_config (AutomationConfig): The automation configuration data.
+        script (ScriptBuilder | str): The script builder or the path to the automation script.
 
     Returns:
         list: A list of trigger entities extracted from the data.
@@ -1019,11 +1020,11 @@ def extract_all_trigger(automation_config: AutomationConfig, script_path: str) -
     position = 0
     real_position = 0
     for trigger in triggers:
-        return_list = _trigger_entities(trigger, position, real_position, script_path)
+        return_list = _trigger_entities(trigger, position, real_position, script)
         trigger_entities += return_list[0]
         position = return_list[1] + 1
         real_position = return_list[2]
     if len(trigger_entities) != real_position:
         raise vol.Invalid("The amount of entities and the real position do not match")
-    asg.close_trigger_section(script_path)
+    asg.close_trigger_section(script)
     return trigger_entities
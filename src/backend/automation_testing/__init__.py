@@ -2,4 +2,9 @@
 
 # This is the initialization file for the automation_testing package.
 # The automation_testing package contains the test_execution module for running the automation tests.
-
+# The test cases can be run on a pool of warm workers (worker_pool.py) which are started as automation_worker.py processes.
+# Generated automation scripts can also be imported and run without a subprocess (in_process_execution.py).
+# Large test case collections can be split into chunks and run on all cores (parallel_execution.py).
+# The runners can take the results of unchanged scripts and input vectors from a result cache (execution_cache.py).
+# Test cases can be reduced to a covering array of all t-way value combinations (covering_array.py).
+# The test values can be reduced to the equivalence classes of the generated script branches (branch_coverage.py).
@@ -0,0 +1,83 @@
+"""
+This script is the long-lived worker process of the automation worker pool.
+
+It is started with the path of a generated automation script, compiles the script once
+and then evaluates one serialized input vector per line from stdin. For every input vector
+the output of the automation script is written as one JSON encoded line to stdout.
+
+The script only uses the standard library, so it can be started as a plain python file
+without the backend package being importable in the worker process.
+"""
+
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+
+
+def load_automation_script(script_path: str):
+    """
+    Read and compile the generated automation script
+
+    Args:
+        script_path (str): the path to the automation script
+
+    Returns:
+        code: the compiled automation script
+    """
+    with open(script_path, "r") as script:
+        script_content = script.read()
+
+    return compile(script_content, script_path, "exec")
+
+
+def evaluate_input_vector(compiled_script, script_path: str, serialized_inputs: str) -> str:
+    """
+    Run the compiled automation script for one input vector like a fresh interpreter would do
+
+    Args:
+        compiled_script (code): the compiled automation script
+        script_path (str): the path to the automation script
+        serialized_inputs (str): the input vector as json string
+
+    Returns:
+        str: the output the automation script printed for the input vector
+    """
+    output = io.StringIO()
+
+    # every run gets its own namespace, so global values like the trigger_id are not shared
+    namespace = {"__name__": "__main__", "__file__": script_path}
+    sys.argv = [script_path, serialized_inputs]
+
+    with redirect_stdout(output):
+        try:
+            exec(compiled_script, namespace)
+        except Exception as e:
+            print(json.dumps({"ScriptError": f"{type(e).__name__}: {e}"}))
+
+    return output.getvalue()
+
+
+def run_worker(script_path: str) -> None:
+    """
+    Evaluate the input vectors from stdin until the input stream is closed
+
+    Args:
+        script_path (str): the path to the automation script
+    """
+    compiled_script = load_automation_script(script_path)
+
+    for line in sys.stdin:
+        serialized_inputs = line.strip()
+        if serialized_inputs == "":
+            continue
+
+        result = evaluate_input_vector(compiled_script, script_path, serialized_inputs)
+
+        # the output is encoded as json string to keep exactly one line per input vector
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    run_worker(sys.argv[1])
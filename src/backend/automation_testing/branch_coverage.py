@@ -0,0 +1,540 @@
+"""
+This module contains the branch coverage guided reduction of the test cases.
+
+The generated automation scripts compare every input position with the expected values of the automation,
+for example `trigger[0] == "on"` or `20 < condition[1] < 30`. Test values of a position which give the
+same result in all of these comparisons are equivalent, so only one representative value of every
+equivalence class is kept (plus the values next to the limits of `above` and `below`). From the
+remaining values the test cases are chosen so that every branch of `trigger_check`,
+`condition_evaluation` and `action_execution` is taken in both directions if the values allow it.
+
+The functions are only reached like in `run_automation`: the condition is evaluated if the trigger fired
+and the actions are executed if the condition passed as well. The branches of `run_automation` itself are
+covered too, so the test cases contain runs stopping at the trigger, at the condition and reaching the actions.
+"""
+
+import ast
+import io
+from contextlib import redirect_stdout
+from itertools import islice, product
+
+from backend.utils.env_const import ACTION_INPUT, INPUT, START
+from backend.utils.env_helper import is_float_or_int
+
+from .in_process_execution import load_automation_module
+
+# the input lists of the generated scripts by the parameter role of their entities
+INPUT_LISTS = {"trigger": START, "condition": INPUT, "action_inputs": ACTION_INPUT}
+
+# the functions of the generated scripts whose branches are covered
+BRANCH_FUNCTIONS = ("trigger_check", "condition_evaluation", "action_execution")
+
+# the function of the generated scripts calling the branch functions
+RUN_FUNCTION = "run_automation"
+
+# maximum number of value combinations evaluated for a single branch
+MAX_BRANCH_COMBINATIONS = 10000
+
+
+def _get_input_position(node: ast.AST) -> tuple | None:
+    """
+    Get the input position of a subscript like `trigger[0]`
+
+    Args:
+        node (ast.AST): the node of the script
+
+    Returns:
+        tuple | None: the input position as tuple (parameter role, index) or None for other nodes
+    """
+    if (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Name)
+        and node.value.id in INPUT_LISTS
+        and isinstance(node.slice, ast.Constant)
+        and isinstance(node.slice.value, int)
+    ):
+        return (INPUT_LISTS[node.value.id], node.slice.value)
+
+    return None
+
+
+def _get_constant(node: ast.AST):
+    """
+    Get the value of a constant node of the script
+
+    Args:
+        node (ast.AST): the node of the script
+
+    Returns:
+        the value of the constant or the node itself if it is not a constant
+    """
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError):
+        return node
+
+
+def _add_comparisons(test: ast.expr, equivalences: dict) -> list:
+    """
+    Add the comparisons of the input positions in the branch test to their equivalences
+
+    Args:
+        test (ast.expr): the test of the branch
+        equivalences (dict): the equivalences of the input positions, updated in place
+
+    Returns:
+        list: the input positions used by the test
+    """
+    compared_nodes = set()
+    for node in ast.walk(test):
+        if not isinstance(node, ast.Compare):
+            continue
+
+        operands = [node.left] + node.comparators
+        for left, operator, right in zip(operands, node.ops, operands[1:]):
+            for own, other, own_is_left in ((left, right, True), (right, left, False)):
+                position = _get_input_position(own)
+                if position is None:
+                    continue
+
+                compared_nodes.add(id(own))
+                equivalence = equivalences.setdefault(position, _create_equivalence())
+                value = _get_constant(other)
+
+                if isinstance(value, ast.AST):
+                    # compared with another input or an expression, so every value can make a difference
+                    equivalence["opaque"] = True
+                elif isinstance(operator, (ast.Eq, ast.NotEq)):
+                    equivalence["values"].append(value)
+                elif isinstance(operator, (ast.In, ast.NotIn)) and own_is_left and isinstance(value, (list, tuple)):
+                    equivalence["values"].extend(value)
+                elif isinstance(operator, (ast.Lt, ast.LtE, ast.Gt, ast.GtE)) and isinstance(value, (int, float)):
+                    equivalence["limits"].add(value)
+                elif not isinstance(operator, (ast.Is, ast.IsNot)):
+                    equivalence["opaque"] = True
+
+    positions = set()
+    for node in ast.walk(test):
+        position = _get_input_position(node)
+        if position is not None:
+            positions.add(position)
+            # inputs which are not compared are tested for their truth value
+            if id(node) not in compared_nodes:
+                equivalences.setdefault(position, _create_equivalence())["truth"] = True
+
+    return sorted(positions)
+
+
+def _create_equivalence() -> dict:
+    """
+    Create the empty equivalence of an input position
+
+    Returns:
+        dict: the equivalence with the compared "values", the numeric "limits", if the "truth" value is
+        tested and if the position is "opaque" (compared in a way, which does not allow a reduction)
+    """
+    return {"values": [], "limits": set(), "truth": False, "opaque": False}
+
+
+def _add_branches(statements: list, function: str, requirements: list, branches: list, equivalences: dict) -> None:
+    """
+    Add the branches of the statements and their nested statements
+
+    Args:
+        statements (list): the statements of the function or of a block in the function
+        function (str): the name of the function
+        requirements (list): the outcomes of the enclosing branches as tuples (branch index, outcome),
+        which are needed to reach the statements
+        branches (list): the branches of the script, updated in place
+        equivalences (dict): the equivalences of the input positions, updated in place
+    """
+    for statement in statements:
+        if isinstance(statement, ast.If):
+            branch_index = len(branches)
+            branches.append(
+                {
+                    "function": function,
+                    "line": statement.lineno,
+                    "code": compile(ast.Expression(statement.test), "<branch>", "eval"),
+                    "positions": _add_comparisons(statement.test, equivalences),
+                    "requirements": requirements,
+                }
+            )
+            _add_branches(statement.body, function, requirements + [(branch_index, "True")], branches, equivalences)
+            _add_branches(statement.orelse, function, requirements + [(branch_index, "False")], branches, equivalences)
+        else:
+            for block in ("body", "orelse", "finalbody"):
+                _add_branches(getattr(statement, block, []), function, requirements, branches, equivalences)
+
+
+def _get_function_positions(function: ast.FunctionDef) -> list:
+    """
+    Get the input positions used by the function of the script
+
+    Args:
+        function (ast.FunctionDef): the function of the script
+
+    Returns:
+        list: the input positions (parameter role, index) used in the function
+    """
+    positions = set()
+    for node in ast.walk(function):
+        position = _get_input_position(node)
+        if position is not None:
+            positions.add(position)
+
+    return sorted(positions)
+
+
+def _add_called_functions(
+    node: ast.AST, requirements: list, functions: dict, branches: list, equivalences: dict
+) -> list:
+    """
+    Add the branches of the branch functions called in the node of `run_automation`
+
+    Args:
+        node (ast.AST): the statement or the branch test of `run_automation`
+        requirements (list): the outcomes of the enclosing branches as tuples (branch index, outcome),
+        which are needed to reach the call
+        functions (dict): the branch functions of the script by their names, the added functions are removed
+        branches (list): the branches of the script, updated in place
+        equivalences (dict): the equivalences of the input positions, updated in place
+
+    Returns:
+        list: the input positions used by the called functions
+    """
+    positions = set()
+    for call in ast.walk(node):
+        if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id in functions:
+            function = functions.pop(call.func.id)
+            _add_branches(function.body, function.name, requirements, branches, equivalences)
+            positions.update(_get_function_positions(function))
+
+    return sorted(positions)
+
+
+def _add_run_branches(
+    statements: list, requirements: list, functions: dict, branches: list, equivalences: dict
+) -> None:
+    """
+    Add the branches of `run_automation` and of the branch functions it calls
+
+    The branches of a called function require the outcomes of the branches of `run_automation`
+    enclosing the call, for example the branches of `action_execution` are only reached
+    if `trigger_check` and `condition_evaluation` returned True.
+
+    Args:
+        statements (list): the statements of `run_automation` or of a block in it
+        requirements (list): the outcomes of the enclosing branches as tuples (branch index, outcome)
+        functions (dict): the branch functions of the script by their names, the added functions are removed
+        branches (list): the branches of the script, updated in place
+        equivalences (dict): the equivalences of the input positions, updated in place
+    """
+    for statement in statements:
+        if isinstance(statement, ast.If):
+            # the functions called in the test are run before the outcome of the branch is known
+            positions = _add_called_functions(statement.test, requirements, functions, branches, equivalences)
+
+            branch_index = len(branches)
+            branches.append(
+                {
+                    "function": RUN_FUNCTION,
+                    "line": statement.lineno,
+                    "code": compile(ast.Expression(statement.test), "<branch>", "eval"),
+                    "positions": positions,
+                    "requirements": requirements,
+                }
+            )
+            _add_run_branches(
+                statement.body, requirements + [(branch_index, "True")], functions, branches, equivalences
+            )
+            _add_run_branches(
+                statement.orelse, requirements + [(branch_index, "False")], functions, branches, equivalences
+            )
+        else:
+            _add_called_functions(statement, requirements, functions, branches, equivalences)
+
+
+def get_script_branches(script_path: str) -> tuple:
+    """
+    Get the branches of the generated automation script and the equivalences of its input positions
+
+    The branches of the functions called by `run_automation` require the outcomes of its branches
+    enclosing the call. Functions which are not called by `run_automation` are added without requirements.
+
+    Args:
+        script_path (str): the path to the generated automation script
+
+    Returns:
+        tuple: the branches as dictionaries with the keys "function", "line", "code", "positions" and
+        "requirements" (the outcomes of the enclosing branches) and the equivalences of the input positions
+        by their position (parameter role, index)
+    """
+    with open(script_path) as script:
+        script_tree = ast.parse(script.read(), filename=script_path)
+
+    functions = {
+        function.name: function
+        for function in script_tree.body
+        if isinstance(function, ast.FunctionDef) and function.name in BRANCH_FUNCTIONS + (RUN_FUNCTION,)
+    }
+    run_function = functions.pop(RUN_FUNCTION, None)
+
+    branches = []
+    equivalences = {}
+    if run_function is not None:
+        _add_run_branches(run_function.body, [], functions, branches, equivalences)
+
+    for name in BRANCH_FUNCTIONS:
+        if name in functions:
+            _add_branches(functions[name].body, name, [], branches, equivalences)
+
+    return branches, equivalences
+
+
+def _get_script_value(value):
+    """
+    Get the test value as it is stored in the database and passed to the script
+
+    Args:
+        value: the test value
+
+    Returns:
+        the value as an integer or a float if it is a number, otherwise the value itself
+    """
+    try:
+        return is_float_or_int(value)
+    except TypeError:
+        return value
+
+
+def _get_value_class(value, equivalence: dict) -> tuple:
+    """
+    Get the equivalence class of a test value, values of the same class take the same branches
+
+    Args:
+        value: the test value as it is passed to the script
+        equivalence (dict): the equivalence of the input position
+
+    Returns:
+        tuple: the key of the equivalence class
+    """
+    if equivalence["opaque"]:
+        return ("value", repr(value))
+
+    if value is None:
+        return ("none",)
+
+    compared = tuple(value == compared_value for compared_value in equivalence["values"])
+    truth = bool(value) if equivalence["truth"] else None
+
+    if equivalence["limits"] == set():
+        limits = None
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        limits = tuple((value > limit) - (value < limit) for limit in sorted(equivalence["limits"]))
+    else:
+        # comparisons of other types with the limits fail
+        limits = "not comparable"
+
+    return ("value", compared, truth, limits)
+
+
+def reduce_test_values(test_values: list, equivalence: dict) -> list:
+    """
+    Reduce the test values of an input position to one representative of every equivalence class
+
+    The values compared with the position in the script are added, so the branches depending on them
+    can be taken. For every limit of a numeric comparison the closest values below and above are kept.
+
+    Args:
+        test_values (list): the test values of the input position
+        equivalence (dict): the equivalence of the input position
+
+    Returns:
+        list: the representative test values in the order of their first occurrence
+    """
+    candidates = []
+    for value in list(test_values) + equivalence["values"]:
+        if value not in candidates:
+            candidates.append(value)
+
+    numeric_values = [
+        (number, value)
+        for value in candidates
+        if isinstance(number := _get_script_value(value), (int, float)) and not isinstance(number, bool)
+    ]
+
+    kept_values = []
+    for limit in sorted(equivalence["limits"]):
+        below = [item for item in numeric_values if item[0] < limit]
+        above = [item for item in numeric_values if item[0] > limit]
+        boundaries = ([max(below, key=lambda item: item[0])] if below else []) + (
+            [min(above, key=lambda item: item[0])] if above else []
+        )
+        for _, value in boundaries:
+            if value not in kept_values:
+                kept_values.append(value)
+
+    # the boundary values are already representatives of their equivalence classes
+    representatives = {}
+    for value in kept_values + candidates:
+        representatives.setdefault(_get_value_class(_get_script_value(value), equivalence), value)
+
+    for value in representatives.values():
+        if value not in kept_values:
+            kept_values.append(value)
+
+    return [value for value in candidates if value in kept_values]
+
+
+def _evaluate_branch(branch: dict, input_vals: list, script_globals: dict) -> str:
+    """
+    Evaluate the test of the branch for the input values
+
+    Args:
+        branch (dict): the branch of the script
+        input_vals (list): the trigger, condition and action inputs
+        script_globals (dict): the global namespace of the script with its functions
+
+    Returns:
+        str: the outcome of the branch ("True", "False" or the name of the raised exception)
+    """
+    namespace = {name: input_vals[role] for name, role in INPUT_LISTS.items()}
+    namespace["input_vals"] = input_vals
+    try:
+        # the called functions of the script may print their results
+        with redirect_stdout(io.StringIO()):
+            return str(bool(eval(branch["code"], script_globals, namespace)))
+    except Exception as e:
+        return type(e).__name__
+
+
+def _get_outcome(branch_index: int, input_vals: list, branches: list, script_globals: dict) -> str | None:
+    """
+    Get the outcome of the branch for the input values if they reach the branch
+
+    Args:
+        branch_index (int): the index of the branch
+        input_vals (list): the trigger, condition and action inputs
+        branches (list): the branches of the script
+        script_globals (dict): the global namespace of the script with its functions
+
+    Returns:
+        str | None: the outcome of the branch or None if the required outcomes of the enclosing
+        branches are not reached
+    """
+    # every run starts without a detected trigger like a fresh run of the script
+    if "trigger_id" in script_globals:
+        script_globals["trigger_id"] = None
+
+    # the requirements are checked in the order of the run, so the trigger is checked before the condition
+    branch = branches[branch_index]
+    for required_index, required_outcome in branch["requirements"]:
+        if _evaluate_branch(branches[required_index], input_vals, script_globals) != required_outcome:
+            return None
+
+    return _evaluate_branch(branch, input_vals, script_globals)
+
+
+def _create_input_vals(assignment: dict, positions: list, defaults: list) -> list:
+    """
+    Create the input values of the script for the assigned values of the input positions
+
+    Args:
+        assignment (dict): the assigned values by the index of the input position
+        positions (list): the input positions (parameter role, index) of the test values
+        defaults (list): the default value of every input position
+
+    Returns:
+        list: the trigger, condition and action inputs
+    """
+    input_vals = [[], [], []]
+    for index, (role, _) in enumerate(positions):
+        input_vals[role].append(_get_script_value(assignment.get(index, defaults[index])))
+
+    return input_vals
+
+
+def create_branch_covering_combinations(test_value_lists: list, positions: list, script_path: str) -> list:
+    """
+    Create the combinations of the test values which cover all branches of the generated script
+
+    Every branch outcome found for the representative values is reached by one of the combinations,
+    including the requirements of the enclosing branches. The outcomes are evaluated with the functions
+    of the script, so the script is imported as a module.
+
+    Args:
+        test_value_lists (list): the test values of every input position
+        positions (list): the input position (parameter role, index) of every test value list
+        script_path (str): the path to the generated automation script
+
+    Returns:
+        list: the combinations of the representative test values
+    """
+    branches, equivalences = get_script_branches(script_path)
+    script_globals = vars(load_automation_module(script_path))
+
+    reduced_values = [
+        reduce_test_values(test_values, equivalences.get(position, _create_equivalence()))
+        for test_values, position in zip(test_value_lists, positions)
+    ]
+    if any(values == [] for values in reduced_values):
+        return []
+
+    defaults = [values[0] for values in reduced_values]
+    indices = {position: index for index, position in enumerate(positions)}
+
+    # the partial assignments of the input positions, which are completed with the default values,
+    # with the branch outcomes they have to reach
+    assignments = []
+
+    def _reaches_targets(values: dict, targets: list) -> bool:
+        input_vals = _create_input_vals(values, positions, defaults)
+        return all(
+            _get_outcome(branch_index, input_vals, branches, script_globals) == outcome
+            for branch_index, outcome in targets
+        )
+
+    def _add_assignment(candidates: list, targets: list) -> None:
+        # merge the candidate into an assignment, if both still reach their branch outcomes
+        for candidate in candidates:
+            for assignment in assignments:
+                values = assignment["values"]
+                if all(values.get(index, value) == value for index, value in candidate.items()):
+                    merged_values = {**values, **candidate}
+                    if _reaches_targets(merged_values, assignment["targets"] + targets):
+                        assignment["values"] = merged_values
+                        assignment["targets"] += targets
+                        return
+        assignments.append({"values": dict(candidates[0]), "targets": list(targets)})
+
+    for branch_index, branch in enumerate(branches):
+        # the branch is only reached with the required outcomes of its enclosing branches
+        branch_positions = set(branch["positions"])
+        for required_index, _ in branch["requirements"]:
+            branch_positions.update(branches[required_index]["positions"])
+        branch_indices = sorted(indices[position] for position in branch_positions if position in indices)
+
+        # the assignments of the used input positions for every outcome of the branch
+        outcomes = {}
+        value_combinations = product(*[reduced_values[index] for index in branch_indices])
+        for values in islice(value_combinations, MAX_BRANCH_COMBINATIONS):
+            candidate = dict(zip(branch_indices, values))
+            input_vals = _create_input_vals(candidate, positions, defaults)
+            outcome = _get_outcome(branch_index, input_vals, branches, script_globals)
+            if outcome is not None:
+                outcomes.setdefault(outcome, []).append(candidate)
+
+        for outcome, candidates in outcomes.items():
+            _add_assignment(candidates, [(branch_index, outcome)])
+
+    # every representative value is tested at least once
+    for index, values in enumerate(reduced_values):
+        for value in values:
+            if not any(assignment["values"].get(index, defaults[index]) == value for assignment in assignments):
+                _add_assignment([{index: value}], [])
+
+    return [
+        [assignment["values"].get(index, defaults[index]) for index in range(len(positions))]
+        for assignment in assignments
+    ]
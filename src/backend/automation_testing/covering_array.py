@@ -0,0 +1,161 @@
+"""
+This module contains the creation of covering arrays for the test case generation.
+
+A covering array of strength t contains every combination of values of any t parameters in at least
+one row, so all t-way interactions of the inputs are tested with far less rows than the cartesian product.
+The array is built with the in-parameter-order strategy (IPOG): it starts with the product of the
+first t parameters and adds the other parameters one by one. Every new parameter is first added to
+the existing rows with the value covering the most missing combinations (horizontal growth) and the
+still missing combinations are then added with new rows (vertical growth). The values of a row which are
+not needed for its combinations are left free (don't care), so later combinations can reuse the row
+instead of adding a new one. Rows whose combinations are all covered by other rows are removed at the end.
+
+Lei, Y. et al. (2007): IPOG: A General Strategy for T-Way Software Testing
+"""
+
+from collections import Counter
+from itertools import combinations, product
+
+
+def _get_missing_combinations(parameter: int, value_counts: list, strength: int) -> set:
+    """
+    Get all t-way combinations of the new parameter with the previous parameters
+
+    Args:
+        parameter (int): the index of the new parameter
+        value_counts (list): the number of values of every parameter
+        strength (int): the strength t of the covering array
+
+    Returns:
+        set: the combinations as tuples (previous parameters, their values, value of the new parameter)
+    """
+    missing = set()
+    for previous_parameters in combinations(range(parameter), strength - 1):
+        value_ranges = [range(value_counts[p]) for p in previous_parameters]
+        for values in product(*value_ranges):
+            for value in range(value_counts[parameter]):
+                missing.add((previous_parameters, values, value))
+
+    return missing
+
+
+def _get_covered_combinations(row: list, value: int, parameter_combinations: list) -> list:
+    """
+    Get the t-way combinations covered by the row if it gets the value for the new parameter
+
+    Args:
+        row (list): the row with the values of the previous parameters (None for a free value)
+        value (int): the value of the new parameter
+        parameter_combinations (list): the combinations of t-1 previous parameters
+
+    Returns:
+        list: the covered combinations as tuples (previous parameters, their values, value of the new parameter)
+    """
+    covered = []
+    for previous_parameters in parameter_combinations:
+        values = tuple(row[p] for p in previous_parameters)
+        if None not in values:
+            covered.append((previous_parameters, values, value))
+
+    return covered
+
+
+def _remove_redundant_rows(array: list, strength: int) -> list:
+    """
+    Remove the rows whose t-way combinations are all covered by other rows of the covering array
+
+    Args:
+        array (list): the rows of the covering array
+        strength (int): the strength t of the covering array
+
+    Returns:
+        list: the rows of the covering array without the redundant rows
+    """
+    parameter_combinations = list(combinations(range(len(array[0])), strength))
+    row_combinations = [
+        [(parameters, tuple(row[p] for p in parameters)) for parameters in parameter_combinations]
+        for row in array
+    ]
+    coverage = Counter(
+        combination for combinations_of_row in row_combinations for combination in combinations_of_row
+    )
+
+    # the rows of the vertical growth are added last and are the most likely to be redundant
+    redundant_rows = set()
+    for index in range(len(array) - 1, -1, -1):
+        if all(coverage[combination] > 1 for combination in row_combinations[index]):
+            coverage.subtract(row_combinations[index])
+            redundant_rows.add(index)
+
+    return [row for index, row in enumerate(array) if index not in redundant_rows]
+
+
+def create_covering_array(value_counts: list, strength: int = 2) -> list:
+    """
+    Create a covering array for parameters with the given numbers of values
+
+    Args:
+        value_counts (list): the number of values of every parameter
+        strength (int, optional): the strength t of the covering array. Defaults to 2 (pairwise).
+
+    Returns:
+        list: the rows of the covering array with the value indices of every parameter
+    """
+    if strength < 1:
+        raise ValueError("The strength of the covering array must be at least 1")
+
+    if len(value_counts) == 0 or 0 in value_counts:
+        return []
+
+    if strength >= len(value_counts):
+        return [list(row) for row in product(*[range(count) for count in value_counts])]
+
+    # parameters with many values first, so the initial product covers the largest combinations
+    order = sorted(range(len(value_counts)), key=lambda p: -value_counts[p])
+    counts = [value_counts[p] for p in order]
+
+    rows = [list(row) for row in product(*[range(count) for count in counts[:strength]])]
+
+    for parameter in range(strength, len(counts)):
+        missing = _get_missing_combinations(parameter, counts, strength)
+        parameter_combinations = list(combinations(range(parameter), strength - 1))
+
+        # horizontal growth: extend every row with the value covering the most missing combinations
+        for row in rows:
+            best_value, best_covered = 0, []
+            for value in range(counts[parameter]):
+                covered = [
+                    combination
+                    for combination in _get_covered_combinations(row, value, parameter_combinations)
+                    if combination in missing
+                ]
+                if len(covered) > len(best_covered):
+                    best_value, best_covered = value, covered
+
+            row.append(best_value)
+            missing.difference_update(best_covered)
+
+        # vertical growth: add the still missing combinations to any row with matching or free values
+        # and only to a new row if there is none
+        for previous_parameters, values, value in sorted(missing):
+            for row in rows:
+                if row[parameter] == value and all(
+                    row[p] is None or row[p] == v for p, v in zip(previous_parameters, values)
+                ):
+                    break
+            else:
+                row = [None] * parameter + [value]
+                rows.append(row)
+
+            for p, v in zip(previous_parameters, values):
+                row[p] = v
+
+    # free values can be any value, use the first one
+    array = []
+    for row in rows:
+        ordered_row = [0] * len(order)
+        for position, parameter in enumerate(order):
+            ordered_row[parameter] = 0 if row[position] is None else row[position]
+        array.append(ordered_row)
+
+    return _remove_redundant_rows(array, strength)
@@ -0,0 +1,224 @@
+"""
+This module contains the cache for the results of the automation scripts.
+
+Generated automation scripts are deterministic, so the result of a test case only depends on the
+content of the script and the input vector. The results are stored in a separate SQLite database
+with the hash of the script content and the canonical json of the input vector as key.
+The least recently used results are removed if the cache grows over its maximum size.
+"""
+
+import hashlib
+import json
+import sqlite3 as sqlite
+from collections.abc import Callable
+from os import makedirs, path
+from time import time
+
+from backend.utils.env_const import EXECUTION_CACHE
+
+from .in_process_execution import run_in_process_automations
+
+CREATE_CACHE_TABLE = """
+    CREATE TABLE IF NOT EXISTS execution_cache (
+        script_hash TEXT NOT NULL,
+        input_key TEXT NOT NULL,
+        script_name TEXT NOT NULL,
+        result TEXT NOT NULL,
+        last_used REAL NOT NULL,
+        PRIMARY KEY (script_hash, input_key)
+    );
+    CREATE INDEX IF NOT EXISTS execution_cache_last_used ON execution_cache (last_used);
+    CREATE INDEX IF NOT EXISTS execution_cache_script_name ON execution_cache (script_name);
+    """
+
+
+def get_script_name(script_path: str) -> str:
+    """
+    Get the automation name of a versioned automation script (<name>_V_<n>.py)
+
+    Args:
+        script_path (str): the path to the automation script
+
+    Returns:
+        str: the name of the automation script without version and file extension
+    """
+    file_name = path.splitext(path.basename(script_path))[0]
+    return file_name.rsplit("_V_", 1)[0]
+
+
+def get_input_key(inputs: list) -> str:
+    """
+    Create the canonical json of an input vector
+
+    Args:
+        inputs (list): the inputs for the automation containing the trigger, condition and action inputs as lists
+
+    Returns:
+        str: the canonical json string of the inputs
+    """
+    return json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+
+
+class ExecutionCache:
+    """
+    Class to represent the result cache of the automation scripts.
+    """
+
+    cache_path: str = None
+    max_entries: int = None
+
+    def __init__(self, cache_path: str = EXECUTION_CACHE, max_entries: int = 100000):
+        """
+        Open the cache database and create the cache table if it does not exist.
+
+        Args:
+            cache_path (str, optional): the path to the cache database. Defaults to EXECUTION_CACHE.
+            max_entries (int, optional): the maximum number of cached results. Defaults to 100000.
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+
+        # hashes of the scripts by their path and modification time
+        self._script_hashes: dict[str, tuple[float, str]] = {}
+
+        makedirs(path.dirname(path.abspath(cache_path)), exist_ok=True)
+        with sqlite.connect(self.cache_path) as con:
+            con.executescript(CREATE_CACHE_TABLE)
+
+    def get_script_hash(self, script_path: str) -> str:
+        """
+        Get the hash of the script content, which is only recalculated if the script was modified
+
+        Args:
+            script_path (str): the path to the automation script
+
+        Returns:
+            str: the sha256 hash of the script content
+        """
+        modified = path.getmtime(script_path)
+        cached_hash = self._script_hashes.get(script_path)
+        if cached_hash is not None and cached_hash[0] == modified:
+            return cached_hash[1]
+
+        with open(script_path, "rb") as script:
+            script_hash = hashlib.sha256(script.read()).hexdigest()
+
+        self._script_hashes[script_path] = (modified, script_hash)
+        return script_hash
+
+    def get_results(self, testcases: list) -> dict:
+        """
+        Get the cached results of the test cases and mark them as recently used
+
+        Args:
+            testcases (list): the test cases with the keys "id", "script_path" and "input_values"
+
+        Returns:
+            dict: the cached results by the index of the test case in the list
+        """
+        GET_RESULT = "SELECT result FROM execution_cache WHERE script_hash = ? AND input_key = ?"
+        UPDATE_LAST_USED = "UPDATE execution_cache SET last_used = ? WHERE script_hash = ? AND input_key = ?"
+
+        cached_results = {}
+        used_keys = []
+        now = time()
+
+        with sqlite.connect(self.cache_path) as con:
+            cur = con.cursor()
+            for index, testcase in enumerate(testcases):
+                key = (
+                    self.get_script_hash(testcase["script_path"]),
+                    get_input_key(testcase["input_values"]),
+                )
+                cur.execute(GET_RESULT, key)
+                row = cur.fetchone()
+                if row is not None:
+                    cached_results[index] = json.loads(row[0])
+                    used_keys.append((now,) + key)
+
+            cur.executemany(UPDATE_LAST_USED, used_keys)
+            con.commit()
+
+        return cached_results
+
+    def put_results(self, testcases: list, results: list) -> None:
+        """
+        Save the results of the test cases and remove the least recently used results if the cache is full
+
+        Args:
+            testcases (list): the test cases with the keys "id", "script_path" and "input_values"
+            results (list): the results of the test cases in the order of the test cases
+        """
+        INSERT_RESULT = """
+            INSERT OR REPLACE INTO execution_cache (script_hash, input_key, script_name, result, last_used)
+            VALUES (?, ?, ?, ?, ?)
+            """
+        REMOVE_LEAST_RECENTLY_USED = """
+            DELETE FROM execution_cache WHERE rowid IN (
+                SELECT rowid FROM execution_cache ORDER BY last_used LIMIT ?
+            )
+            """
+
+        now = time()
+        rows = [
+            (
+                self.get_script_hash(testcase["script_path"]),
+                get_input_key(testcase["input_values"]),
+                get_script_name(testcase["script_path"]),
+                json.dumps(result),
+                now,
+            )
+            for testcase, result in zip(testcases, results)
+        ]
+
+        with sqlite.connect(self.cache_path) as con:
+            cur = con.cursor()
+            cur.executemany(INSERT_RESULT, rows)
+
+            cur.execute("SELECT COUNT(*) FROM execution_cache")
+            overflow = cur.fetchone()[0] - self.max_entries
+            if overflow > 0:
+                cur.execute(REMOVE_LEAST_RECENTLY_USED, (overflow,))
+            con.commit()
+
+    def invalidate(self, script_name: str) -> None:
+        """
+        Remove all cached results of the versions of an automation script
+
+        Args:
+            script_name (str): the name of the automation script without version and file extension
+        """
+        with sqlite.connect(self.cache_path) as con:
+            cur = con.cursor()
+            cur.execute("DELETE FROM execution_cache WHERE script_name = ?", (script_name,))
+            con.commit()
+
+    def run_test_cases(
+        self, testcases: list, runner: Callable[[list], list] = run_in_process_automations
+    ) -> list:
+        """
+        Run the test cases which are not cached yet and return the results of all test cases
+
+        Args:
+            testcases (list): the test cases with the keys "id", "script_path" and "input_values"
+            runner (Callable[[list], list], optional): the function to run the uncached test cases.
+            Defaults to the in-process execution.
+
+        Returns:
+            list: the results as dictionaries with the keys "testcase" and "result" in the order of the test cases
+        """
+        cached_results = self.get_results(testcases)
+
+        missing_indices = [i for i in range(len(testcases)) if i not in cached_results]
+        missing_cases = [testcases[i] for i in missing_indices]
+
+        if missing_cases != []:
+            new_results = [result["result"] for result in runner(missing_cases)]
+            self.put_results(missing_cases, new_results)
+            cached_results.update(zip(missing_indices, new_results))
+
+        return [
+            {"testcase": testcase["id"], "result": cached_results[index]}
+            for index, testcase in enumerate(testcases)
+        ]
+
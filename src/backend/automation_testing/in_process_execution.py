@@ -0,0 +1,137 @@
+"""
+This module contains the functions for running the test cases of generated automation scripts
+in the current process without starting a subprocess.
+
+The generated scripts can be imported as modules, because they only read their inputs when they
+are run as main script. Their `run_automation` function is then called directly with the input vector.
+This fast path is only used for scripts created by the automation_script_gen module, all other
+scripts are run in a subprocess as before.
+"""
+
+import importlib.util
+import io
+import json
+from contextlib import redirect_stdout
+from os import path
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from .test_execution import _run_sync_automation
+
+if TYPE_CHECKING:
+    from .execution_cache import ExecutionCache
+
+# header line of every script created by the automation_script_gen module
+GENERATED_SCRIPT_HEADER = "WARNING: This file was generated by the automation_script_gen module."
+
+# cache of the loaded automation modules by their script path with the modification time of the script
+_module_cache: dict[str, tuple[float, ModuleType]] = {}
+
+
+def is_generated_script(script_path: str) -> bool:
+    """
+    Check if the script is a generated automation script which can be imported as a module
+
+    Args:
+        script_path (str): the path to the automation script
+
+    Returns:
+        bool: True if the script was generated with an importable run_automation function, False otherwise
+    """
+    with open(script_path, "r") as script:
+        script_content = script.read()
+
+    return (
+        GENERATED_SCRIPT_HEADER in script_content
+        and "def run_automation(input_vals)" in script_content
+    )
+
+
+def load_automation_module(script_path: str) -> ModuleType:
+    """
+    Import the automation script as a module or get it from the cache if the script did not change
+
+    Args:
+        script_path (str): the path to the automation script
+
+    Returns:
+        ModuleType: the automation module with the trigger_check, condition_evaluation,
+        action_execution and run_automation functions
+    """
+    script_path = path.abspath(script_path)
+    modified = path.getmtime(script_path)
+
+    cached_module = _module_cache.get(script_path)
+    if cached_module is not None and cached_module[0] == modified:
+        return cached_module[1]
+
+    module_name = "automation_script_" + path.splitext(path.basename(script_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    _module_cache[script_path] = (modified, module)
+    return module
+
+
+def run_in_process_automation(script_path: str, inputs: list) -> str:
+    """
+    Run the automation with the inputs in the current process
+
+    The output of the automation is captured from stdout, therefore the function must not be
+    called from multiple threads at the same time.
+
+    Args:
+        script_path (str): the path to the automation script
+        inputs (list): the inputs for the automation containing the trigger, condition and action inputs as lists
+
+    Returns:
+        str: the result of the automation (the same output as a run of the script in a subprocess)
+    """
+    module = load_automation_module(script_path)
+
+    # reset the global state of the script like a fresh interpreter would do
+    module.trigger_id = None
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            module.run_automation(inputs)
+        except Exception as e:
+            print(json.dumps({"ScriptError": f"{type(e).__name__}: {e}"}))
+
+    return output.getvalue()
+
+
+def run_in_process_automations(testcases: list, cache: "ExecutionCache" = None) -> list:
+    """
+    Run the automation test cases in the list in the current process
+    and fall back to a subprocess for scripts which were not generated by the environment
+
+    Args:
+        testcases (list): the list of test cases to run
+        cache (ExecutionCache, optional): the cache to take the results of already run test cases from.
+        Defaults to None.
+
+    Returns:
+        list: the results of the test cases in the order of the test cases
+    """
+    if cache is not None:
+        return cache.run_test_cases(testcases, runner=run_in_process_automations)
+
+    generated_scripts = {}
+    results = []
+
+    for testcase in testcases:
+        script_path = testcase["script_path"]
+        if script_path not in generated_scripts:
+            generated_scripts[script_path] = is_generated_script(script_path)
+
+        if generated_scripts[script_path]:
+            result = run_in_process_automation(script_path, testcase["input_values"])
+        else:
+            result = _run_sync_automation(script_path, testcase["input_values"])
+
+        results.append({"testcase": testcase["id"], "result": result})
+
+    return results
@@ -0,0 +1,140 @@
+"""
+This module contains the functions for running large test case collections on all cores of the machine.
+
+The test cases are split into chunks, which are run in the processes of a process pool. Every process
+imports the generated automation scripts once and runs its chunks in-process, so only one message per
+chunk has to be sent between the processes. The results are returned in the order of their completion.
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+from os import cpu_count
+
+from .execution_cache import ExecutionCache
+from .in_process_execution import run_in_process_automations
+
+# number of chunks per process, so that processes with fast chunks do not wait idle for the slow ones
+CHUNKS_PER_WORKER = 4
+
+
+def _run_test_case_chunk(testcases: list) -> list:
+    """
+    Run a chunk of test cases in a process of the pool
+
+    Args:
+        testcases (list): the test cases of the chunk
+
+    Returns:
+        list: the results of the test cases of the chunk
+    """
+    return run_in_process_automations(testcases)
+
+
+def _get_chunk_size(num_testcases: int, max_workers: int) -> int:
+    """
+    Calculate the number of test cases per chunk
+
+    Args:
+        num_testcases (int): the number of test cases to run
+        max_workers (int): the number of processes of the pool
+
+    Returns:
+        int: the number of test cases per chunk
+    """
+    return max(1, ceil(num_testcases / (max_workers * CHUNKS_PER_WORKER)))
+
+
+def iter_parallel_automations(
+    testcases: list,
+    max_workers: int = None,
+    chunk_size: int = None,
+    progress_callback: Callable[[int, int], None] = None,
+    cache: ExecutionCache = None,
+) -> Iterator[dict]:
+    """
+    Run the automation test cases in the list on a process pool and yield the results as soon as they are finished
+
+    Args:
+        testcases (list): the list of test cases to run
+        max_workers (int, optional): the number of processes. Defaults to the cpu count.
+        chunk_size (int, optional): the number of test cases per chunk. Defaults to a few chunks per process.
+        progress_callback (Callable[[int, int], None], optional): called with the number of finished
+        and the number of all test cases after every result. Defaults to None.
+        cache (ExecutionCache, optional): the cache to take the results of already run test cases from.
+        Only the uncached test cases are run on the process pool. Defaults to None.
+
+    Yields:
+        dict: the results of the test cases in the order of their completion
+    """
+    num_testcases = len(testcases)
+    finished = 0
+
+    if cache is not None:
+        # the cached results are returned first, they are finished before any process is started
+        cached_results = cache.get_results(testcases)
+        for index, result in cached_results.items():
+            finished += 1
+            if progress_callback is not None:
+                progress_callback(finished, num_testcases)
+            yield {"testcase": testcases[index]["id"], "result": result}
+
+        testcases = [testcase for index, testcase in enumerate(testcases) if index not in cached_results]
+
+    if len(testcases) == 0:
+        return
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = _get_chunk_size(len(testcases), max_workers)
+
+    chunks = [
+        testcases[start : start + chunk_size]
+        for start in range(0, len(testcases), chunk_size)
+    ]
+
+    executor = ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)))
+    try:
+        futures = {executor.submit(_run_test_case_chunk, chunk): chunk for chunk in chunks}
+
+        for future in as_completed(futures):
+            chunk_results = future.result()
+            if cache is not None:
+                cache.put_results(futures[future], [result["result"] for result in chunk_results])
+
+            for result in chunk_results:
+                finished += 1
+                if progress_callback is not None:
+                    progress_callback(finished, num_testcases)
+                yield result
+    finally:
+        # do not start the remaining chunks if the caller stopped the iteration
+        executor.shutdown(cancel_futures=True)
+
+
+def run_parallel_automations(
+    testcases: list,
+    max_workers: int = None,
+    chunk_size: int = None,
+    progress_callback: Callable[[int, int], None] = None,
+    cache: ExecutionCache = None,
+) -> list:
+    """
+    Run the automation test cases in the list on a process pool
+
+    Args:
+        testcases (list): the list of test cases to run
+        max_workers (int, optional): the number of processes. Defaults to the cpu count.
+        chunk_size (int, optional): the number of test cases per chunk. Defaults to a few chunks per process.
+        progress_callback (Callable[[int, int], None], optional): called with the number of finished
+        and the number of all test cases after every result. Defaults to None.
+        cache (ExecutionCache, optional): the cache to take the results of already run test cases from.
+        Only the uncached test cases are run on the process pool. Defaults to None.
+
+    Returns:
+        list: the results of the test cases in the order of their completion
+    """
+    return list(
+        iter_parallel_automations(testcases, max_workers, chunk_size, progress_callback, cache)
+    )
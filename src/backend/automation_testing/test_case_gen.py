@@ -1,9 +1,22 @@
-from backend.database import db_create_test_cases
+from backend.database import db_create_test_cases, transaction
 
 from backend.utils.env_helper import is_float_or_int
 from backend.utils.env_helper_classes import Entity
 
-from itertools import product
+from collections.abc import Iterable, Iterator
+from itertools import islice, product
+from math import prod
+from random import Random
+from time import perf_counter
+
+from .branch_coverage import create_branch_covering_combinations
+from .covering_array import create_covering_array
+
+# number of test cases inserted or run at once when the combinations are streamed
+COMBINATION_CHUNK_SIZE = 10000
+
+# maximum number of test cases before the combinations are sampled
+COMBINATION_BUDGET = 10000
 
 
 def add_test_cases_to_db(
@@ -12,6 +25,7 @@ def add_test_cases_to_db(
     input_value_list: list,
     reqiurements: list,
     case_priorities: list,
+    stats: dict = None,
 ):
     """
     Function to create a test case for the automation and add it to the database
@@ -22,92 +36,154 @@ def add_test_cases_to_db(
         input_value_list (list): the input value list for the automation entity
         reqiurements (list): the requirements for the test cases
         case_priorities (list): the priorities for the test cases
+        stats (dict, optional): filled with the numbers of "created" and "skipped" test cases and created "inputs",
+            the "duration" of the insertion in seconds and the "throughput" in test cases per second.
+            Defaults to None.
 
     Returns:
-        list: the created test cases dictionary with the test case id and the input ids as a list
+        list: the created test cases dictionary with the test case id and the input ids as a list,
+        test cases which are already stored for the automation are not created again and their stored
+        test case is returned instead
     """
 
-    # create the test cases
-    test_cases = []
+    # collect the test cases with their inputs
+    test_cases = [
+        _create_test_case(
+            combination_of_test_inputs[new_test_case],
+            input_value_list,
+            reqiurements[new_test_case],
+            case_priorities[new_test_case],
+        )
+        for new_test_case in range(len(combination_of_test_inputs))
+    ]
 
-    new_test_case = 0
+    # insert all test cases with one transaction
+    start_time = perf_counter()
+    created_test_cases = db_create_test_cases.create_test_cases_bulk(automation_id, test_cases, stats=stats)
 
-    while new_test_case < len(combination_of_test_inputs):
-        reqiurement_str = reqiurements[new_test_case]
-        case_priority = case_priorities[new_test_case]
+    if stats is not None:
+        stats["duration"] = perf_counter() - start_time
+        stats["throughput"] = stats["created"] / max(stats["duration"], 1e-9)
 
-        # handle empty strings
-        if reqiurement_str == "":
-            reqiurement_str = None
+    return created_test_cases
 
-        if case_priority == "":
-            case_priority = None
-        else:
-            case_priority = int(case_priority)
 
-        # create the test case
-        new_test_case_id = db_create_test_cases.create_test_case(
-            automation_id, reqiurement_str, case_priority
-        )
+def add_test_case_combinations_to_db(
+    automation_id: int,
+    input_value_list: list,
+    requirement: str = "",
+    case_priority: str = "",
+    chunk_size: int = COMBINATION_CHUNK_SIZE,
+    combinations: Iterable = None,
+) -> int:
+    """
+    Function to stream the test case input combinations into the database
 
-        # create the test case inputs
-        case_input_ids = _create_test_case_inputs(
-            combination_of_test_inputs[new_test_case],
-            input_value_list,
-            new_test_case_id,
-        )
+    The combinations are created and inserted chunk by chunk in one transaction,
+    so the memory usage does not grow with the number of combinations.
 
-        test_cases.append(
-            {"test_case_id": new_test_case_id, "input_ids": case_input_ids}
-        )
+    Args:
+        automation_id (int): the id of the automation
+        input_value_list (list): the input value list for the test values of the automation entities
+        requirement (str, optional): the requirement for all test cases. Defaults to "".
+        case_priority (str, optional): the priority for all test cases. Defaults to "".
+        chunk_size (int, optional): the number of test cases inserted at once. Defaults to COMBINATION_CHUNK_SIZE.
+        combinations (Iterable, optional): the test case input combinations to insert.
+        Defaults to all combinations of the input value list.
 
-        new_test_case += 1
+    Returns:
+        int: the number of created test cases without the already stored test cases
+    """
+    if combinations is None:
+        combinations = iter_test_case_input_combinations(input_value_list)
 
-    return test_cases
+    stats = {}
 
+    with transaction():
+        # the test cases stored without an input hash only have to be hashed once for all chunks
+        db_create_test_cases.add_missing_input_hashes(automation_id)
 
-def _create_test_case_inputs(
-    test_case_input_values, input_value_list: list, case_id: int
-):
+        for chunk in _iter_chunks(combinations, chunk_size):
+            test_cases = [
+                _create_test_case(combination, input_value_list, requirement, case_priority)
+                for combination in chunk
+            ]
+            db_create_test_cases.create_test_cases_bulk(
+                automation_id, test_cases, add_missing_hashes=False, stats=stats
+            )
+
+    return stats.get("created", 0)
+
+
+def _create_test_case(
+    test_case_input_values, input_value_list: list, requirement: str, case_priority: str
+) -> dict:
     """
-    Create the test case inputs for the test case
+    Create the test case for the bulk insertion
 
     Args:
         test_case_input_values (list): the test case input values for the test case
         input_value_list (list): the input value list for the automation entity
-        new_case_id (int): the id of the test case
+        requirement (str): the requirement for the test case, an empty string for no requirement
+        case_priority (str): the priority for the test case, an empty string for no priority
 
     Returns:
-        list: the created test case input ids as a list
+        dict: the test case with the keys "requirement", "priority" and "inputs"
     """
-    case_input_ids = []
+    # handle empty strings
+    if requirement == "":
+        requirement = None
+
+    if case_priority == "":
+        case_priority = None
+    else:
+        case_priority = int(case_priority)
+
+    return {
+        "requirement": requirement,
+        "priority": case_priority,
+        "inputs": _create_test_case_inputs(test_case_input_values, input_value_list),
+    }
+
+
+def _create_test_case_inputs(test_case_input_values, input_value_list: list) -> list:
+    """
+    Create the test case input rows for the test case
+
+    Args:
+        test_case_input_values (list): the test case input values for the test case
+        input_value_list (list): the input value list for the automation entity
+
+    Returns:
+        list: the test case inputs as tuples (test_value, a_id, e_id, p_role, position)
+    """
+    case_inputs = []
 
     for i, test_case_input in enumerate(test_case_input_values):
         entity: Entity = input_value_list[i]["entity"]
 
-        case_input_id = db_create_test_cases.create_test_case_input(
-            test_value=is_float_or_int(test_case_input),
-            test_case_id=case_id,
-            a_id=input_value_list[i]["a_id"],
-            e_id=entity.entity_id,
-            p_role=entity.parameter_role,
-            position=entity.position,
+        case_inputs.append(
+            (
+                is_float_or_int(test_case_input),
+                input_value_list[i]["a_id"],
+                entity.entity_id,
+                entity.parameter_role,
+                entity.position,
+            )
         )
 
-        case_input_ids.append(case_input_id)
+    return case_inputs
 
-    return case_input_ids
 
-
-def create_test_case_input_combinations(input_value_list: list):
+def _get_test_case_input_values(input_value_list: list) -> list:
     """
-    Function to create the different test case input combinations for the test case
+    Function to get the test values of every automation entity as a list
 
     Args:
         input_value_list (list): the input value list for the test values of the automation entities
 
     Returns:
-        list: the different test case input combinations as a list
+        list: the test values of every automation entity in the order of the input value list
     """
 
     # get the different test cases and the needed input values
@@ -122,6 +198,278 @@ def create_test_case_input_combinations(input_value_list: list):
         else:
             test_case_input_values.append([test_values])
 
-    result = [list(item) for item in product(*test_case_input_values)]
+    return test_case_input_values
+
+
+def count_test_case_input_combinations(input_value_list: list) -> int:
+    """
+    Function to count the test case input combinations without creating them
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+
+    Returns:
+        int: the number of test case input combinations
+    """
+
+    return prod(len(test_values) for test_values in _get_test_case_input_values(input_value_list))
+
+
+def iter_test_case_input_combinations(input_value_list: list) -> Iterator[list]:
+    """
+    Function to create the different test case input combinations one after another
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+
+    Yields:
+        list: the test case input combinations in the order of the cartesian product
+    """
+
+    for item in product(*_get_test_case_input_values(input_value_list)):
+        yield list(item)
+
+
+def iter_test_case_input_combination_chunks(
+    input_value_list: list, chunk_size: int = COMBINATION_CHUNK_SIZE
+) -> Iterator[list]:
+    """
+    Function to create the test case input combinations in chunks of a fixed size
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+        chunk_size (int, optional): the maximum number of combinations per chunk. Defaults to COMBINATION_CHUNK_SIZE.
+
+    Yields:
+        list: the chunks of test case input combinations, only the last chunk can be smaller
+    """
+    yield from _iter_chunks(iter_test_case_input_combinations(input_value_list), chunk_size)
+
+
+def _iter_chunks(combinations: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Function to split the combinations into chunks of a fixed size
+
+    Args:
+        combinations (Iterable): the test case input combinations
+        chunk_size (int): the maximum number of combinations per chunk
+
+    Yields:
+        list: the chunks of test case input combinations, only the last chunk can be smaller
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    combinations = iter(combinations)
+    while chunk := list(islice(combinations, chunk_size)):
+        yield chunk
+
+
+def create_test_case_input_combinations(input_value_list: list):
+    """
+    Function to create the different test case input combinations for the test case
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+
+    Returns:
+        list: the different test case input combinations as a list
+    """
+
+    return list(iter_test_case_input_combinations(input_value_list))
+
+
+def create_covering_test_case_input_combinations(input_value_list: list, strength: int = 2) -> list:
+    """
+    Function to create the test case input combinations of a covering array
+
+    Every combination of the test values of any t entities is part of at least one test case,
+    so all t-way interactions of the trigger, condition and action inputs are tested
+    with far less test cases than the cartesian product.
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+        strength (int, optional): the number of entities t whose value combinations are covered.
+        Defaults to 2 (pairwise).
+
+    Returns:
+        list: the test case input combinations of the covering array as a list
+    """
+
+    test_case_input_values = _get_test_case_input_values(input_value_list)
+    covering_array = create_covering_array(
+        [len(test_values) for test_values in test_case_input_values], strength
+    )
+
+    return [
+        [test_case_input_values[entity][value] for entity, value in enumerate(row)]
+        for row in covering_array
+    ]
+
+
+def create_branch_covering_test_case_input_combinations(input_value_list: list, script_path: str) -> list:
+    """
+    Function to create the test case input combinations which cover all branches of the automation script
+
+    The test values of every entity are reduced to one value per equivalence class of the comparisons
+    in the generated script (plus the values next to the limits of numeric comparisons).
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+        script_path (str): the path to the generated automation script
+
+    Returns:
+        list: the test case input combinations covering the branches as a list
+    """
+
+    # the position of every entity in the trigger, condition or action inputs of the script
+    positions = []
+    role_counts = {}
+    for input_values in input_value_list:
+        role = input_values["entity"].parameter_role
+        positions.append((role, role_counts.get(role, 0)))
+        role_counts[role] = role_counts.get(role, 0) + 1
+
+    return create_branch_covering_combinations(
+        _get_test_case_input_values(input_value_list), positions, script_path
+    )
+
+
+def decode_combination_index(index: int, test_case_input_values: list) -> list:
+    """
+    Function to get the test case input combination at an index of the cartesian product
+
+    The index is decoded as a mixed-radix number with the number of test values of every entity as radix,
+    so the combination is found without creating the combinations before it.
+
+    Args:
+        index (int): the index of the combination in the order of the cartesian product
+        test_case_input_values (list): the test values of every automation entity
+
+    Returns:
+        list: the test case input combination at the index
+    """
+
+    combination = [None] * len(test_case_input_values)
+    # the last entity changes the fastest in the cartesian product
+    for entity in range(len(test_case_input_values) - 1, -1, -1):
+        index, value = divmod(index, len(test_case_input_values[entity]))
+        combination[entity] = test_case_input_values[entity][value]
+
+    return combination
+
+
+def _encode_combination_index(value_indices: list, test_case_input_values: list) -> int:
+    """
+    Function to get the index of a combination of value indices in the cartesian product
+
+    Args:
+        value_indices (list): the index of the test value of every automation entity
+        test_case_input_values (list): the test values of every automation entity
+
+    Returns:
+        int: the index of the combination in the order of the cartesian product
+    """
+
+    index = 0
+    for value_index, test_values in zip(value_indices, test_case_input_values):
+        index = index * len(test_values) + value_index
+
+    return index
+
+
+def _draw_stratified_indices(test_case_input_values: list, budget: int, rng: Random) -> set:
+    """
+    Function to draw combination indices in which every test value of an entity occurs equally often
+
+    The test values of every entity are the strata: each entity gets a column with all of its values
+    repeated evenly over the budget, which is shuffled independently of the other columns (latin hypercube).
+
+    Args:
+        test_case_input_values (list): the test values of every automation entity
+        budget (int): the number of drawn combinations
+        rng (Random): the seeded random number generator
+
+    Returns:
+        set: the unique indices of the drawn combinations
+    """
+
+    columns = []
+    for test_values in test_case_input_values:
+        if len(test_values) > budget:
+            # not every value fits into the budget, so the values are drawn without repetition
+            column = rng.sample(range(len(test_values)), budget)
+        else:
+            # start at a random value, so the values with an additional occurrence are not always the first ones
+            offset = rng.randrange(len(test_values))
+            column = [(row + offset) % len(test_values) for row in range(budget)]
+            rng.shuffle(column)
+        columns.append(column)
+
+    return {
+        _encode_combination_index(value_indices, test_case_input_values)
+        for value_indices in zip(*columns)
+    }
+
+
+def sample_test_case_input_combinations(
+    input_value_list: list,
+    budget: int = COMBINATION_BUDGET,
+    seed: int = 0,
+    stratified: bool = False,
+) -> list:
+    """
+    Function to sample the test case input combinations if their number exceeds the budget
+
+    The samples are drawn as indices of the cartesian product and decoded to their combinations,
+    so the product is never created. The same seed always creates the same test cases.
+
+    Args:
+        input_value_list (list): the input value list for the test values of the automation entities
+        budget (int, optional): the maximum number of test cases. Defaults to COMBINATION_BUDGET.
+        seed (int, optional): the seed of the random sampling. Defaults to 0.
+        stratified (bool, optional): if True, every test value of an entity occurs equally often in the
+        samples, otherwise the samples are drawn uniformly at random. Defaults to False.
+
+    Returns:
+        list: all test case input combinations if they fit into the budget, otherwise the sampled
+        combinations in the order of the cartesian product
+    """
+    if budget < 1:
+        raise ValueError("The budget must be at least 1")
+
+    num_combinations = count_test_case_input_combinations(input_value_list)
+    if num_combinations <= budget:
+        return create_test_case_input_combinations(input_value_list)
+
+    test_case_input_values = _get_test_case_input_values(input_value_list)
+    rng = Random(seed)
+
+    indices = set()
+    if stratified:
+        indices = _draw_stratified_indices(test_case_input_values, budget, rng)
+
+    # fill up with uniform samples (all samples if not stratified or the duplicates of the strata)
+    while len(indices) < budget:
+        indices.add(rng.randrange(num_combinations))
+
+    return [decode_combination_index(index, test_case_input_values) for index in sorted(indices)]
+
+
+def get_reduction_ratio(num_combinations: int, input_value_list: list) -> float:
+    """
+    Function to get the reduction of the test cases compared to all test case input combinations
+
+    Args:
+        num_combinations (int): the number of created test case input combinations
+        input_value_list (list): the input value list for the test values of the automation entities
+
+    Returns:
+        float: the share of the cartesian product which is not tested, 0.0 for the whole product
+    """
+
+    num_all_combinations = count_test_case_input_combinations(input_value_list)
+    if num_all_combinations == 0:
+        return 0.0
 
-    return result
+    return 1 - num_combinations / num_all_combinations
@@ -5,14 +5,36 @@ This module contains the functions for running the automation tests.
 import json
 import subprocess
 from asyncio import run as async_run
+from typing import TYPE_CHECKING
 from backend.utils.env_helper_classes import Automation
 from asyncio import (
+    CancelledError,
+    Event,
+    Semaphore,
+    TimeoutError as AsyncTimeoutError,
+    create_task,
+    gather,
+    wait_for,
     subprocess as async_subprocess,
     create_subprocess_exec as create_aync_subprocess_exec,
 )
 
 from backend.utils.env_const import SINGLE, RESTART, QUEUED, PARALLEL
 
+from .worker_pool import AutomationWorkerPool
+
+if TYPE_CHECKING:
+    from .execution_cache import ExecutionCache
+
+# flag of the generated automation scripts to read a stream of input vectors from stdin
+BATCH_MODE = "--batch"
+
+# results of the simultaneous runs which were not executed to the end because of the automation mode
+ALREADY_RUNNING = {"AutomationResult": "Already running"}
+MAX_RUNS_EXCEEDED = {"AutomationResult": "Maximum number of runs exceeded"}
+STOPPED_BY_RESTART = {"AutomationResult": "Stopped by restart"}
+TIMEOUT_EXCEEDED = {"AutomationResult": "Timeout exceeded"}
+
 
 def _run_sync_automation(
     script_path,
@@ -41,7 +63,7 @@ def _run_sync_automation(
     return result.stdout.decode("utf-8")
 
 
-async def _run_async_automation(script_path, inputs: list):
+async def _run_async_automation(script_path, inputs: list, started: Event = None):
     """
     The function calls the automation script and returns the result
 
@@ -49,6 +71,7 @@ async def _run_async_automation(script_path, inputs: list):
         srcript_path (str): the path to the automation script
         inputs (list): the inputs for the automation inputs
         containing the trigger, condition and action inputs as lists
+        started (Event, optional): set as soon as the script process is running. Defaults to None.
 
     Returns:
         str: the result of the automation
@@ -65,15 +88,72 @@ async def _run_async_automation(script_path, inputs: list):
         stdout=async_subprocess.PIPE,  # get the standard output
         stderr=async_subprocess.PIPE,  # Optional: get error messages
     )
+    if started is not None:
+        started.set()
 
     # wait for the process to finish and decode the output
-    stdout, stderr = await proc.communicate()
+    try:
+        stdout, stderr = await proc.communicate()
+    except CancelledError:
+        # stop the automation script if the run was cancelled (timeout or restart)
+        proc.kill()
+        await proc.wait()
+        raise
 
     output = json.loads(stdout.decode("utf-8"))
 
     return output
 
 
+def _supports_batch_mode(script_path: str) -> bool:
+    """
+    Check if the automation script was generated with the batch mode
+
+    Args:
+        script_path (str): the path to the automation script
+
+    Returns:
+        bool: True if the script can read a stream of input vectors, False otherwise
+    """
+    with open(script_path, "r") as script:
+        return f'BATCH_MODE = "{BATCH_MODE}"' in script.read()
+
+
+def _run_batch_automation(script_path: str, inputs_list: list) -> list:
+    """
+    Run the automation for a list of input vectors in one process using the batch mode of the script
+
+    Args:
+        script_path (str): the path to the automation script
+        inputs_list (list): the inputs for the automation runs,
+        each containing the trigger, condition and action inputs as lists
+
+    Raises:
+        RuntimeError: If the script did not return a result for every input vector.
+
+    Returns:
+        list: the results of the automation runs in the order of the inputs
+    """
+
+    # one serialized input vector per line (json lines)
+    serialized_inputs = "".join(json.dumps(inputs) + "\n" for inputs in inputs_list)
+
+    result = subprocess.run(
+        ["python", script_path, BATCH_MODE],
+        input=serialized_inputs.encode("utf-8"),
+        capture_output=True,
+    )
+    output_lines = result.stdout.decode("utf-8").splitlines()
+
+    if len(output_lines) != len(inputs_list):
+        raise RuntimeError(
+            f"Batch run of {script_path} returned {len(output_lines)} of {len(inputs_list)} results: "
+            + result.stderr.decode("utf-8")
+        )
+
+    return [json.loads(line) for line in output_lines]
+
+
 def _run_test_case(testcase: dict, automation_mode: int):
     """
     Run a single automation test case
@@ -99,42 +179,209 @@ def _run_test_case(testcase: dict, automation_mode: int):
     return {"testcase": testcase["id"], "result": result}
 
 
-def run_distinct_automations(testcases: list, automation_mode: int):
+def run_distinct_automations(testcases: list, automation_mode: int, cache: "ExecutionCache" = None):
     """
     Run the automation test cases in the list in single mode
 
     Args:
         testcases (list): the list of test cases to run
         automation_mode (int): the mode of the automation
+        cache (ExecutionCache, optional): the cache to take the results of already run test cases from.
+        Defaults to None.
+    """
+
+    if cache is not None:
+        # the cache holds the plain script output, which is only parsed for the async modes
+        results = cache.run_test_cases(
+            testcases, runner=lambda uncached_cases: run_distinct_automations(uncached_cases, QUEUED)
+        )
+        if automation_mode == SINGLE or automation_mode == PARALLEL:
+            for result in results:
+                result["result"] = json.loads(result["result"])
+        return results
+
+    results = [None] * len(testcases)
+
+    # group the test cases by their script to run every script only once in batch mode
+    script_cases = {}
+    for index, testcase in enumerate(testcases):
+        script_cases.setdefault(testcase["script_path"], []).append(index)
+
+    for script_path, case_indices in script_cases.items():
+        if not _supports_batch_mode(script_path):
+            # scripts generated before the batch mode are run one by one
+            for index in case_indices:
+                results[index] = _run_test_case(testcases[index], automation_mode)
+            continue
+
+        outputs = _run_batch_automation(
+            script_path, [testcases[index]["input_values"] for index in case_indices]
+        )
+
+        for index, output in zip(case_indices, outputs):
+            # keep the result format of the single runs (parsed json for the async modes)
+            if automation_mode == SINGLE or automation_mode == PARALLEL:
+                output = json.loads(output)
+            results[index] = {"testcase": testcases[index]["id"], "result": output}
+
+    return results
+
+
+def run_pooled_automations(testcases: list, pool_size: int = None):
     """
+    Run the automation test cases in the list on a pool of warm worker processes,
+    which load the automation script once instead of starting a new interpreter for every test case
+
+    Args:
+        testcases (list): the list of test cases to run
+        pool_size (int, optional): the maximum number of workers per automation script. Defaults to the cpu count.
 
-    results = []
+    Returns:
+        list: the results of the test cases in the order of the test cases
+    """
 
-    for testcase in testcases:
-        results.append(_run_test_case(testcase, automation_mode))
+    with AutomationWorkerPool(pool_size=pool_size) as pool:
+        results = pool.run_test_cases(testcases)
 
     return results
 
 
-def run_simultaneous_automations(
-    testcases: list, automation_mode: int, max_instances: int
-):
+async def _run_timed_test_case(testcase: dict, timeout: float = None, started: Event = None) -> dict:
     """
-    Run the automation test cases in the list in parallel mode
+    Run a single automation test case and stop it after the timeout
+
+    Args:
+        testcase (dict): the test case with the script path and the input values
+        timeout (float, optional): the maximum runtime of the test case in seconds. Defaults to None.
+        started (Event, optional): set as soon as the script process is running. Defaults to None.
+
+    Returns:
+        dict: the result of the test case
+    """
+    try:
+        result = await wait_for(
+            _run_async_automation(testcase["script_path"], testcase["input_values"], started),
+            timeout,
+        )
+    except AsyncTimeoutError:
+        result = TIMEOUT_EXCEEDED
+
+    return {"testcase": testcase["id"], "result": result}
+
+
+async def _run_limited_test_case(
+    testcase: dict, semaphore: Semaphore, timeout: float = None
+) -> dict:
+    """
+    Run a single automation test case as soon as the semaphore allows another running instance
+
+    Args:
+        testcase (dict): the test case with the script path and the input values
+        semaphore (Semaphore): the semaphore limiting the running instances of the automation
+        timeout (float, optional): the maximum runtime of the test case in seconds. Defaults to None.
+
+    Returns:
+        dict: the result of the test case
+    """
+    async with semaphore:
+        return await _run_timed_test_case(testcase, timeout)
+
+
+async def run_simultaneous_test_cases(
+    testcases: list, automation_mode: int, max_instances: int, timeout: float = None
+) -> list:
+    """
+    Run the automation test cases in the list as simultaneous triggers of the automation
+    and handle them like Home Assistant depending on the automation mode:
+
+        SINGLE: only the first test case runs, the others are ignored while it is running
+        RESTART: every test case stops the running one, so only the last test case finishes
+        QUEUED: the test cases run one after another, at most max_instances are queued
+        PARALLEL: the test cases run concurrently, at most max_instances are started and running at once
+
+    Cancelling the calling task stops all running automation scripts. A test case whose script
+    fails without a json result gets a ScriptError result, the other test cases are not affected.
 
     Args:
         testcases (list): the list of test cases to run
         automation_mode (int): the mode of the automation
         max_instances (int): the maximum number of instances to run
+        timeout (float, optional): the maximum runtime of a single test case in seconds. Defaults to None.
+
+    Returns:
+        list: the results of the test cases in the order of the test cases
     """
 
-    results = []
+    results = [None] * len(testcases)
+    tasks = {}
+
+    try:
+        if automation_mode == SINGLE or automation_mode == RESTART:
+            running_task = None
+            for index, testcase in enumerate(testcases):
+                if running_task is not None and automation_mode == SINGLE:
+                    results[index] = {"testcase": testcase["id"], "result": ALREADY_RUNNING}
+                    continue
+
+                if running_task is not None:
+                    running_task.cancel()
+
+                # the next test case only restarts the automation after its script is running
+                started = Event()
+                running_task = create_task(_run_timed_test_case(testcase, timeout, started))
+                running_task.add_done_callback(lambda _task, started=started: started.set())
+                tasks[index] = running_task
+                await started.wait()
+        else:
+            # the queued runs wait for each other, the parallel runs share max_instances running instances
+            # and the test cases beyond max_instances are rejected
+            semaphore = Semaphore(1 if automation_mode == QUEUED else max_instances)
+            for index, testcase in enumerate(testcases):
+                if index >= max_instances:
+                    results[index] = {"testcase": testcase["id"], "result": MAX_RUNS_EXCEEDED}
+                else:
+                    tasks[index] = create_task(
+                        _run_limited_test_case(testcase, semaphore, timeout)
+                    )
+
+        task_results = await gather(*tasks.values(), return_exceptions=True)
+    finally:
+        # stop the remaining runs if the whole batch was cancelled
+        for task in tasks.values():
+            task.cancel()
+
+    for index, task_result in zip(tasks.keys(), task_results):
+        if isinstance(task_result, CancelledError):
+            task_result = {"testcase": testcases[index]["id"], "result": STOPPED_BY_RESTART}
+        elif isinstance(task_result, Exception):
+            # e.g. a crashed script whose output is no json, only this test case failed
+            task_result = {
+                "testcase": testcases[index]["id"],
+                "result": {"ScriptError": f"{type(task_result).__name__}: {task_result}"},
+            }
+        elif isinstance(task_result, BaseException):
+            raise task_result
+        results[index] = task_result
 
-    for i in range(max_instances):
-        results.append(_run_test_case(testcases[i], automation_mode))
+    return results
 
-    if automation_mode == RESTART:
-        pass
-        # TODO: implement the restart logic here (50% of the time the test case should be stopped)
 
-    return results
+def run_simultaneous_automations(
+    testcases: list, automation_mode: int, max_instances: int, timeout: float = None
+):
+    """
+    Run the automation test cases in the list in parallel mode
+
+    Args:
+        testcases (list): the list of test cases to run
+        automation_mode (int): the mode of the automation
+        max_instances (int): the maximum number of instances to run
+        timeout (float, optional): the maximum runtime of a single test case in seconds. Defaults to None.
+
+    Returns:
+        list: the results of the test cases in the order of the test cases
+    """
+
+    return async_run(
+        run_simultaneous_test_cases(testcases, automation_mode, max_instances, timeout)
+    )
@@ -0,0 +1,192 @@
+"""
+This module contains the worker pool for running many test cases of generated automation scripts
+without starting a new python interpreter for every single test case.
+
+Every worker is a long-lived `automation_worker.py` process which loads one automation script once
+and evaluates the serialized input vectors it receives over its stdin pipe.
+"""
+
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count, path
+from queue import Queue
+from threading import Lock
+
+WORKER_SCRIPT = path.join(path.dirname(path.abspath(__file__)), "automation_worker.py")
+
+
+class AutomationWorker:
+    """
+    Class to represent a long-lived worker process for one automation script.
+    """
+
+    script_path: str = None
+    process: subprocess.Popen = None
+
+    def __init__(self, script_path: str):
+        """
+        Start the worker process for the automation script.
+
+        Args:
+            script_path (str): the path to the automation script
+        """
+        self.script_path = script_path
+        self.process = subprocess.Popen(
+            ["python", WORKER_SCRIPT, script_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+
+    def evaluate(self, inputs: list) -> str:
+        """
+        Evaluate one input vector with the automation script of the worker.
+
+        Args:
+            inputs (list): the inputs for the automation containing the trigger, condition and action inputs as lists
+
+        Raises:
+            RuntimeError: If the worker process stopped unexpectedly.
+
+        Returns:
+            str: the result of the automation (the same output as a single run of the script)
+        """
+        self.process.stdin.write(json.dumps(inputs) + "\n")
+        self.process.stdin.flush()
+
+        line = self.process.stdout.readline()
+        if line == "":
+            raise RuntimeError(f"Worker for {self.script_path} stopped unexpectedly")
+
+        return json.loads(line)
+
+    def close(self) -> None:
+        """
+        Close the input pipe of the worker and wait for the process to finish.
+        """
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+class AutomationWorkerPool:
+    """
+    Class to represent a pool of warm workers which run the test cases of generated automation scripts.
+
+    The workers are started lazily per automation script and reused until the pool is closed.
+    """
+
+    pool_size: int = None
+
+    def __init__(self, pool_size: int = None):
+        """
+        Create the worker pool.
+
+        Args:
+            pool_size (int, optional): the maximum number of workers per automation script. Defaults to the cpu count.
+        """
+        if pool_size is None:
+            pool_size = cpu_count() or 1
+        if pool_size < 1:
+            raise ValueError("The pool size must be at least 1")
+
+        self.pool_size = pool_size
+
+        # idle workers and the number of started workers for every automation script
+        self._idle_workers: dict[str, Queue] = {}
+        self._started_workers: dict[str, list] = {}
+        self._lock = Lock()
+
+    def _acquire_worker(self, script_path: str) -> AutomationWorker:
+        """
+        Get an idle worker for the automation script or start a new one if the pool is not full.
+
+        Args:
+            script_path (str): the path to the automation script
+
+        Returns:
+            AutomationWorker: the worker reserved for the caller
+        """
+        with self._lock:
+            idle_workers = self._idle_workers.setdefault(script_path, Queue())
+            started_workers = self._started_workers.setdefault(script_path, [])
+
+            if idle_workers.empty() and len(started_workers) < self.pool_size:
+                worker = AutomationWorker(script_path)
+                started_workers.append(worker)
+                return worker
+
+        # wait for a worker of the script to be released
+        return idle_workers.get()
+
+    def _release_worker(self, worker: AutomationWorker) -> None:
+        """
+        Give the worker back to the pool.
+
+        Args:
+            worker (AutomationWorker): the worker to be released
+        """
+        self._idle_workers[worker.script_path].put(worker)
+
+    def run_automation(self, script_path: str, inputs: list) -> str:
+        """
+        Run the automation script with the inputs on a worker of the pool.
+
+        Args:
+            script_path (str): the path to the automation script
+            inputs (list): the inputs for the automation containing the trigger, condition and action inputs as lists
+
+        Returns:
+            str: the result of the automation
+        """
+        worker = self._acquire_worker(script_path)
+        try:
+            result = worker.evaluate(inputs)
+        except RuntimeError:
+            # replace the crashed worker, so callers waiting for a worker of the script are not blocked
+            with self._lock:
+                self._started_workers[script_path].remove(worker)
+                new_worker = AutomationWorker(script_path)
+                self._started_workers[script_path].append(new_worker)
+            self._release_worker(new_worker)
+            raise
+        self._release_worker(worker)
+        return result
+
+    def run_test_cases(self, testcases: list) -> list:
+        """
+        Run the test cases on the workers of the pool.
+
+        Args:
+            testcases (list): the test cases with the keys "id", "script_path" and "input_values"
+
+        Returns:
+            list: the results as dictionaries with the keys "testcase" and "result" in the order of the test cases
+        """
+
+        def _run(testcase: dict) -> dict:
+            result = self.run_automation(testcase["script_path"], testcase["input_values"])
+            return {"testcase": testcase["id"], "result": result}
+
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(_run, testcases))
+
+    def close(self) -> None:
+        """
+        Stop all workers of the pool.
+        """
+        with self._lock:
+            for workers in self._started_workers.values():
+                for worker in workers:
+                    worker.close()
+            self._started_workers = {}
+            self._idle_workers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -10,20 +10,24 @@ from backend.utils.env_const import (
     DATABASE,
     EXAMPLE_DATA,
     EXAMPLE_SCRIPT,
-    INIT_FILE,
     INTEG_DATA,
 )
 
+from .db_connection import transaction
+from .db_migration import migrate_database
 from .db_create_autom import add_automation, add_additional_info, add_integration
 
-__all__ = ["add_automation", "add_additional_info", "add_integration"]
+__all__ = ["add_automation", "add_additional_info", "add_integration", "transaction"]
 
 
-def _load_data_foundation():
+def _load_data_foundation(db_path: str = DATABASE):
     """
     load the standard integration names and their possible values into the database
     and add an example automation to the database
 
+    Args:
+        db_path: str - the path to the database. Defaults to DATABASE.
+
     needed sql-Files:
         -   schema/standard_integration.sql
         -   schema/example_automation.sql
@@ -35,7 +39,7 @@ def _load_data_foundation():
 
     try:
         # con = connection to the db
-        with sqlite.connect(DATABASE) as con:
+        with sqlite.connect(db_path) as con:
             # create cursor to execute commands on db
             cur = con.cursor()
             cur.executescript(standard_integration_data)
@@ -50,7 +54,7 @@ def _load_data_foundation():
 
     try:
         # con = connection to the db
-        with sqlite.connect(DATABASE) as con:
+        with sqlite.connect(db_path) as con:
             # create cursor to execute commands on db
             cur = con.cursor()
             cur.executescript(example_data)
@@ -68,34 +72,29 @@ def _load_data_foundation():
             script_file.write(script)
 
 
-def init_db():
+def init_db(db_path: str = DATABASE):
     """
-    Initialize the database model in sqlite and load the base data
+    Initialize or migrate the database model in sqlite and load the base data into a new database
+
+    Args:
+        db_path: str - the path to the database. Defaults to DATABASE.
 
     needed sql-Files:
         -   ../schema/database_creation.spl
+        -   ../schema/migrations/*.sql
         -   ../schema/standard_integration.sql
     """
-    # init data base only if it does not exist
-    if path.isfile(DATABASE):
-        return
-    else:
-        with open(INIT_FILE) as model_creator:
-            automation_test_env_model = model_creator.read()
-
-            # con = connection to the db
-            with sqlite.connect(DATABASE) as con:
-                # create cursor to execute commands on db
-                cur = con.cursor()
-                cur.executescript(automation_test_env_model)
-                # commit db actions, thus actually execute on the db
-                con.commit()
-
-            # load base data for the data base
-            _load_data_foundation()
-
-            # print success message
-            print("Database initialized successfully")
+    new_database = not path.isfile(db_path)
+
+    # create the database model or apply the missing migrations to an existing database
+    migrate_database(db_path)
+
+    if new_database:
+        # load base data for the data base
+        _load_data_foundation(db_path)
+
+        # print success message
+        print("Database initialized successfully")
 
 
 # Trigger the function when the module is imported
@@ -0,0 +1,195 @@
+"""
+This module contains the connection manager of the database.
+
+Every thread uses one connection to the database, which is opened on the first use and then reused
+by all database functions of the thread. Write operations are grouped in units of work with
+`transaction()`, so multiple operations can be committed together. Nested units of work join
+the outermost one, which commits or rolls back all of their changes at once.
+"""
+
+import sqlite3 as sqlite
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from backend.utils.env_const import DATABASE
+
+# settings of every new connection (applied once per connection)
+CONNECTION_PRAGMAS = [
+    # wait for locks of other connections instead of failing immediately
+    "PRAGMA busy_timeout = 30000",
+    # use up to 20 MB of page cache per connection
+    "PRAGMA cache_size = -20000",
+    # with the write-ahead log (see db_migration.py) a sync is only needed at checkpoints
+    "PRAGMA synchronous = NORMAL",
+    # keep temporary tables and indexes of sorts and joins in memory
+    "PRAGMA temp_store = MEMORY",
+    # read the database file through up to 256 MB of memory-mapped I/O
+    "PRAGMA mmap_size = 268435456",
+]
+
+# the connection, the transaction depth and the rollback functions of the savepoints of the current thread
+_local = threading.local()
+
+# the path of the database opened by new connections
+_database_path = DATABASE
+
+
+def get_connection() -> sqlite.Connection:
+    """
+    Get the connection of the current thread to the database and open it if necessary
+
+    The connection runs in autocommit mode, therefore single statements outside of a
+    unit of work are committed directly.
+
+    Returns:
+        sqlite.Connection: the connection to the database
+    """
+    con = getattr(_local, "connection", None)
+    if con is None:
+        con = sqlite.connect(_database_path, isolation_level=None)
+        for pragma in CONNECTION_PRAGMAS:
+            con.execute(pragma)
+        _local.connection = con
+        _local.depth = 0
+        _local.rollback_callbacks = []
+
+    return con
+
+
+def close_connection() -> None:
+    """
+    Close the connection of the current thread to the database, if it is open
+    """
+    con = getattr(_local, "connection", None)
+    if con is not None:
+        con.close()
+        _local.connection = None
+        _local.depth = 0
+
+
+def set_database_path(db_path: str) -> str:
+    """
+    Open another database with the new connections, for example a temporary database in the tests
+
+    The connection of the current thread is closed, so its next database operation opens the new database.
+    Open connections of other threads are not changed.
+
+    Args:
+        db_path (str): the path to the database
+
+    Returns:
+        str: the path to the database used before
+    """
+    global _database_path
+
+    close_connection()
+    former_path = _database_path
+    _database_path = db_path
+
+    return former_path
+
+
+def on_rollback(callback: Callable[[], None]) -> None:
+    """
+    Register a function which is called if the running unit of work is rolled back,
+    for example to drop cached data of the rolled back changes
+
+    Inside of a savepoint the function is only called if the changes of the savepoint are rolled back,
+    either by the savepoint itself or by the unit of work. Outside of a unit of work every statement
+    is committed directly, so nothing is registered.
+
+    Args:
+        callback (Callable[[], None]): the function called after the rollback
+    """
+    get_connection()
+    if _local.depth > 0:
+        _local.rollback_callbacks[-1].append(callback)
+
+
+def _rollback(con: sqlite.Connection) -> None:
+    """
+    Roll back the running unit of work and call the registered rollback functions of all its savepoints
+
+    Args:
+        con (sqlite.Connection): the connection of the current thread to the database
+    """
+    con.rollback()
+    for savepoint_callbacks in _local.rollback_callbacks:
+        for callback in savepoint_callbacks:
+            callback()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite.Connection]:
+    """
+    Run the database operations in the block as one unit of work
+
+    The transaction takes the write lock directly (BEGIN IMMEDIATE), so concurrent writers wait
+    for each other instead of failing on the upgrade of a read lock. The changes are committed
+    when the outermost block ends and rolled back if an exception occurs.
+
+    Yields:
+        sqlite.Connection: the connection of the current thread to the database
+    """
+    con = get_connection()
+
+    if _local.depth > 0:
+        # join the unit of work of the outer block
+        _local.depth += 1
+        try:
+            yield con
+        finally:
+            _local.depth -= 1
+        return
+
+    con.execute("BEGIN IMMEDIATE")
+    _local.depth = 1
+    # the rollback functions of the unit of work and of every running savepoint
+    _local.rollback_callbacks = [[]]
+    try:
+        yield con
+    except BaseException:
+        _rollback(con)
+        raise
+    else:
+        try:
+            con.commit()
+        except BaseException:
+            _rollback(con)
+            raise
+    finally:
+        _local.depth = 0
+        _local.rollback_callbacks = []
+
+
+@contextmanager
+def savepoint() -> Iterator[sqlite.Connection]:
+    """
+    Run the database operations in the block in a savepoint of the unit of work
+
+    If an exception occurs, only the changes of the block are rolled back and the exception is raised again,
+    so the caller can handle it and continue with the unit of work. Without a running unit of work
+    the block starts its own one.
+
+    Yields:
+        sqlite.Connection: the connection of the current thread to the database
+    """
+    with transaction() as con:
+        name = f"savepoint_{_local.depth}"
+        con.execute(f"SAVEPOINT {name}")
+        _local.rollback_callbacks.append([])
+        try:
+            yield con
+        except BaseException:
+            con.execute(f"ROLLBACK TO {name}")
+            con.execute(f"RELEASE {name}")
+            # only the changes of this savepoint are rolled back
+            for callback in _local.rollback_callbacks.pop():
+                callback()
+            raise
+        else:
+            con.execute(f"RELEASE {name}")
+            # the released changes are rolled back with the enclosing unit of work
+            savepoint_callbacks = _local.rollback_callbacks.pop()
+            _local.rollback_callbacks[-1].extend(savepoint_callbacks)
@@ -2,26 +2,24 @@
 This module contains the functions to add automations, entities and integrations to the database.
 """
 
-from backend.utils.env_const import DATABASE
-
 from backend.utils.env_helper_classes import Automation
 
+from .db_connection import get_connection, transaction
 from .db_utils import (
-    get_automations_with_same_name,
+    cache_integration_id,
+    get_entity_ids,
     get_integration_id,
-    validate_database_entity,
     update_additional_infos,
 )
 
-from backend.utils.env_helper import is_float_or_int
-
-import sqlite3 as sqlite
-
 
 def _create_automation_in_db(automation_info: Automation):
     """
     create the automation in the database
 
+    The version of the automation is the version of its generated script, so the script versions are
+    the only counter of the versions. Automations without a versioned script get the next version.
+
     Args:
         info: dict - the information about the automation to be added to the database
     """
@@ -31,41 +29,26 @@ def _create_automation_in_db(automation_info: Automation):
     autom_mode: int = automation_info.autom_mode
     max_instances: int = automation_info.max_instances
     script_path: str = automation_info.script
-    version: int = 0
 
-    same_automation_ids = get_automations_with_same_name(a_name)
+    # the latest version is read from the index on (a_name, version)
+    GET_LATEST_VERSION = "SELECT COALESCE(MAX(version), 0) FROM automation WHERE a_name = ?"
 
     INSERT_AUTOMATION = """
-        INSERT INTO automation (a_name, autom_mode, max_instances, script) 
-        VALUES (?, ?, ?, ?)
+        INSERT INTO automation (a_name, autom_mode, max_instances, script, version) 
+        VALUES (?, ?, ?, ?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
 
-        # get the versions of the automations with the same name
-        GET_VERSION = """
-            SELECT add_info.info 
-            FROM additional_information AS add_info 
-            JOIN automation AS autom ON add_info.a_id == autom.a_id 
-            WHERE autom.a_id = ? AND info_type = 'version'
-            """
-
-        autom_id: int = None
-        for autom_id in same_automation_ids:
-            cur.execute(GET_VERSION, (str(autom_id),))
-            answer = cur.fetchone()
-            if answer is not None:
-                curr_version = is_float_or_int(answer[0])
-                if not isinstance(curr_version, str) and curr_version >= version:
-                    version = curr_version
-
-        version += 1
+        version: int = automation_info.version
+        if version is None:
+            cur.execute(GET_LATEST_VERSION, (a_name,))
+            version = cur.fetchone()[0] + 1
 
         # insert the new automation
-        cur.execute(INSERT_AUTOMATION, (a_name, autom_mode, max_instances, script_path))
+        cur.execute(INSERT_AUTOMATION, (a_name, autom_mode, max_instances, script_path, version))
         a_id = cur.lastrowid
-        con.commit()
 
         return a_id, version
 
@@ -74,63 +57,15 @@ def _create_automation_entities_in_db(a_id, entities: list):
     """
     create the entities in the database
 
+    All entities are resolved with the name cache at once and missing entities are inserted together.
+
     Args:
         a_id: int - the id of the automation the entities belong to
         entities: list - the entities to be added to the database
     """
 
-    automation_entities = []
-
-    # go through all entities and add them to the database
-    for entity in entities:
-        # validate the entity and its integration
-        validated_entity = validate_database_entity(entity)
-
-        # if the entity already exists in the database
-        if validated_entity["entity_id"] is not None:
-            automation_entities.append(
-                (
-                    a_id,
-                    validated_entity["entity_id"],
-                    entity.parameter_role,
-                    entity.position,
-                    str(entity.expected_value),
-                    entity.parent,
-                )
-            )
-        # if check for the integration
-        else:
-            # if integration is part of the database
-            if validated_entity["integration_id"] is not None:
-                integration_id = validated_entity["integration_id"]
-
-                # create the new entity in the database
-                with sqlite.connect(DATABASE) as con:
-                    cur = con.cursor()
-
-                    # insert the new entity into the database
-                    INSERT_NEW_ENTITY = (
-                        "INSERT INTO entity (e_name, i_id) VALUES (?, ?)"
-                    )
-
-                    cur.execute(INSERT_NEW_ENTITY, (entity.entity_name, integration_id))
-                    e_id = cur.lastrowid
-                    con.commit()
-                    # add the new entity to the list to connect it to the automation in automation_entity
-                    automation_entities.append(
-                        (
-                            a_id,
-                            e_id,
-                            entity.parameter_role,
-                            entity.position,
-                            str(entity.expected_value),
-                            entity.parent,
-                        )
-                    )
-            else:
-                raise ValueError(
-                    f"Integration: '{entity.integration}' not found in the database. Please add the integration first."
-                )
+    # insert the new entity into the database
+    INSERT_NEW_ENTITY = "INSERT INTO entity (e_name, i_id) VALUES (?, ?)"
 
     # insert the entities as automation entities into the database
     CREATE_AUTOMATION_ENTITY = """
@@ -138,15 +73,46 @@ def _create_automation_entities_in_db(a_id, entities: list):
         VALUES (?, ?, ?, ?, ?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
+
+        entity_ids = get_entity_ids([entity.entity_name for entity in entities])
+
+        # check the integrations of the entities which are not part of the database
+        new_entities = {}
+        for entity in entities:
+            if entity.entity_name in entity_ids or entity.entity_name in new_entities:
+                continue
+
+            integration_id = get_integration_id(entity.integration)
+            if integration_id is None:
+                raise ValueError(
+                    f"Integration: '{entity.integration}' not found in the database. Please add the integration first."
+                )
+            new_entities[entity.entity_name] = integration_id
+
+        # create the new entities in the database
+        if new_entities != {}:
+            cur.executemany(INSERT_NEW_ENTITY, new_entities.items())
+            entity_ids.update(get_entity_ids(list(new_entities)))
+
+        automation_entities = [
+            (
+                a_id,
+                entity_ids[entity.entity_name],
+                entity.parameter_role,
+                entity.position,
+                str(entity.expected_value),
+                entity.parent,
+            )
+            for entity in entities
+        ]
         cur.executemany(CREATE_AUTOMATION_ENTITY, automation_entities)
-        con.commit()
 
 
 def add_automation(automation_data: dict) -> int:
     """
-    add the whole automation config to the database
+    add the whole automation config to the database in one transaction
 
     Args:
         automation: dict - the automation config to be added to the database
@@ -154,11 +120,12 @@ def add_automation(automation_data: dict) -> int:
     Returns:
         int - the id of the new automation in the database
     """
-    a_id, version = _create_automation_in_db(automation_data["infos"])
-    try:
-        _create_automation_entities_in_db(a_id, automation_data["entities"])
-    except ValueError as e:
-        raise e
+    with transaction():
+        a_id, version = _create_automation_in_db(automation_data["infos"])
+        try:
+            _create_automation_entities_in_db(a_id, automation_data["entities"])
+        except ValueError as e:
+            raise e
     return a_id, version
 
 
@@ -176,7 +143,7 @@ def add_additional_info(a_id: int, infos: list = []):
         update_additional_infos(automation_id=a_id, add_infos=infos)
 
     # ensure that the project and version info is added to the database regardless of the user input
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
 
         CHECK_INFOS = "SELECT info_type FROM additional_information WHERE a_id = ?"
@@ -192,11 +159,9 @@ def add_additional_info(a_id: int, infos: list = []):
 
         if ("project",) not in result:
             cur.execute(ADD_INFOS, (a_id, "project", "uncategorized"))
-            con.commit()
 
         if ("version",) not in result:
             cur.execute(ADD_INFOS, (a_id, "version", "unknown"))
-            con.commit()
 
 
 def add_integration(
@@ -222,13 +187,13 @@ def add_integration(
             WHERE property = ? AND p_value = ?
             """
 
-        with sqlite.connect(DATABASE) as con:
-            cur = con.cursor()
-            cur.execute(SELECT_POS_VAL, (property, pos_val))
-            if cur.fetchone() is None:
-                return None
-            else:
-                return cur.fetchone()[0]
+        con = get_connection()
+        cur = con.cursor()
+        cur.execute(SELECT_POS_VAL, (property, pos_val))
+        if cur.fetchone() is None:
+            return None
+        else:
+            return cur.fetchone()[0]
 
     # check if the integration already exists in the database
     if get_integration_id(integration_name) is not None and not force_overwrite:
@@ -251,22 +216,23 @@ def add_integration(
                 VALUES (?, ?)
                 """
 
-            with sqlite.connect(DATABASE) as con:
+            with transaction() as con:
                 cur = con.cursor()
                 cur.execute(INSERT_POS_VAL, (value[0], value[1]))
                 pv_id = cur.lastrowid
-                con.commit()
 
             # add the new possible value id to the list to connect it to the new integration in integration_values
             possible_value_ids.append(pv_id)
 
     # add the new integration to the database
     INSERT_NEW_INTEGRATION = "INSERT INTO integration (i_name) VALUES (?)"
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
-        cur.execute(INSERT_NEW_INTEGRATION, (integration_name))
+        cur.execute(INSERT_NEW_INTEGRATION, (integration_name,))
         i_id = cur.lastrowid
-        con.commit()
+
+    # keep the name cache consistent, an overwritten integration is replaced by the new one
+    cache_integration_id(integration_name, i_id)
 
     # connect the new integration with its possible values
     INSERT_INTEGRATION_VALUES = """
@@ -274,7 +240,6 @@ def add_integration(
         VALUES (?, ?)
     """
     integration_values = [(i_id, pv_id) for pv_id in possible_value_ids]
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.executemany(INSERT_INTEGRATION_VALUES, integration_values)
-        con.commit()
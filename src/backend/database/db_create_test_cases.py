@@ -2,9 +2,15 @@
 This module contains the functions to create test cases and test case collections in the database.
 """
 
-from backend.utils.env_const import DATABASE
+import hashlib
+import json
+from collections.abc import Iterable
 
-import sqlite3 as sqlite
+from .db_connection import transaction
+from .db_utils import MAX_QUERY_PARAMETERS, _split_into_chunks
+
+# number of input hashes per query, the automation id is the remaining parameter
+MAX_HASHES_PER_QUERY = MAX_QUERY_PARAMETERS - 1
 
 
 def create_test_case(
@@ -27,10 +33,9 @@ def create_test_case(
         VALUES (?, ?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.execute(CREATE_TEST_CASE, (automation_id, requirement, case_prio))
-        con.commit()
         return cur.lastrowid
 
 
@@ -57,17 +62,254 @@ def create_test_case_input(
         VALUES (?, ?, ?, ?, ?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.execute(
             CREATE_TEST_CASE_INPUT,
             (test_value, test_case_id, a_id, e_id, p_role, position),
         )
-        con.commit()
 
         return cur.lastrowid
 
 
+def _get_last_id(cur, table: str, id_column: str) -> int:
+    """
+    Get the last used id of a table with an autoincrement primary key
+
+    Args:
+        cur (sqlite.Cursor): the cursor of the running transaction
+        table (str): the name of the table
+        id_column (str): the name of the primary key column
+
+    Returns:
+        int: the highest id which was ever used in the table
+    """
+    GET_LAST_ID = f"""
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = ?), 0),
+            COALESCE((SELECT MAX({id_column}) FROM {table}), 0)
+        )
+        """
+
+    cur.execute(GET_LAST_ID, (table,))
+    return cur.fetchone()[0]
+
+
+def get_input_hash(case_inputs: Iterable) -> str:
+    """
+    Get the hash of the canonical input vector of a test case
+
+    The inputs are ordered by their parameter role, position and entity and integral floats are stored
+    as integers, so the same input vector always has the same hash.
+
+    Args:
+        case_inputs (Iterable): the test case inputs as tuples (test_value, e_id, p_role, position)
+
+    Returns:
+        str: the sha256 hash of the canonical input vector
+    """
+    canonical_inputs = []
+    for test_value, e_id, p_role, position in case_inputs:
+        if isinstance(test_value, float) and test_value.is_integer():
+            test_value = int(test_value)
+        canonical_inputs.append([p_role, position, e_id, test_value])
+
+    canonical_inputs.sort(key=lambda case_input: (case_input[:3], json.dumps(case_input[3], default=str)))
+    canonical_vector = json.dumps(canonical_inputs, sort_keys=True, separators=(",", ":"), default=str)
+
+    return hashlib.sha256(canonical_vector.encode("utf-8")).hexdigest()
+
+
+def add_missing_input_hashes(automation_id: int) -> None:
+    """
+    Add the input hashes to the test cases of the automation created without a hash
+
+    Test cases with the input vector of another test case keep no hash, as the input vector
+    is already stored. Callers inserting several chunks of test cases in one transaction
+    only have to add the missing hashes once before the first chunk.
+
+    Args:
+        automation_id (int): the id of the automation
+    """
+    GET_CASES_WITHOUT_HASH = """
+        SELECT tc.case_id, tci.test_value, tci.e_id, tci.p_role, tci.position
+        FROM test_case AS tc
+        LEFT JOIN test_case_input AS tci ON tci.case_id = tc.case_id
+        WHERE tc.a_id = ? AND tc.input_hash IS NULL
+        ORDER BY tc.case_id, tci.case_input_id
+        """
+
+    SET_HASH = "UPDATE test_case SET input_hash = ? WHERE case_id = ?"
+
+    with transaction() as con:
+        cur = con.cursor()
+        cur.execute(GET_CASES_WITHOUT_HASH, (automation_id,))
+        case_inputs = {}
+        for case_id, test_value, e_id, p_role, position in cur.fetchall():
+            inputs = case_inputs.setdefault(case_id, [])
+            if e_id is not None:
+                inputs.append((test_value, e_id, p_role, position))
+
+        if case_inputs == {}:
+            return
+
+        case_hashes = {case_id: get_input_hash(inputs) for case_id, inputs in case_inputs.items()}
+        stored_hashes = _get_stored_hashes(cur, automation_id, list(case_hashes.values()))
+
+        for case_id, input_hash in case_hashes.items():
+            if input_hash not in stored_hashes:
+                cur.execute(SET_HASH, (input_hash, case_id))
+                stored_hashes[input_hash] = case_id
+
+
+def _get_stored_hashes(cur, automation_id: int, input_hashes: list) -> dict:
+    """
+    Get the test cases of the automation with one of the input hashes
+
+    Args:
+        cur (sqlite.Cursor): the cursor of the running transaction
+        automation_id (int): the id of the automation
+        input_hashes (list): the input hashes to look up
+
+    Returns:
+        dict: the ids of the test cases by their input hash
+    """
+    stored_hashes = {}
+    for chunk in _split_into_chunks(list(set(input_hashes)), MAX_HASHES_PER_QUERY):
+        GET_HASHES = f"""
+            SELECT input_hash, case_id
+            FROM test_case
+            WHERE a_id = ? AND input_hash IN ({", ".join("?" * len(chunk))})
+            """
+        cur.execute(GET_HASHES, [automation_id] + chunk)
+        stored_hashes.update(cur.fetchall())
+
+    return stored_hashes
+
+
+def _get_stored_input_ids(cur, case_ids: list) -> dict:
+    """
+    Get the ids of the inputs of the stored test cases
+
+    Args:
+        cur (sqlite.Cursor): the cursor of the running transaction
+        case_ids (list): the ids of the test cases
+
+    Returns:
+        dict: the input ids of the test cases as a list by their test case id
+    """
+    stored_input_ids = {case_id: [] for case_id in case_ids}
+    for chunk in _split_into_chunks(list(stored_input_ids), MAX_QUERY_PARAMETERS):
+        GET_INPUT_IDS = f"""
+            SELECT case_id, case_input_id
+            FROM test_case_input
+            WHERE case_id IN ({", ".join("?" * len(chunk))})
+            ORDER BY case_input_id
+            """
+        cur.execute(GET_INPUT_IDS, chunk)
+        for case_id, case_input_id in cur.fetchall():
+            stored_input_ids[case_id].append(case_input_id)
+
+    return stored_input_ids
+
+
+def create_test_cases_bulk(
+    automation_id: int, test_cases: list, add_missing_hashes: bool = True, stats: dict = None
+) -> list:
+    """
+    Create multiple test cases with their inputs in one transaction
+
+    The ids of the test cases and their inputs are reserved at the start of the transaction,
+    so all rows can be inserted with `executemany` without reading back every new id.
+    Test cases with an input vector, which is already stored for the automation, are not created again,
+    the stored test case is returned for them instead.
+
+    Args:
+        automation_id (int): the id of the automation
+        test_cases (list): the test cases as dictionaries with the keys "requirement", "priority" and "inputs",
+            the inputs are tuples (test_value, a_id, e_id, p_role, position)
+        add_missing_hashes (bool, optional): whether the hashes of test cases created without a hash are added
+            first. Defaults to True, False if they were already added in the running transaction.
+        stats (dict, optional): the counters "created", "skipped" and "inputs" of the created and the already
+            stored test cases and the created inputs, which are increased by this insertion. Defaults to None.
+
+    Returns:
+        list: the test cases as dictionaries with the test case id and the input ids as a list
+        in the order of the given test cases
+    """
+
+    CREATE_TEST_CASE = """
+        INSERT INTO test_case (case_id, a_id, requirement, case_priority, input_hash)
+        VALUES (?, ?, ?, ?, ?)
+        """
+
+    CREATE_TEST_CASE_INPUT = """
+        INSERT INTO test_case_input (case_input_id, test_value, case_id, a_id, e_id, p_role, position)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+
+    test_case_ids = []
+    input_ids_by_case = {}
+
+    with transaction() as con:
+        cur = con.cursor()
+        if add_missing_hashes:
+            add_missing_input_hashes(automation_id)
+
+        input_hashes = [
+            get_input_hash(
+                (test_value, e_id, p_role, position)
+                for test_value, _, e_id, p_role, position in test_case["inputs"]
+            )
+            for test_case in test_cases
+        ]
+        stored_hashes = _get_stored_hashes(cur, automation_id, input_hashes)
+
+        case_id = _get_last_id(cur, "test_case", "case_id")
+        case_input_id = _get_last_id(cur, "test_case_input", "case_input_id")
+
+        case_rows = []
+        input_rows = []
+        for test_case, input_hash in zip(test_cases, input_hashes):
+            # the input vector is already stored for the automation
+            if input_hash in stored_hashes:
+                test_case_ids.append(stored_hashes[input_hash])
+                continue
+
+            case_id += 1
+            stored_hashes[input_hash] = case_id
+            test_case_ids.append(case_id)
+            case_rows.append(
+                (case_id, automation_id, test_case["requirement"], test_case["priority"], input_hash)
+            )
+
+            input_ids = []
+            for test_value, a_id, e_id, p_role, position in test_case["inputs"]:
+                case_input_id += 1
+                input_rows.append(
+                    (case_input_id, test_value, case_id, a_id, e_id, p_role, position)
+                )
+                input_ids.append(case_input_id)
+
+            input_ids_by_case[case_id] = input_ids
+
+        cur.executemany(CREATE_TEST_CASE, case_rows)
+        cur.executemany(CREATE_TEST_CASE_INPUT, input_rows)
+
+        stored_case_ids = [case_id for case_id in test_case_ids if case_id not in input_ids_by_case]
+        if stored_case_ids != []:
+            input_ids_by_case.update(_get_stored_input_ids(cur, stored_case_ids))
+
+    if stats is not None:
+        stats["created"] = stats.get("created", 0) + len(case_rows)
+        stats["skipped"] = stats.get("skipped", 0) + len(test_cases) - len(case_rows)
+        stats["inputs"] = stats.get("inputs", 0) + len(input_rows)
+
+    return [
+        {"test_case_id": case_id, "input_ids": input_ids_by_case[case_id]} for case_id in test_case_ids
+    ]
+
+
 def create_test_case_collection(name: str, a_id: int) -> int:
     """
     Create a test case collection in the database for the automation
@@ -85,10 +327,9 @@ def create_test_case_collection(name: str, a_id: int) -> int:
         VALUES (?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.execute(CREATE_CASE_COLLECTION, (name, a_id))
-        con.commit()
 
         return cur.lastrowid
 
@@ -107,7 +348,6 @@ def add_test_case_2_collection(test_case_id: int, case_collection_id: int):
         VALUES (?, ?)
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.execute(ADD_CASE_2_COLLECTION, (case_collection_id, test_case_id))
-        con.commit()
@@ -0,0 +1,145 @@
+"""
+This module contains the migration of the database schema.
+
+The applied version of the schema is stored in the table `schema_version`. The first version is the
+schema of `schema/database_creation.sql`, every following version is a script `<version>_<name>.sql`
+in `schema/migrations`. Missing versions are applied in their order, each in its own transaction,
+so a database of any former version can be brought to the latest version.
+"""
+
+import re
+import sqlite3 as sqlite
+from collections.abc import Iterator
+from os import listdir, path
+
+from backend.utils.env_const import DATABASE, INIT_FILE, MIGRATION_PATH
+
+# version of the schema created by INIT_FILE
+BASE_VERSION = 1
+
+# file names of the migration scripts (<version>_<name>.sql)
+MIGRATION_FILE = re.compile(r"^(\d+)_\w+\.sql$")
+
+CREATE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        applied TEXT NOT NULL DEFAULT current_timestamp
+    )
+    """
+
+
+def get_migrations() -> list:
+    """
+    Get the scripts of all schema versions in their order
+
+    Returns:
+        list - the versions with the paths of their sql scripts as tuples (version, script_path)
+    """
+    migrations = [(BASE_VERSION, INIT_FILE)]
+
+    for file in listdir(MIGRATION_PATH):
+        match = MIGRATION_FILE.match(file)
+        if match is not None:
+            migrations.append((int(match.group(1)), path.join(MIGRATION_PATH, file)))
+
+    migrations.sort()
+
+    versions = [migration[0] for migration in migrations]
+    if len(set(versions)) != len(versions) or versions[0] != BASE_VERSION:
+        raise ValueError(f"The migration versions {versions} are not unique or below the base version")
+
+    return migrations
+
+
+def _split_statements(script: str) -> Iterator[str]:
+    """
+    Split a sql script into its single statements
+
+    In contrast to `executescript` the statements can then be run inside of a transaction.
+
+    Args:
+        script: str - the sql script
+
+    Yields:
+        str - the complete statements of the script
+    """
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite.complete_statement(statement):
+            yield statement
+            statement = ""
+
+    if statement.strip() != "":
+        yield statement
+
+
+def _get_schema_version(cur: sqlite.Cursor) -> int:
+    """
+    Get the applied schema version of the database
+
+    Databases created before the versioning only contain the tables of the base version.
+
+    Args:
+        cur: sqlite.Cursor - the cursor of the running transaction
+
+    Returns:
+        int - the applied schema version, 0 for an empty database
+    """
+    cur.execute("SELECT MAX(version) FROM schema_version")
+    version = cur.fetchone()[0]
+    if version is not None:
+        return version
+
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'automation'")
+    if cur.fetchone() is not None:
+        # database created before the versioning
+        return BASE_VERSION
+
+    return 0
+
+
+def migrate_database(db_path: str = DATABASE) -> int:
+    """
+    Apply all missing schema versions to the database and switch it to the write-ahead log
+
+    With the write-ahead log readers are not blocked by a running write transaction,
+    so the frontend can read while test results are written in the background.
+
+    Args:
+        db_path: str - the path to the database. Defaults to DATABASE.
+
+    Returns:
+        int - the schema version of the database after the migration
+    """
+    INSERT_VERSION = "INSERT OR IGNORE INTO schema_version (version) VALUES (?)"
+
+    con = sqlite.connect(db_path, timeout=30, isolation_level=None)
+    try:
+        cur = con.cursor()
+        # the journal mode is stored in the database file and can not be changed inside a transaction
+        cur.execute("PRAGMA journal_mode = WAL")
+        cur.execute(CREATE_VERSION_TABLE)
+
+        for version, script_path in get_migrations():
+            # lock the database, so concurrent processes do not apply the same migration
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                current_version = _get_schema_version(cur)
+                if version > current_version:
+                    with open(script_path) as script_file:
+                        script = script_file.read()
+                    for statement in _split_statements(script):
+                        cur.execute(statement)
+                    current_version = version
+
+                cur.execute(INSERT_VERSION, (current_version,))
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+        cur.execute("SELECT MAX(version) FROM schema_version")
+        return cur.fetchone()[0]
+    finally:
+        con.close()
@@ -0,0 +1,310 @@
+"""
+This module contains the functions to save the results of test executions in the database.
+
+The results are collected in a result sink and written in batches, so that a large test run
+does not need a separate commit for every single test case.
+"""
+
+import json
+
+from backend.utils.env_const import OUTPUT
+
+from .db_connection import get_connection, transaction
+
+# information of the automation results without action outputs
+RESULT_ERROR_TYPES = ["AutomationResult", "ValueError", "ScriptError"]
+
+
+def _parse_result(result) -> list:
+    """
+    Parse the result of an automation run into the printed json objects
+
+    Args:
+        result (str | list | dict): the result of the automation as printed output or as parsed json
+
+    Returns:
+        list: the json objects of the result
+    """
+    if not isinstance(result, str):
+        return [result]
+
+    result_objects = []
+    for line in result.splitlines():
+        if line.strip() == "":
+            continue
+        try:
+            result_objects.append(json.loads(line))
+        except json.JSONDecodeError:
+            # output which is not created by the automation script itself
+            result_objects.append({"ScriptError": line})
+
+    return result_objects
+
+
+def _get_output_entities(automation_id: int) -> dict:
+    """
+    Get the output entities of the automation by their entity name
+
+    Args:
+        automation_id (int): the id of the automation
+
+    Returns:
+        dict: the lists of (e_id, p_role, position) tuples of the output entities by their names
+    """
+    GET_OUTPUT_ENTITIES = """
+        SELECT e.e_name, ae.e_id, ae.p_role, ae.position
+        FROM automation_entity AS ae
+        JOIN entity AS e ON e.e_id = ae.e_id
+        WHERE ae.a_id = ? AND ae.p_role = ?
+        ORDER BY ae.position
+        """
+
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_OUTPUT_ENTITIES, (automation_id, OUTPUT))
+    result = cur.fetchall()
+
+    output_entities = {}
+    for row in result:
+        output_entities.setdefault(row[0], []).append((row[1], row[2], row[3]))
+
+    return output_entities
+
+
+class ExecutionResultSink:
+    """
+    Class to collect the results of a test execution and write them in batches to the database.
+
+    Every batch of results is written with one transaction into the tables `test_execution`
+    and `test_execution_output`.
+    """
+
+    automation_id: int = None
+    exec_mode: str = None
+    exec_group: int = None
+    batch_size: int = None
+
+    def __init__(
+        self,
+        automation_id: int,
+        exec_mode: str,
+        batch_size: int = 1000,
+        exec_group: int = None,
+    ):
+        """
+        Create the result sink for the test execution of an automation.
+
+        Args:
+            automation_id (int): the id of the tested automation
+            exec_mode (str): the mode of the test execution (for example "distinct" or "simultaneous")
+            batch_size (int, optional): the number of results written in one transaction. Defaults to 1000.
+            exec_group (int, optional): the group of the test execution. Defaults to a new group,
+            which is reserved with the first written batch.
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1")
+
+        self.automation_id = automation_id
+        self.exec_mode = exec_mode
+        self.batch_size = batch_size
+        self.exec_group = exec_group
+
+        self._output_entities = _get_output_entities(automation_id)
+        self._results = []
+
+    def add(self, result: dict) -> None:
+        """
+        Add the result of a test case and write the collected results if the batch is full.
+
+        Args:
+            result (dict): the result of the test case with the keys "testcase" and "result"
+        """
+        self._results.append(result)
+
+        if len(self._results) >= self.batch_size:
+            self.flush()
+
+    def add_all(self, results) -> None:
+        """
+        Add the results of multiple test cases.
+
+        Args:
+            results (Iterable): the results of the test cases with the keys "testcase" and "result"
+        """
+        for result in results:
+            self.add(result)
+
+    def _create_output_rows(self, te_id: int, result_objects: list) -> tuple:
+        """
+        Create the output rows and the error information of a test execution.
+
+        Args:
+            te_id (int): the id of the test execution
+            result_objects (list): the json objects of the automation result
+
+        Returns:
+            tuple: the error type, the error comment and the output rows of the test execution
+        """
+        error_type = None
+        error_comment = None
+        output_rows = []
+        used_positions = {}
+
+        for result_object in result_objects:
+            if isinstance(result_object, dict):
+                result_object = [result_object]
+
+            for output in result_object:
+                if not isinstance(output, dict):
+                    continue
+
+                for key, value in output.items():
+                    if key in RESULT_ERROR_TYPES:
+                        # only the first error is saved, since following messages are caused by it
+                        if error_type is None:
+                            error_type = key
+                            error_comment = str(value)
+                        continue
+
+                    # assign the outputs of the same entity to its positions in order
+                    positions = self._output_entities.get(key, [])
+                    used = used_positions.get(key, 0)
+                    if used >= len(positions):
+                        continue
+                    used_positions[key] = used + 1
+
+                    e_id, p_role, position = positions[used]
+                    output_rows.append(
+                        (str(value), te_id, self.automation_id, e_id, p_role, position)
+                    )
+
+        return error_type, error_comment, output_rows
+
+    def flush(self) -> None:
+        """
+        Write the collected results with one transaction into the database.
+        """
+        if self._results == []:
+            return
+
+        INSERT_EXECUTION = """
+            INSERT INTO test_execution (te_id, exec_mode, exec_group, error_type, error_comment, case_id, a_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """
+
+        INSERT_EXECUTION_OUTPUT = """
+            INSERT INTO test_execution_output (output_val, te_id, a_id, e_id, p_role, position)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """
+
+        # reserve the ids of the executions, so they do not have to be read back row by row
+        with transaction() as con:
+            if self.exec_group is None:
+                # read in the same transaction as the ids, so concurrent sinks get different groups
+                self.exec_group = get_next_execution_group()
+
+            cur = con.cursor()
+            cur.execute("SELECT COALESCE(MAX(te_id), 0) FROM test_execution")
+            te_id = cur.fetchone()[0]
+
+            execution_rows = []
+            output_rows = []
+            for result in self._results:
+                te_id += 1
+                error_type, error_comment, outputs = self._create_output_rows(
+                    te_id, _parse_result(result["result"])
+                )
+                execution_rows.append(
+                    (
+                        te_id,
+                        self.exec_mode,
+                        self.exec_group,
+                        error_type,
+                        error_comment,
+                        result["testcase"],
+                        self.automation_id,
+                    )
+                )
+                output_rows += outputs
+
+            cur.executemany(INSERT_EXECUTION, execution_rows)
+            cur.executemany(INSERT_EXECUTION_OUTPUT, output_rows)
+
+        self._results = []
+
+    def close(self) -> None:
+        """
+        Write the remaining results into the database.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def get_next_execution_group() -> int:
+    """
+    Get the next free group id for a test execution
+
+    Returns:
+        int: the next group id
+    """
+    GET_MAX_GROUP = "SELECT COALESCE(MAX(exec_group), 0) FROM test_execution"
+
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_MAX_GROUP)
+    result = cur.fetchone()
+
+    return result[0] + 1
+
+
+def load_test_executions(automation_id: int, exec_group: int = None) -> list:
+    """
+    Load the test executions of the automation with their outputs
+
+    Args:
+        automation_id (int): the id of the automation
+        exec_group (int, optional): the group of the test execution. Defaults to all groups.
+
+    Returns:
+        list: the test executions as dictionaries with the keys "te_id", "timestamp", "exec_mode",
+        "exec_group", "error_type", "error_comment", "case_id" and "outputs"
+    """
+    GET_EXECUTIONS = """
+        SELECT te.te_id, te.ex_timestamp, te.exec_mode, te.exec_group, te.error_type, te.error_comment,
+            te.case_id, e.e_name, teo.output_val
+        FROM test_execution AS te
+        LEFT JOIN test_execution_output AS teo ON teo.te_id = te.te_id
+        LEFT JOIN entity AS e ON e.e_id = teo.e_id
+        WHERE te.a_id = ? AND (? IS NULL OR te.exec_group = ?)
+        ORDER BY te.te_id, teo.teo_id
+        """
+
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_EXECUTIONS, (automation_id, exec_group, exec_group))
+    result = cur.fetchall()
+
+    executions = []
+    for row in result:
+        if executions == [] or executions[-1]["te_id"] != row[0]:
+            executions.append(
+                {
+                    "te_id": row[0],
+                    "timestamp": row[1],
+                    "exec_mode": row[2],
+                    "exec_group": row[3],
+                    "error_type": row[4],
+                    "error_comment": row[5],
+                    "case_id": row[6],
+                    "outputs": [],
+                }
+            )
+        if row[7] is not None:
+            executions[-1]["outputs"].append({"e_name": row[7], "output_val": row[8]})
+
+    return executions
@@ -1,9 +1,13 @@
-from backend.utils.env_const import DATABASE, standard_integrations
+import threading
+from collections.abc import Iterator
 
-import sqlite3 as sqlite
+from backend.utils.env_const import standard_integrations
 
+from backend.utils.env_helper import is_float_or_int
 from backend.utils.env_helper_classes import Automation, Entity
 
+from .db_connection import get_connection, on_rollback, transaction
+
 # possible values for the entities which need further specification for testing
 specification_p_values = [
     "string",
@@ -19,6 +23,126 @@ specification_p_values = [
     "datetime",
 ]
 
+# maximum number of parameters in one query (the limit of older sqlite versions)
+MAX_QUERY_PARAMETERS = 999
+
+# ids of the entities and integrations by their names, loaded once per thread with one query per table
+# (every thread has its own connection, so it only caches the rows visible to its own unit of work)
+_name_caches = threading.local()
+
+
+def _split_into_chunks(values: list, chunk_size: int = MAX_QUERY_PARAMETERS) -> Iterator[list]:
+    """
+    Split the values into chunks which fit into the parameters of one query
+
+    Args:
+        values: list - the values for the query parameters
+        chunk_size: int - the maximum number of values per chunk
+
+    Yields:
+        list - the chunks of the values
+    """
+    for start in range(0, len(values), chunk_size):
+        yield values[start : start + chunk_size]
+
+
+def clear_name_caches():
+    """
+    Clear the cached ids of the entities and integrations of the current thread,
+    they are loaded again on the next use
+    """
+    _name_caches.entity_ids = {}
+    _name_caches.integration_ids = {}
+    _name_caches.loaded = False
+
+
+def _load_name_caches():
+    """
+    Load the ids of all entities and integrations into the caches of the current thread if they are not loaded yet
+    """
+    if getattr(_name_caches, "loaded", False):
+        return
+
+    # the first entity and the latest integration with the same name are used
+    GET_ENTITY_IDS = "SELECT e_name, MIN(e_id) FROM entity GROUP BY e_name"
+    GET_INTEGRATION_IDS = "SELECT i_name, MAX(i_id) FROM integration GROUP BY i_name"
+
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_ENTITY_IDS)
+    _name_caches.entity_ids = dict(cur.fetchall())
+    cur.execute(GET_INTEGRATION_IDS)
+    _name_caches.integration_ids = dict(cur.fetchall())
+
+    _name_caches.loaded = True
+    # uncommitted rows of a unit of work may be part of the loaded ids
+    on_rollback(clear_name_caches)
+
+
+def cache_entity_ids(entity_ids: dict):
+    """
+    Add the ids of new entities to the cache
+
+    If the entities are created in a unit of work, the cache is cleared when it is rolled back.
+
+    Args:
+        entity_ids: dict - the ids of the new entities by their names
+    """
+    # an unloaded cache reads the new entities with all others on its first use
+    if getattr(_name_caches, "loaded", False):
+        _name_caches.entity_ids.update(entity_ids)
+    on_rollback(clear_name_caches)
+
+
+def cache_integration_id(integration_name: str, integration_id: int):
+    """
+    Add the id of a new integration to the cache
+
+    If the integration is created in a unit of work, the cache is cleared when it is rolled back.
+
+    Args:
+        integration_name: str - the name of the new integration
+        integration_id: int - the id of the new integration
+    """
+    if getattr(_name_caches, "loaded", False):
+        _name_caches.integration_ids[integration_name] = integration_id
+    on_rollback(clear_name_caches)
+
+
+def get_entity_ids(entity_names: list) -> dict:
+    """
+    Get the ids of the entities by their names
+
+    The ids are taken from the cache, only names which are not cached are searched in the database,
+    for example entities created by another process.
+
+    Args:
+        entity_names: list - the names of the entities
+
+    Returns:
+        dict - the ids of the entities by their names, names of not existing entities are missing
+    """
+    _load_name_caches()
+    entity_ids = _name_caches.entity_ids
+
+    missing_names = list(dict.fromkeys(name for name in entity_names if name not in entity_ids))
+
+    if missing_names != []:
+        con = get_connection()
+        cur = con.cursor()
+        for chunk in _split_into_chunks(missing_names):
+            SEARCH_ENTITIES = f"""
+                SELECT e_name, MIN(e_id)
+                FROM entity
+                WHERE e_name IN ({", ".join("?" * len(chunk))})
+                GROUP BY e_name
+                """
+            cur.execute(SEARCH_ENTITIES, chunk)
+            entity_ids.update(cur.fetchall())
+        on_rollback(clear_name_caches)
+
+    return {name: entity_ids[name] for name in entity_names if name in entity_ids}
+
 
 def get_automations_with_same_name(name: str) -> list:
     """
@@ -34,12 +158,12 @@ def get_automations_with_same_name(name: str) -> list:
     same_name_ids = []
 
     SELECT_AUTOMATION = "SELECT a_id FROM automation WHERE a_name = ?"
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(SELECT_AUTOMATION, (name,))
-        result = cur.fetchall()
-        if result:
-            same_name_ids = [row[0] for row in result]
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(SELECT_AUTOMATION, (name,))
+    result = cur.fetchall()
+    if result:
+        same_name_ids = [row[0] for row in result]
 
     return same_name_ids
 
@@ -57,14 +181,19 @@ def get_integration_id(integration_name: str) -> int:
     # get the id of the integration of the entity
     integration_id = standard_integrations.get(integration_name)
 
-    # if the integration is not in the standard integrations, search for it in the database
+    # if the integration is not in the standard integrations, search for it in the cache and the database
+    if integration_id is None:
+        _load_name_caches()
+        integration_id = _name_caches.integration_ids.get(integration_name)
+
     if integration_id is None:
-        SEARCH_INTEGRATION = "SELECT i_id FROM integration WHERE i_name = (?)"
-        with sqlite.connect(DATABASE) as con:
-            cur = con.cursor()
-            cur.execute(SEARCH_INTEGRATION, (integration_name,))
-            if cur.fetchone() is not None:
-                integration_id = cur.fetchone()[0]
+        SEARCH_INTEGRATION = "SELECT MAX(i_id) FROM integration WHERE i_name = (?)"
+        con = get_connection()
+        cur = con.cursor()
+        cur.execute(SEARCH_INTEGRATION, (integration_name,))
+        integration_id = cur.fetchone()[0]
+        if integration_id is not None:
+            cache_integration_id(integration_name, integration_id)
 
     return integration_id
 
@@ -80,30 +209,17 @@ def validate_database_entity(entity: Entity) -> dict:
         bool: True if all integrations are valid, False otherwise
     """
 
-    SELECT_ENTITY = "SELECT e_id FROM entity WHERE e_name = ?"
-
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(SELECT_ENTITY, (entity.entity_name,))
-        result = cur.fetchone()
-        if result is None:
-            same_entity = None
-        else:
-            same_entity = result[0]
+    same_entity = get_entity_ids([entity.entity_name]).get(entity.entity_name)
 
     if same_entity is not None:
         return {"entity_id": same_entity}
     else:
         return_dict = {"entity_id": None}
 
-        # create the new entity in the database
-        with sqlite.connect(DATABASE) as con:
-            cur = con.cursor()
-
-            # get the integration id of the entity
-            integration_id = get_integration_id(entity.integration)
-            return_dict["integration_id"] = integration_id
-            return return_dict
+        # get the integration id of the entity
+        integration_id = get_integration_id(entity.integration)
+        return_dict["integration_id"] = integration_id
+        return return_dict
 
 
 def delete_automation(automation_id: int = None):
@@ -120,7 +236,7 @@ def delete_automation(automation_id: int = None):
         DELETE_AUTOMATION = "DELETE FROM automation WHERE a_id = ?;"
         DELETE_AUTOMATION_ENTITIES = "DELETE FROM automation_entity WHERE a_id = ?;"
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         if automation_id is None:
             cur.execute(DELETE_AUTOMATION)
@@ -128,7 +244,6 @@ def delete_automation(automation_id: int = None):
         else:
             cur.execute(DELETE_AUTOMATION, (automation_id,))
             cur.execute(DELETE_AUTOMATION_ENTITIES, (automation_id,))
-        con.commit()
 
     # remove the autoamtion script from the file system
     # if path.exists(file):
@@ -164,10 +279,10 @@ def get_entities(automation_id: int = None, automation_name: str = None) -> list
             """
         search_param = (automation_name,)
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(SELECT_ENTITIES, search_param)
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(SELECT_ENTITIES, search_param)
+    result = cur.fetchall()
 
     return result
 
@@ -185,10 +300,10 @@ def load_projects() -> list:
         WHERE info_type = 'project'
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(SELECT_PROJECTS)
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(SELECT_PROJECTS)
+    result = cur.fetchall()
 
     return [row[0] for row in result]
 
@@ -209,13 +324,13 @@ def load_automations(project: str = None) -> list:
         ORDER BY automation.created DESC
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        if project is not None:
-            cur.execute(SELECT_AUTOMATIONS, (project,))
-        else:
-            cur.execute(SELECT_AUTOMATIONS, ("uncategorized",))
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    if project is not None:
+        cur.execute(SELECT_AUTOMATIONS, (project,))
+    else:
+        cur.execute(SELECT_AUTOMATIONS, ("uncategorized",))
+    result = cur.fetchall()
 
     return [(row[0], row[1], row[2]) for row in result]
 
@@ -229,10 +344,10 @@ def load_integrations() -> list:
     """
     SELECT_INTEGRATIONS = "SELECT i_name FROM integration"
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(SELECT_INTEGRATIONS)
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(SELECT_INTEGRATIONS)
+    result = cur.fetchall()
 
     return [row[0] for row in result]
 
@@ -253,10 +368,10 @@ def get_version(automation_id: int) -> int:
         WHERE a_id = ? AND info_type = 'version'
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_VERSION, (automation_id,))
-        result = cur.fetchone()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_VERSION, (automation_id,))
+    result = cur.fetchone()
 
     return int(result[0])
 
@@ -273,10 +388,10 @@ def get_automation_name(automation_id: int) -> str:
     """
     GET_NAME = "SELECT a_name FROM automation WHERE a_id = ?"
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_NAME, (automation_id,))
-        result = cur.fetchone()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_NAME, (automation_id,))
+    result = cur.fetchone()
 
     return result[0]
 
@@ -293,19 +408,20 @@ def get_automation_data(automation_id: int) -> Automation:
     """
     GET_AUTOMATION_DATA = "SELECT * FROM automation WHERE a_id = ?"
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_AUTOMATION_DATA, (automation_id,))
-        result = cur.fetchone()
-        if result is not None:
-            automation = Automation(
-                automation_name=result[1],
-                created=result[2],
-                automation_mode=result[3],
-                max_instances=result[4],
-                automation_script=result[5],
-                error=result[6],
-            )
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_AUTOMATION_DATA, (automation_id,))
+    result = cur.fetchone()
+    if result is not None:
+        automation = Automation(
+            automation_name=result[1],
+            created=result[2],
+            automation_mode=result[3],
+            max_instances=result[4],
+            automation_script=result[5],
+            error=result[6],
+            version=result[7],
+        )
 
     return automation
 
@@ -325,7 +441,7 @@ def update_automation_data(automation_id: int, automation_data: dict):
         WHERE a_id = ?
         """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
         cur.execute(
             UPDATE_AUTOMATION,
@@ -336,7 +452,6 @@ def update_automation_data(automation_id: int, automation_data: dict):
                 automation_id,
             ),
         )
-        con.commit()
 
 
 def get_automation_entities(automation_id: int, only_inputs: bool = False) -> list:
@@ -368,13 +483,13 @@ def get_automation_entities(automation_id: int, only_inputs: bool = False) -> li
         ORDER BY ae.p_role, ae.position
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        if only_inputs:
-            cur.execute(GET_ONLY_INPUTS, (automation_id,))
-        else:
-            cur.execute(GET_ENTITIES, (automation_id,))
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    if only_inputs:
+        cur.execute(GET_ONLY_INPUTS, (automation_id,))
+    else:
+        cur.execute(GET_ENTITIES, (automation_id,))
+    result = cur.fetchall()
 
     if result is not None:
         entities = []
@@ -409,10 +524,10 @@ def get_additional_inforamtion(automation_id: int) -> list:
         WHERE a_id = ?
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_ADDITIONAL_INFORMATION, (automation_id,))
-        result = cur.fetchall()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_ADDITIONAL_INFORMATION, (automation_id,))
+    result = cur.fetchall()
 
     add_infos = []
 
@@ -437,7 +552,7 @@ def update_additional_infos(automation_id: int, add_infos: list):
         add_infos: list - the additional information as dictionaries with keys "info_type" and "info_content"
     """
 
-    with sqlite.connect(DATABASE) as con:
+    with transaction() as con:
         cur = con.cursor()
 
         # Get the existing additional information of the automation
@@ -475,14 +590,21 @@ def update_additional_infos(automation_id: int, add_infos: list):
 
         # Update the existing additional information
         cur.executemany(UPDATE_INFOS, update_info_tuples)
-        con.commit()
 
         # Define the SQL statement for inserting not existing additional information
         ADD_INFOS = "INSERT INTO additional_information (info, a_id, info_type) VALUES (?, ?, ?)"
 
         # Execute the insert statement with multiple values
         cur.executemany(ADD_INFOS, new_info_tuples)
-        con.commit()
+
+        # keep the numeric version of the automation in sync with its version information
+        UPDATE_VERSION = "UPDATE automation SET version = ? WHERE a_id = ?"
+
+        for info in add_infos:
+            if info["info_type"] == "version":
+                version = is_float_or_int(info["info_content"])
+                if isinstance(version, int):
+                    cur.execute(UPDATE_VERSION, (version, automation_id))
 
 
 def get_entity_possible_values(entity_id: int) -> dict:
@@ -503,20 +625,20 @@ def get_entity_possible_values(entity_id: int) -> dict:
 
     # add the manual created possible values of the entity itself
     GET_POSSIBLE_AUTOMATION_ENTITY_VALUES = """
-        SELECT tci.test_value 
+        SELECT DISTINCT tci.test_value 
         FROM test_case_input AS tci 
         WHERE tci.e_id = ?
         """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_POSSIBLE_INTEGRATION_VALUES, (entity_id,))
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_POSSIBLE_INTEGRATION_VALUES, (entity_id,))
 
-        integration_results = cur.fetchall()
+    integration_results = cur.fetchall()
 
-        cur.execute(GET_POSSIBLE_AUTOMATION_ENTITY_VALUES, (entity_id,))
+    cur.execute(GET_POSSIBLE_AUTOMATION_ENTITY_VALUES, (entity_id,))
 
-        autom_entity_results = cur.fetchall()
+    autom_entity_results = cur.fetchall()
 
     possible_values = {}
 
@@ -545,14 +667,84 @@ def has_test_cases(automation_id: int) -> bool:
     """
     GET_TEST_CASES = "SELECT case_id FROM test_case WHERE a_id = ?"
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_TEST_CASES, (automation_id,))
-        result = cur.fetchone()
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_TEST_CASES, (automation_id,))
+    result = cur.fetchone()
 
     return result is not None
 
 
+def iter_test_cases(
+    automation_id: int, after_case_id: int = None, limit: int = None
+) -> Iterator[dict]:
+    """
+    Stream the test cases of the automation with one joined query
+
+    The rows of the query are ordered by the test case, so every test case is yielded
+    as soon as all of its inputs are read.
+
+    Args:
+        automation_id: int - the id of the automation
+        after_case_id: int | None - only the test cases after this case id are loaded (keyset pagination)
+        limit: int | None - the maximum number of loaded test cases
+
+    Yields:
+        dict - the test cases of the automation ordered by their id with keys "case_id", "timestamp", "case_inputs",
+        "requirement" and "priority"
+    """
+    GET_TEST_CASES = """
+        SELECT tc.case_id, tc.c_timestamp, tc.requirement, tc.case_priority,
+            tci.test_value, tci.e_id, tci.p_role, tci.position, e.e_name
+        FROM (
+            SELECT case_id, c_timestamp, requirement, case_priority
+            FROM test_case
+            WHERE a_id = ? AND (? IS NULL OR case_id > ?)
+            ORDER BY case_id
+            LIMIT ?
+        ) AS tc
+        LEFT JOIN test_case_input AS tci ON tci.case_id = tc.case_id
+        LEFT JOIN entity AS e ON tci.e_id = e.e_id
+        ORDER BY tc.case_id, tci.case_input_id
+        """
+
+    # a negative limit loads all test cases
+    if limit is None:
+        limit = -1
+
+    con = get_connection()
+    cur = con.cursor()
+    cur.execute(GET_TEST_CASES, (automation_id, after_case_id, after_case_id, limit))
+
+    case = None
+    for row in cur:
+        if case is None or case["case_id"] != row[0]:
+            if case is not None:
+                yield case
+            case = {
+                "case_id": row[0],
+                "timestamp": row[1],
+                "case_inputs": [],
+                "requirement": row[2],
+                "priority": row[3],
+            }
+
+        # test cases without inputs only have one row without input values
+        if row[5] is not None:
+            case["case_inputs"].append(
+                {
+                    "test_value": row[4],
+                    "e_id": row[5],
+                    "p_role": row[6],
+                    "position": row[7],
+                    "e_name": row[8],
+                }
+            )
+
+    if case is not None:
+        yield case
+
+
 def load_test_cases(automation_id: int) -> list:
     """
     Load the test cases of the automation
@@ -563,71 +755,67 @@ def load_test_cases(automation_id: int) -> list:
     Returns:
         list - the test cases of the automation as dictionaries with keys "case_id", "timestamp", "case_inputs"
     """
-    GET_TEST_CASES_INFOS = """
-        SELECT tc.case_id, tc.c_timestamp, tc.requirement, tc.case_priority
-        FROM test_case AS tc 
-        WHERE tc.a_id = ?
-        """
+    return list(iter_test_cases(automation_id))
 
-    GET_TEST_CASE_INPUTS = """
-        SELECT tci.test_value, tci.e_id, tci.p_role, tci.position, e.e_name
-        FROM test_case_input AS tci
-        JOIN entity AS e ON tci.e_id = e.e_id
-        WHERE tci.case_id = ?
-        """
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        cur.execute(GET_TEST_CASES_INFOS, (automation_id,))
-        result = cur.fetchall()
+def load_test_case_page(
+    automation_id: int, after_case_id: int = None, page_size: int = 100
+) -> list:
+    """
+    Load one page of the test cases of the automation
 
-        cases = []
-        for case in result:
-            cur.execute(GET_TEST_CASE_INPUTS, (case[0],))
-            case_inputs = cur.fetchall()
-
-            input_list = []
-            for input in case_inputs:
-                case_input = {
-                    "test_value": input[0],
-                    "e_id": input[1],
-                    "p_role": input[2],
-                    "position": input[3],
-                    "e_name": input[4],
-                }
-                input_list.append(case_input)
+    The next page is loaded with the case id of the last test case of the current page,
+    so the test cases before it do not have to be skipped by the database.
 
-            cases.append(
-                {
-                    "case_id": case[0],
-                    "timestamp": case[1],
-                    "case_inputs": input_list,
-                    "requirement": case[2],
-                    "priority": case[3],
-                }
-            )
+    Args:
+        automation_id: int - the id of the automation
+        after_case_id: int | None - the case id of the last test case of the previous page, None for the first page
+        page_size: int - the maximum number of test cases on the page
 
-    return cases
+    Returns:
+        list - the test cases of the page as dictionaries with keys "case_id", "timestamp", "case_inputs"
+    """
+    return list(iter_test_cases(automation_id, after_case_id, page_size))
 
 
-def get_entity_names(entity_ids: list) -> list:
+def get_entity_names_by_id(entity_ids: list) -> dict:
     """
-    Get the names of the entities
+    Get the names of the entities by their ids with one query per chunk of ids
 
     Args:
         entity_ids: list - the ids of the entities
 
     Returns:
-        list - the names of the entities
+        dict - the names of the entities by their ids, ids of not existing entities are missing
     """
-    GET_ENTITY_NAMES = "SELECT e_name FROM entity WHERE e_id = ?"
+    unique_ids = list(dict.fromkeys(entity_ids))
 
-    with sqlite.connect(DATABASE) as con:
-        cur = con.cursor()
-        entity_names = []
-        for entity_id in entity_ids:
-            cur.execute(GET_ENTITY_NAMES, (entity_id,))
-            result = cur.fetchone()
-            entity_names.append(result[0])
+    con = get_connection()
+    cur = con.cursor()
+
+    entity_names = {}
+    for chunk in _split_into_chunks(unique_ids):
+        GET_ENTITY_NAMES = f"""
+            SELECT e_id, e_name
+            FROM entity
+            WHERE e_id IN ({", ".join("?" * len(chunk))})
+            """
+        cur.execute(GET_ENTITY_NAMES, chunk)
+        entity_names.update(cur.fetchall())
 
     return entity_names
+
+
+def get_entity_names(entity_ids: list) -> list:
+    """
+    Get the names of the entities
+
+    Args:
+        entity_ids: list - the ids of the entities
+
+    Returns:
+        list - the names of the entities in the order of the ids (None for ids of not existing entities)
+    """
+    entity_names = get_entity_names_by_id(entity_ids)
+
+    return [entity_names.get(entity_id) for entity_id in entity_ids]
@@ -7,11 +7,17 @@ Please only change this file if you know what you are doing.
 
 import sys
 import json
+import io
+from contextlib import redirect_stdout
 
-# read the arguments
-serialized_inputs = sys.argv[1]
+# flag to run the script with a stream of input vectors (one json list per line) from stdin
+BATCH_MODE = "--batch"
 
-input_vals = json.loads(serialized_inputs)
+# read the arguments if the script is called with a single input vector
+if __name__ == "__main__" and sys.argv[1] != BATCH_MODE:
+	serialized_inputs = sys.argv[1]
+
+	input_vals = json.loads(serialized_inputs)
 
 trigger_id: str = None
 
@@ -44,8 +50,30 @@ def action_execution(input_vals) -> None:
 	else:
 		print(json.dumps({"AutomationResult": "No action results"}))
 
-if __name__ == "__main__":
+def run_automation(input_vals) -> None:
 	if trigger_check(input_vals):
 		action_execution(input_vals)
 	else:
 		print(json.dumps({"AutomationResult":"No trigger detected"}))
+
+
+def run_batch() -> None:
+	# every input vector gets exactly one result line with its json encoded output
+	for serialized_inputs in sys.stdin:
+		if serialized_inputs.strip() == "":
+			continue
+		output = io.StringIO()
+		with redirect_stdout(output):
+			try:
+				run_automation(json.loads(serialized_inputs))
+			except Exception as e:
+				print(json.dumps({"ScriptError": f"{type(e).__name__}: {e}"}))
+		sys.stdout.write(json.dumps(output.getvalue()) + "\n")
+		sys.stdout.flush()
+
+
+if __name__ == "__main__":
+	if sys.argv[1] == BATCH_MODE:
+		run_batch()
+	else:
+		run_automation(input_vals)
@@ -1,9 +1,10 @@
-INSERT INTO automation (a_name, autom_mode, max_instances, script)
+INSERT INTO automation (a_name, autom_mode, max_instances, script, version)
 VALUES (
         'example_automation',
         0,
         1,
-        'data\automation_scripts\example_automation.py'
+        'data\automation_scripts\example_automation.py',
+        1
     );
 INSERT INTO additional_information (a_id, info_type, info)
 VALUES (1, "project", "example_project");
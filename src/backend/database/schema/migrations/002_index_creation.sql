@@ -0,0 +1,20 @@
+-- INDEXES
+/* secondary indexes for the lookup paths of the database modules */
+-- automations by name
+CREATE INDEX IF NOT EXISTS automation_name ON automation (a_name, a_id);
+-- project and version of an automation
+CREATE INDEX IF NOT EXISTS additional_information_automation ON additional_information (a_id, info_type, info);
+-- integrations by name
+CREATE INDEX IF NOT EXISTS integration_name ON integration (i_name, i_id);
+-- entities by name
+CREATE INDEX IF NOT EXISTS entity_name ON entity (e_name, e_id);
+-- test cases of an automation
+CREATE INDEX IF NOT EXISTS test_case_automation ON test_case (a_id, case_id);
+-- inputs of a test case (ordered by their id)
+CREATE INDEX IF NOT EXISTS test_case_input_case ON test_case_input (case_id);
+-- manual test values of an entity
+CREATE INDEX IF NOT EXISTS test_case_input_entity ON test_case_input (e_id, test_value);
+-- test executions of an automation
+CREATE INDEX IF NOT EXISTS test_execution_automation ON test_execution (a_id, exec_group);
+-- outputs of a test execution
+CREATE INDEX IF NOT EXISTS test_execution_output_execution ON test_execution_output (te_id);
@@ -0,0 +1,13 @@
+-- AUTOMATION VERSION
+/* numeric version of the automations, so the latest version of an automation name is read from an index */
+ALTER TABLE automation ADD COLUMN version INTEGER;
+-- take over the integer versions of the additional information
+UPDATE automation
+SET version = (
+        SELECT MAX(CAST(ai.info AS INTEGER))
+        FROM additional_information AS ai
+        WHERE ai.a_id = automation.a_id
+            AND ai.info_type = 'version'
+            AND CAST(CAST(ai.info AS INTEGER) AS TEXT) = ai.info
+    );
+CREATE INDEX IF NOT EXISTS automation_name_version ON automation (a_name, version);
@@ -0,0 +1,5 @@
+-- TEST CASE INPUT HASH
+/* hash of the canonical input vector of a test case, so every input vector is only stored once per automation */
+ALTER TABLE test_case ADD COLUMN input_hash TEXT;
+-- the hashes of former test cases are added by the next bulk creation of test cases for their automation
+CREATE UNIQUE INDEX IF NOT EXISTS test_case_input_hash ON test_case (a_id, input_hash);
@@ -32,11 +32,15 @@ AUTOMATION_SCRIPT = path.join(*settings['AUTOMATION_SCRIPT_PATH'])
 # path to the database of the automation test environment
 DATABASE = path.join("data", "automation_test_env.sqlite")
 
+# path to the cache of the automation script results
+EXECUTION_CACHE = path.join("data", "execution_cache.sqlite")
+
 # path to the templates for the automation script generation
 TEMPLATE_PATH = path.join("src", "backend", "automation_gen", "automation_script_gen", "templates")
 
 # needed sql-Files
 INIT_FILE = path.join("src", "backend", "database", "schema", "database_creation.sql")
+MIGRATION_PATH = path.join("src", "backend", "database", "schema", "migrations")
 INTEG_DATA = path.join("src", "backend", "database", "schema", "insert_integrations.sql")
 EXAMPLE_DATA = path.join("src", "backend", "database", "schema", "example_automation.sql")
 EXAMPLE_SCRIPT = path.join("src", "backend", "database", "schema", "example_automation.py")
@@ -15,6 +15,7 @@ class Automation:
     max_instances: int = None
     script: str = None
     project: str = None
+    version: int = None
     """
 
     a_name: str = None
@@ -22,6 +23,7 @@ class Automation:
     max_instances: int = None
     script: str = None
     project: str = None
+    version: int = None
     created: datetime = None
     error: str = None
 
@@ -34,6 +36,7 @@ class Automation:
         max_instances=10,
         created: datetime = None,
         error: str = None,
+        version: int = None,
     ):
         """
         Create an automation from the automation part.
@@ -44,6 +47,7 @@ class Automation:
             max_instances (int): The maximum instances of the automation
             automation_script (str): The script of the automation
             project (str): The project of the automation
+            version (int): The version of the automation, which is the version of its script
 
         Returns:
             dict: The automation as a dictionary
@@ -56,6 +60,7 @@ class Automation:
         self.project = project
         self.created = created
         self.error = error
+        self.version = version
 
     def serialize(self) -> dict:
         """
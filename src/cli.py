@@ -0,0 +1,383 @@
+"""
+Description: This is the headless command line interface of the project.
+
+The interface only uses the backend packages and no frontend modules, so the automations can be imported,
+their test cases generated and run and the results reported without a display, for example on a CI server.
+
+usage (from the root directory of the project):
+
+    python ./src/cli.py import <path> [--project <project>] [--workers <n>]
+    python ./src/cli.py gen-cases <automation> [--value <entity>=<value>,<value> ...]
+        [--strength <t> | --branch-coverage | --budget <n> [--seed <seed>] [--stratified]]
+        [--requirement <text>] [--priority <n>]
+    python ./src/cli.py run <automation> [--mode distinct|simultaneous|parallel] [--workers <n>] [--timeout <s>] [--cache]
+    python ./src/cli.py report <automation> [--group <n>] [--json]
+
+The automation can be given by its id or by its name, in which case the latest version is used.
+"""
+
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from backend.automation_gen import import_automations
+from backend.automation_testing import test_case_gen, test_execution
+from backend.automation_testing.execution_cache import ExecutionCache
+from backend.automation_testing.parallel_execution import iter_parallel_automations
+from backend.database import db_utils
+from backend.database.db_test_execution import ExecutionResultSink, load_test_executions
+
+# the execution modes of the run command
+RUN_MODES = ("distinct", "simultaneous", "parallel")
+
+
+def _resolve_automation(automation: str) -> int:
+    """
+    Get the id of the automation given by its id or its name
+
+    Args:
+        automation (str): the id or the name of the automation
+
+    Returns:
+        int: the id of the automation (the latest version for a name)
+    """
+    if automation.isdigit():
+        try:
+            db_utils.get_automation_name(int(automation))
+        except TypeError:
+            raise ValueError(f"There is no automation with the id {automation}")
+        return int(automation)
+
+    automation_ids = db_utils.get_automations_with_same_name(automation)
+    if automation_ids == []:
+        raise ValueError(f"There is no automation with the name {automation}")
+
+    return max(automation_ids)
+
+
+def _create_input_value_list(automation_id: int, value_args: list) -> list:
+    """
+    Create the test values of the input entities of the automation
+
+    Entities without given values are tested with their possible values from the database.
+
+    Args:
+        automation_id (int): the id of the automation
+        value_args (list): the test values of entities as strings "<entity>=<value>,<value>"
+
+    Returns:
+        list: the input value list with the keys "entity", "a_id" and "test_value" for every input entity
+    """
+    given_values = {}
+    for value_arg in value_args:
+        entity_name, separator, values = value_arg.partition("=")
+        if separator == "":
+            raise ValueError(f"The test values {value_arg} are not in the format <entity>=<value>,<value>")
+        given_values[entity_name.strip()] = [value.strip() for value in values.split(",")]
+
+    entities = db_utils.get_automation_entities(automation_id, only_inputs=True)
+
+    unknown_entities = set(given_values) - {entity.entity_name for entity in entities}
+    if unknown_entities:
+        raise ValueError(f"The entities {sorted(unknown_entities)} are not inputs of the automation")
+
+    input_value_list = []
+    for entity in entities:
+        test_values = given_values.get(entity.entity_name)
+        if test_values is None:
+            possible_values = db_utils.get_entity_possible_values(entity.entity_id)
+            test_values = [str(value) for value in possible_values.keys()]
+
+        if test_values == []:
+            raise ValueError(
+                f"There are no possible values for {entity.entity_name}, please set them with --value"
+            )
+
+        input_value_list.append({"entity": entity, "a_id": automation_id, "test_value": test_values})
+
+    return input_value_list
+
+
+def _create_test_runs(automation_id: int, script_path: str) -> list:
+    """
+    Create the test runs of all test cases of the automation
+
+    Args:
+        automation_id (int): the id of the automation
+        script_path (str): the path to the automation script
+
+    Returns:
+        list: the test cases with the keys "id", "script_path" and "input_values"
+    """
+    testcases = []
+    for test_case in db_utils.iter_test_cases(automation_id):
+        # the trigger, condition and action inputs of the automation
+        input_values = [[], [], []]
+        for case_input in test_case["case_inputs"]:
+            input_values[case_input["p_role"]].append(case_input["test_value"])
+
+        testcases.append(
+            {"id": test_case["case_id"], "script_path": script_path, "input_values": input_values}
+        )
+
+    return testcases
+
+
+def import_command(args: argparse.Namespace) -> int:
+    """
+    Import the automations of a directory or a yaml file
+
+    Args:
+        args (argparse.Namespace): the arguments of the import command
+
+    Returns:
+        int: the exit code, 1 if an automation could not be imported
+    """
+    results = import_automations(args.source, project=args.project, max_workers=args.workers)
+
+    for result in results:
+        if result["error"] is None:
+            print(f"imported {result['automation_name']} (id {result['a_id']}, version {result['version']})")
+        else:
+            print(f"failed {result['source']}: {result['error']}")
+
+    failed = sum(result["error"] is not None for result in results)
+    print(f"Imported {len(results) - failed} of {len(results)} automations")
+
+    return 1 if failed > 0 else 0
+
+
+def gen_cases_command(args: argparse.Namespace) -> int:
+    """
+    Generate the test cases of all combinations of the test values of the input entities
+
+    Args:
+        args (argparse.Namespace): the arguments of the gen-cases command
+
+    Returns:
+        int: the exit code
+    """
+    automation_id = _resolve_automation(args.automation)
+    input_value_list = _create_input_value_list(automation_id, args.value)
+
+    num_combinations = test_case_gen.count_test_case_input_combinations(input_value_list)
+
+    if args.branch_coverage:
+        combinations = test_case_gen.create_branch_covering_test_case_input_combinations(
+            input_value_list, db_utils.get_automation_data(automation_id).script
+        )
+        coverage = "branch coverage"
+    elif args.strength is not None:
+        combinations = test_case_gen.create_covering_test_case_input_combinations(
+            input_value_list, args.strength
+        )
+        coverage = f"{args.strength}-way coverage"
+    elif args.budget is not None and num_combinations > args.budget:
+        combinations = test_case_gen.sample_test_case_input_combinations(
+            input_value_list, args.budget, args.seed, args.stratified
+        )
+        coverage = f"{'stratified' if args.stratified else 'random'} sampling (seed {args.seed})"
+    else:
+        combinations = None
+
+    if combinations is None:
+        num_generated = num_combinations
+        print(f"Generating {num_combinations} test cases for {db_utils.get_automation_name(automation_id)}")
+    else:
+        num_generated = len(combinations)
+        reduction = test_case_gen.get_reduction_ratio(num_generated, input_value_list)
+        print(
+            f"Generating {num_generated} of {num_combinations} test cases for "
+            f"{db_utils.get_automation_name(automation_id)} with {coverage} (reduced by {reduction:.1%})"
+        )
+
+    # the combinations are streamed into the database, so they are never all in memory
+    start_time = perf_counter()
+    num_test_cases = test_case_gen.add_test_case_combinations_to_db(
+        automation_id, input_value_list, args.requirement, args.priority, combinations=combinations
+    )
+    duration = perf_counter() - start_time
+
+    print(
+        f"Inserted {num_test_cases} test cases in {duration:.3f} s"
+        f" ({num_test_cases / max(duration, 1e-9):.0f} test cases/s),"
+        f" skipped {num_generated - num_test_cases} already stored test cases"
+    )
+
+    return 0
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """
+    Run the test cases of the automation and store the results as a new execution group
+
+    Args:
+        args (argparse.Namespace): the arguments of the run command
+
+    Returns:
+        int: the exit code, 1 if the automation has no test cases
+    """
+    automation_id = _resolve_automation(args.automation)
+    automation = db_utils.get_automation_data(automation_id)
+
+    testcases = _create_test_runs(automation_id, automation.script)
+    if testcases == []:
+        print(f"{automation.a_name} has no test cases, create them with gen-cases", file=sys.stderr)
+        return 1
+
+    # the simultaneous runs depend on their timing and are never taken from the cache
+    cache = ExecutionCache() if args.cache else None
+
+    if args.mode == "simultaneous":
+        results = test_execution.run_simultaneous_automations(
+            testcases, automation.autom_mode, automation.max_instances, args.timeout
+        )
+    elif args.mode == "parallel":
+        results = iter_parallel_automations(testcases, max_workers=args.workers, cache=cache)
+    else:
+        results = test_execution.run_distinct_automations(testcases, automation.autom_mode, cache=cache)
+
+    with ExecutionResultSink(automation_id, args.mode) as sink:
+        sink.add_all(results)
+
+    print(f"Ran {len(testcases)} test cases of {automation.a_name} as execution group {sink.exec_group}")
+
+    return 0
+
+
+def report_command(args: argparse.Namespace) -> int:
+    """
+    Report the results of a test execution of the automation
+
+    Args:
+        args (argparse.Namespace): the arguments of the report command
+
+    Returns:
+        int: the exit code, 1 if there is no test execution
+    """
+    automation_id = _resolve_automation(args.automation)
+    executions = load_test_executions(automation_id, args.group)
+
+    if executions == []:
+        print(f"There are no test executions of {args.automation}", file=sys.stderr)
+        return 1
+
+    # report the latest execution group if no group is given
+    exec_group = max(execution["exec_group"] for execution in executions)
+    executions = [execution for execution in executions if execution["exec_group"] == exec_group]
+
+    if args.json:
+        print(json.dumps(executions, indent=2, default=str))
+        return 0
+
+    print(f"Execution group {exec_group} of {db_utils.get_automation_name(automation_id)}")
+    for execution in executions:
+        if execution["error_type"] is not None:
+            outcome = f"{execution['error_type']}: {execution['error_comment']}"
+        else:
+            outcome = ", ".join(
+                f"{output['e_name']}={output['output_val']}" for output in execution["outputs"]
+            )
+        print(f"  case {execution['case_id']}: {outcome}")
+
+    errors = sum(execution["error_type"] is not None for execution in executions)
+    print(f"{len(executions)} test executions, {errors} with errors")
+
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the parser of the command line arguments
+
+    Returns:
+        argparse.ArgumentParser: the parser with a sub parser for every command
+    """
+    parser = argparse.ArgumentParser(description="Headless interface of the automation test environment")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="import automations from a directory or a yaml file")
+    import_parser.add_argument("source", help="directory with automation files or a yaml file")
+    import_parser.add_argument("--project", default="uncategorized", help="project of the automations")
+    import_parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    import_parser.set_defaults(func=import_command)
+
+    gen_parser = subparsers.add_parser("gen-cases", help="generate the test cases of an automation")
+    gen_parser.add_argument("automation", help="id or name of the automation")
+    gen_parser.add_argument(
+        "--value",
+        action="append",
+        default=[],
+        help="test values of an input entity as <entity>=<value>,<value> (repeatable)",
+    )
+    reduction_group = gen_parser.add_mutually_exclusive_group()
+    reduction_group.add_argument(
+        "--strength",
+        type=int,
+        default=None,
+        help="only cover all value combinations of this many entities (2 for pairwise) instead of all combinations",
+    )
+    reduction_group.add_argument(
+        "--branch-coverage",
+        action="store_true",
+        help="only cover every branch of the automation script with one value per equivalence class",
+    )
+    reduction_group.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="sample this many test cases if there are more combinations",
+    )
+    gen_parser.add_argument("--seed", type=int, default=0, help="seed of the sampling")
+    gen_parser.add_argument(
+        "--stratified",
+        action="store_true",
+        help="sample every test value of an entity equally often instead of uniformly at random",
+    )
+    gen_parser.add_argument("--requirement", default="", help="requirement of the test cases")
+    gen_parser.add_argument("--priority", default="", help="priority of the test cases")
+    gen_parser.set_defaults(func=gen_cases_command)
+
+    run_parser = subparsers.add_parser("run", help="run the test cases of an automation")
+    run_parser.add_argument("automation", help="id or name of the automation")
+    run_parser.add_argument("--mode", choices=RUN_MODES, default="distinct", help="execution mode")
+    run_parser.add_argument("--workers", type=int, default=None, help="number of processes in parallel mode")
+    run_parser.add_argument("--timeout", type=float, default=None, help="timeout per test case in simultaneous mode")
+    run_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse the results of unchanged scripts and input vectors in distinct and parallel mode",
+    )
+    run_parser.set_defaults(func=run_command)
+
+    report_parser = subparsers.add_parser("report", help="report the results of a test execution")
+    report_parser.add_argument("automation", help="id or name of the automation")
+    report_parser.add_argument("--group", type=int, default=None, help="execution group, defaults to the latest")
+    report_parser.add_argument("--json", action="store_true", help="print the executions as json")
+    report_parser.set_defaults(func=report_command)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """
+    Run the command of the command line arguments
+
+    Args:
+        argv (list, optional): the command line arguments. Defaults to the arguments of the process.
+
+    Returns:
+        int: the exit code of the command
+    """
+    args = create_parser().parse_args(argv)
+
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
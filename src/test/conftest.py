@@ -0,0 +1,44 @@
+"""
+This module contains the shared fixtures of the test modules.
+"""
+
+from os import makedirs, path
+
+import pytest
+
+from backend.automation_gen.automation_script_gen import utils as script_gen_utils
+from backend.database import init_db
+from backend.database.db_connection import close_connection, set_database_path
+from backend.database.db_utils import clear_name_caches
+
+
+@pytest.fixture
+def temp_database(tmp_path):
+    """
+    Use a new database with the base data and the example automation in a temporary directory,
+    so the test does not change the database of the environment and can be repeated.
+    """
+    db_path = path.join(tmp_path, "automation_test_env.sqlite")
+    init_db(db_path)
+
+    former_path = set_database_path(db_path)
+    clear_name_caches()
+
+    yield db_path
+
+    close_connection()
+    set_database_path(former_path)
+    clear_name_caches()
+
+
+@pytest.fixture
+def temp_script_dir(tmp_path, monkeypatch):
+    """
+    Create the generated automation scripts in a temporary directory instead of the script directory
+    of the environment.
+    """
+    script_dir = path.join(tmp_path, "automation_scripts")
+    makedirs(script_dir)
+    monkeypatch.setattr(script_gen_utils, "AUTOMATION_SCRIPT", script_dir)
+
+    return script_dir
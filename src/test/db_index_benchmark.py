@@ -0,0 +1,216 @@
+"""
+This script measures the lookup times of the database with and without the secondary indexes.
+
+A synthetic database with the schema of the environment is created in a temporary directory and filled
+with automations, entities, test cases and test case inputs. The lookups of the database modules are
+timed before and after the indexes of `schema/migrations/002_index_creation.sql` are created.
+
+usage (from the root directory of the project):
+
+    python src/test/db_index_benchmark.py [--automations 10000] [--inputs 1000000] [--lookups 200]
+"""
+
+import argparse
+import random
+import sqlite3 as sqlite
+import tempfile
+from os import path
+from time import perf_counter
+
+INIT_FILE = path.join("src", "backend", "database", "schema", "database_creation.sql")
+INDEX_FILE = path.join("src", "backend", "database", "schema", "migrations", "002_index_creation.sql")
+
+NUM_INTEGRATIONS = 100
+ENTITIES_PER_AUTOMATION = 5
+CASES_PER_AUTOMATION = 10
+
+# the lookups of the database modules with a function to create random parameters
+LOOKUPS = {
+    "automation by name": (
+        "SELECT a_id FROM automation WHERE a_name = ?",
+        lambda size: (f"automation_{random.randrange(size['automations'])}",),
+    ),
+    "version of automation": (
+        "SELECT info FROM additional_information WHERE a_id = ? AND info_type = 'version'",
+        lambda size: (random.randrange(size["automations"]) + 1,),
+    ),
+    "integration by name": (
+        "SELECT i_id FROM integration WHERE i_name = ?",
+        lambda size: (f"integration_{random.randrange(NUM_INTEGRATIONS)}",),
+    ),
+    "entity by name": (
+        "SELECT e_id FROM entity WHERE e_name = ?",
+        lambda size: (f"sensor.entity_{random.randrange(size['entities'])}",),
+    ),
+    "test cases of automation": (
+        """
+        SELECT tc.case_id, tci.test_value, tci.e_id
+        FROM test_case AS tc
+        LEFT JOIN test_case_input AS tci ON tci.case_id = tc.case_id
+        WHERE tc.a_id = ?
+        ORDER BY tc.case_id, tci.case_input_id
+        """,
+        lambda size: (random.randrange(size["automations"]) + 1,),
+    ),
+    "test values of entity": (
+        "SELECT test_value FROM test_case_input WHERE e_id = ?",
+        lambda size: (random.randrange(size["entities"]) + 1,),
+    ),
+}
+
+
+def create_synthetic_database(db_path: str, num_automations: int, num_inputs: int) -> dict:
+    """
+    Create the database with the schema of the environment and fill it with synthetic data
+
+    Args:
+        db_path (str): the path to the new database
+        num_automations (int): the number of automations
+        num_inputs (int): the number of test case inputs
+
+    Returns:
+        dict: the number of automations, entities and test cases of the database
+    """
+    num_entities = num_automations * ENTITIES_PER_AUTOMATION
+    num_cases = num_automations * CASES_PER_AUTOMATION
+    inputs_per_case = max(1, num_inputs // num_cases)
+
+    with open(INIT_FILE) as model_creator:
+        automation_test_env_model = model_creator.read()
+
+    con = sqlite.connect(db_path)
+    cur = con.cursor()
+    cur.executescript(automation_test_env_model)
+
+    cur.executemany(
+        "INSERT INTO integration (i_id, i_name) VALUES (?, ?)",
+        ((i + 1, f"integration_{i}") for i in range(NUM_INTEGRATIONS)),
+    )
+    cur.executemany(
+        "INSERT INTO automation (a_id, a_name, autom_mode, max_instances, script) VALUES (?, ?, 0, 1, '')",
+        ((a + 1, f"automation_{a}") for a in range(num_automations)),
+    )
+    cur.executemany(
+        "INSERT INTO additional_information (a_id, info_type, info) VALUES (?, ?, ?)",
+        (
+            row
+            for a in range(num_automations)
+            for row in ((a + 1, "project", "uncategorized"), (a + 1, "version", "1"))
+        ),
+    )
+    cur.executemany(
+        "INSERT INTO entity (e_id, e_name, i_id) VALUES (?, ?, ?)",
+        (
+            (e + 1, f"sensor.entity_{e}", e % NUM_INTEGRATIONS + 1)
+            for e in range(num_entities)
+        ),
+    )
+    cur.executemany(
+        "INSERT INTO automation_entity (a_id, e_id, p_role, position) VALUES (?, ?, 0, ?)",
+        (
+            (e // ENTITIES_PER_AUTOMATION + 1, e + 1, e % ENTITIES_PER_AUTOMATION)
+            for e in range(num_entities)
+        ),
+    )
+    cur.executemany(
+        "INSERT INTO test_case (case_id, a_id) VALUES (?, ?)",
+        ((c + 1, c // CASES_PER_AUTOMATION + 1) for c in range(num_cases)),
+    )
+    cur.executemany(
+        "INSERT INTO test_case_input (test_value, case_id, a_id, e_id, p_role, position) VALUES (?, ?, ?, ?, 0, ?)",
+        (
+            (
+                f"value_{i % 7}",
+                c + 1,
+                c // CASES_PER_AUTOMATION + 1,
+                (c // CASES_PER_AUTOMATION) * ENTITIES_PER_AUTOMATION + i % ENTITIES_PER_AUTOMATION + 1,
+                i % ENTITIES_PER_AUTOMATION,
+            )
+            for c in range(num_cases)
+            for i in range(inputs_per_case)
+        ),
+    )
+    con.commit()
+    con.close()
+
+    return {"automations": num_automations, "entities": num_entities, "cases": num_cases}
+
+
+def time_lookups(db_path: str, size: dict, num_lookups: int) -> dict:
+    """
+    Measure the mean time of every lookup
+
+    Args:
+        db_path (str): the path to the database
+        size (dict): the number of automations, entities and test cases of the database
+        num_lookups (int): the number of lookups with random parameters per query
+
+    Returns:
+        dict: the mean time of the lookups in milliseconds by the name of the lookup
+    """
+    con = sqlite.connect(db_path)
+    cur = con.cursor()
+
+    lookup_times = {}
+    for name, (query, create_params) in LOOKUPS.items():
+        # use the same parameters before and after the index creation
+        random.seed(name)
+        params = [create_params(size) for _ in range(num_lookups)]
+
+        start_time = perf_counter()
+        for param in params:
+            cur.execute(query, param)
+            cur.fetchall()
+        lookup_times[name] = (perf_counter() - start_time) / num_lookups * 1000
+
+    con.close()
+    return lookup_times
+
+
+def create_indexes(db_path: str) -> float:
+    """
+    Create the secondary indexes in the database
+
+    Args:
+        db_path (str): the path to the database
+
+    Returns:
+        float: the time needed for the index creation in seconds
+    """
+    with open(INDEX_FILE) as index_creator:
+        index_creation = index_creator.read()
+
+    start_time = perf_counter()
+    con = sqlite.connect(db_path)
+    con.executescript(index_creation)
+    con.execute("ANALYZE")
+    con.commit()
+    con.close()
+    return perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the secondary indexes of the database")
+    parser.add_argument("--automations", type=int, default=10000, help="number of automations")
+    parser.add_argument("--inputs", type=int, default=1000000, help="number of test case inputs")
+    parser.add_argument("--lookups", type=int, default=200, help="number of lookups per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = path.join(temp_dir, "benchmark.sqlite")
+
+        start_time = perf_counter()
+        size = create_synthetic_database(db_path, args.automations, args.inputs)
+        print(
+            f"Created {size['automations']} automations, {size['entities']} entities and "
+            f"{size['cases']} test cases in {perf_counter() - start_time:.1f} s"
+        )
+
+        before = time_lookups(db_path, size, args.lookups)
+        print(f"Created the indexes in {create_indexes(db_path):.1f} s")
+        after = time_lookups(db_path, size, args.lookups)
+
+    print(f"\n{'lookup':<28}{'before [ms]':>14}{'after [ms]':>14}{'speedup':>10}")
+    for name in LOOKUPS:
+        speedup = before[name] / after[name] if after[name] > 0 else float("inf")
+        print(f"{name:<28}{before[name]:>14.3f}{after[name]:>14.3f}{speedup:>9.0f}x")
@@ -0,0 +1,131 @@
+"""
+This test module is used to test the import of many automations at once.
+"""
+
+import tempfile
+from os import path
+
+from backend.automation_gen import bulk_import
+from backend.automation_gen.automation_script_gen import get_script_version
+from backend.automation_gen.bulk_import import import_automations
+from backend.database import db_utils
+from backend.utils.env_const import EXAMPLE_AUTOMATION_PATH
+
+LOCK_THE_HOUSE = path.join(EXAMPLE_AUTOMATION_PATH, "2024.08.02", "lock_the_house.yaml")
+
+
+def test_import_automation_list(temp_database, temp_script_dir):
+    """
+    Test the import of a yaml file with a list of automations, where one automation is invalid.
+    """
+    with open(LOCK_THE_HOUSE) as file:
+        automation = file.read()
+
+    automation_list = "- " + automation.replace("\n", "\n  ").replace("Lock the house", "Bulk lock the house")
+    automation_list += "\n- alias: Bulk broken automation\n  action: []\n"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        automations_file = path.join(temp_dir, "automations.yaml")
+        with open(automations_file, "w") as file:
+            file.write(automation_list)
+
+        results = import_automations(automations_file, project="bulk_import", max_workers=1)
+
+    assert [result["source"] for result in results] == [
+        f"{automations_file}[0]",
+        f"{automations_file}[1]",
+    ]
+
+    # the valid automation is imported with its project and version
+    assert results[0]["error"] is None
+    assert results[0]["automation_name"] == "Bulk_lock_the_house"
+    assert db_utils.get_automation_name(results[0]["a_id"]) == "Bulk_lock_the_house"
+    assert ("project", "bulk_import", False) in db_utils.get_additional_inforamtion(results[0]["a_id"])
+    assert path.exists(db_utils.get_automation_data(results[0]["a_id"]).script)
+
+    # the invalid automation is reported without aborting the import
+    assert results[1]["a_id"] is None
+    assert results[1]["error"] is not None
+
+
+def test_import_automation_directory(temp_database, temp_script_dir):
+    """
+    Test the import of all automation files of a directory in worker processes.
+    """
+    results = import_automations(path.join(EXAMPLE_AUTOMATION_PATH, "2024.08.02"), max_workers=2)
+
+    imported = [result for result in results if result["error"] is None]
+
+    assert len(results) == 7
+    assert "Lock_the_house" in [result["automation_name"] for result in imported]
+    for result in imported:
+        assert db_utils.get_automation_name(result["a_id"]) == result["automation_name"]
+        assert db_utils.get_version(result["a_id"]) == result["version"]
+        assert path.dirname(db_utils.get_automation_data(result["a_id"]).script) == temp_script_dir
+
+
+def _write_automation_copies(temp_dir: str, alias: str, num_copies: int) -> None:
+    """
+    Write copies of the lock the house automation with a new alias into the directory.
+    """
+    with open(LOCK_THE_HOUSE) as file:
+        automation = file.read().replace("Lock the house", alias)
+
+    for copy in range(num_copies):
+        with open(path.join(temp_dir, f"automation_{copy}.yaml"), "w") as file:
+            file.write(automation)
+
+
+def test_import_versions_follow_script_versions(temp_database, temp_script_dir):
+    """
+    Test that the database versions of an automation imported several times are its script versions.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_automation_copies(temp_dir, "Bulk versioned automation", 4)
+        results = import_automations(temp_dir, max_workers=4)
+
+    assert all(result["error"] is None for result in results)
+
+    scripts = [db_utils.get_automation_data(result["a_id"]).script for result in results]
+    script_versions = [get_script_version(script) for script in scripts]
+
+    assert [result["version"] for result in results] == script_versions
+    assert sorted(script_versions) == [1, 2, 3, 4]
+
+
+class _ImportAborted(BaseException):
+    """
+    Abort of the import, which is not handled like a failing automation.
+    """
+
+
+def test_import_rollback_removes_scripts(temp_database, temp_script_dir, monkeypatch):
+    """
+    Test that the generated scripts are removed if the import transaction is rolled back.
+    """
+    dissected_automations = []
+
+    def _dissect_automation(task: tuple) -> dict:
+        dissected_automations.append(dissect_automation(task))
+        return dissected_automations[-1]
+
+    def _insert_automation(automation_data: dict, project: str) -> tuple:
+        raise _ImportAborted()
+
+    dissect_automation = bulk_import._dissect_automation
+    monkeypatch.setattr(bulk_import, "_dissect_automation", _dissect_automation)
+    monkeypatch.setattr(bulk_import, "_insert_automation", _insert_automation)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_automation_copies(temp_dir, "Bulk rolled back automation", 2)
+        try:
+            import_automations(temp_dir, max_workers=1)
+        except _ImportAborted:
+            pass
+        else:
+            assert False, "the import was not aborted"
+
+    assert len(dissected_automations) == 2
+    for dissected_automation in dissected_automations:
+        assert not path.exists(dissected_automation["automation_data"]["infos"].script)
+    assert db_utils.get_automations_with_same_name("Bulk_rolled_back_automation") == []
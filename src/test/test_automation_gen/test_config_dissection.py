@@ -253,7 +253,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_event_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_event_1, position=1, real_position=0, script_path=file_path
+            trigger_part_event_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -290,7 +290,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_event_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_event_2, position=1, real_position=0, script_path=file_path
+            trigger_part_event_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -347,7 +347,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_event_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_event_3, position=1, real_position=0, script_path=file_path
+            trigger_part_event_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -386,7 +386,7 @@ async def test_trigger_entities():
         trigger_part_ha_1 = {CONF_PLATFORM: "homeassistant", CONF_EVENT: "start"}
         file_path = init_automation_script("trigger_part_ha_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_ha_1, position=1, real_position=0, script_path=file_path
+            trigger_part_ha_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -416,7 +416,7 @@ async def test_trigger_entities():
         trigger_part_ha_2 = {CONF_PLATFORM: "homeassistant", CONF_EVENT: "shutdown"}
         file_path = init_automation_script("trigger_part_ha_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_ha_2, position=1, real_position=0, script_path=file_path
+            trigger_part_ha_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -451,7 +451,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_mqtt_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_mqtt_1, position=1, real_position=0, script_path=file_path
+            trigger_part_mqtt_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -485,7 +485,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_mqtt_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_mqtt_2, position=1, real_position=0, script_path=file_path
+            trigger_part_mqtt_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -519,7 +519,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_mqtt_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_mqtt_3, position=1, real_position=0, script_path=file_path
+            trigger_part_mqtt_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -556,7 +556,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_1, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -601,7 +601,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_2, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -647,7 +647,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_3, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -707,7 +707,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_4", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_4, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_4, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -767,7 +767,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_5", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_5, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_5, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -811,7 +811,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_6", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_6, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_6, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -875,7 +875,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_7", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_7, position=1, real_position=0, script_path=file_path
+            trigger_part_num_state_7, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -941,7 +941,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_num_state_8", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_num_state_8, position=2, real_position=2, script_path=file_path
+            trigger_part_num_state_8, position=2, real_position=2, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1044,7 +1044,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_1, position=1, real_position=0, script_path=file_path
+            trigger_part_state_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1085,7 +1085,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_2, position=1, real_position=0, script_path=file_path
+            trigger_part_state_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1119,7 +1119,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_3, position=1, real_position=0, script_path=file_path
+            trigger_part_state_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1154,7 +1154,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_4", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_4, position=1, real_position=0, script_path=file_path
+            trigger_part_state_4, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1192,7 +1192,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_5", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_5, position=1, real_position=0, script_path=file_path
+            trigger_part_state_5, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1237,7 +1237,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_6", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_6, position=1, real_position=0, script_path=file_path
+            trigger_part_state_6, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1273,7 +1273,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_7", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_7, position=1, real_position=0, script_path=file_path
+            trigger_part_state_7, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1334,7 +1334,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_8", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_8, position=1, real_position=0, script_path=file_path
+            trigger_part_state_8, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1401,7 +1401,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_9", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_9, position=1, real_position=0, script_path=file_path
+            trigger_part_state_9, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1484,7 +1484,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_state_10", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_state_10, position=23, real_position=19, script_path=file_path
+            trigger_part_state_10, position=23, real_position=19, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1646,7 +1646,7 @@ async def test_trigger_entities():
         trigger_part_sun_1 = {CONF_PLATFORM: "sun", CONF_EVENT: "sunset"}
         file_path = init_automation_script("trigger_part_sun_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_sun_1, position=1, real_position=0, script_path=file_path
+            trigger_part_sun_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1679,7 +1679,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_sun_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_sun_2, position=1, real_position=0, script_path=file_path
+            trigger_part_sun_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1716,7 +1716,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_tag_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_tag_1, position=1, real_position=0, script_path=file_path
+            trigger_part_tag_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1749,7 +1749,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_tag_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_tag_2, position=1, real_position=0, script_path=file_path
+            trigger_part_tag_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1784,7 +1784,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_tag_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_tag_3, position=1, real_position=0, script_path=file_path
+            trigger_part_tag_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1831,7 +1831,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_template_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_template_1, position=1, real_position=0, script_path=file_path
+            trigger_part_template_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1867,7 +1867,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_template_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_template_2, position=1, real_position=0, script_path=file_path
+            trigger_part_template_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1923,7 +1923,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_template_3", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_template_3, position=1, real_position=0, script_path=file_path
+            trigger_part_template_3, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1958,7 +1958,7 @@ async def test_trigger_entities():
         trigger_part_time_1 = {CONF_PLATFORM: "time", CONF_AT: "06:05:02"}
         file_path = init_automation_script("trigger_part_time_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_time_1, position=1, real_position=0, script_path=file_path
+            trigger_part_time_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -1987,7 +1987,7 @@ async def test_trigger_entities():
         trigger_part_time_2 = {CONF_PLATFORM: "time", CONF_AT: ["06:05", "06:10"]}
         file_path = init_automation_script("trigger_part_time_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_time_2, position=1, real_position=0, script_path=file_path
+            trigger_part_time_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2031,7 +2031,7 @@ async def test_trigger_entities():
             trigger_part_time_pattern_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2069,7 +2069,7 @@ async def test_trigger_entities():
             trigger_part_time_pattern_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2107,7 +2107,7 @@ async def test_trigger_entities():
             trigger_part_time_pattern_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2151,7 +2151,7 @@ async def test_trigger_entities():
                 trigger_part_time_pattern_4,
                 position=1,
                 real_position=0,
-                script_path=file_path,
+                script=file_path,
             )
             assert False  # The function should raise an exception
         except vol.Invalid as e:
@@ -2170,7 +2170,7 @@ async def test_trigger_entities():
                 trigger_part_time_pattern_5,
                 position=1,
                 real_position=0,
-                script_path=file_path,
+                script=file_path,
             )
             assert False  # The function should raise an exception
         except vol.Invalid as e:
@@ -2189,7 +2189,7 @@ async def test_trigger_entities():
                 trigger_part_time_pattern_6,
                 position=1,
                 real_position=0,
-                script_path=file_path,
+                script=file_path,
             )
             assert False  # The function should raise an exception
         except vol.Invalid as e:
@@ -2202,7 +2202,7 @@ async def test_trigger_entities():
             trigger_part_time_pattern_7,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2244,7 +2244,7 @@ async def test_trigger_entities():
             trigger_part_pers_notify_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2282,7 +2282,7 @@ async def test_trigger_entities():
             trigger_part_pers_notify_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2321,7 +2321,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_webhook_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_webhook_1, position=1, real_position=0, script_path=file_path
+            trigger_part_webhook_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2360,7 +2360,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_webhook_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_webhook_2, position=1, real_position=0, script_path=file_path
+            trigger_part_webhook_2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2399,7 +2399,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_zone_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_zone_1, position=1, real_position=0, script_path=file_path
+            trigger_part_zone_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2437,7 +2437,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_geo_local_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_geo_local_1, position=1, real_position=0, script_path=file_path
+            trigger_part_geo_local_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2482,7 +2482,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_device_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_device_1, position=1, real_position=0, script_path=file_path
+            trigger_part_device_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2526,7 +2526,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_calendar_1", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_calendar_1, position=1, real_position=0, script_path=file_path
+            trigger_part_calendar_1, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2563,7 +2563,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_calendar_2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_calendar_2, position=1, real_position=0, script_path=file_path
+            trigger_part_calendar_2, position=1, real_position=0, script=file_path
         )
         entities_calendar_2, end_position, real_pos = results
         test_trigger_return(file_path)
@@ -2605,7 +2605,7 @@ async def test_trigger_entities():
             trigger_part_conversation_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         entities_conversation_1, end_position, real_pos = results
         test_trigger_return(file_path)
@@ -2648,7 +2648,7 @@ async def test_trigger_entities():
             trigger_part_conversation_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_trigger_return(file_path)
 
@@ -2707,7 +2707,7 @@ async def test_trigger_entities():
         trigger_part_x = {CONF_PLATFORM: "unsupported"}
         file_path = init_automation_script("trigger_part_x", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_x, position=1, real_position=0, script_path=file_path
+            trigger_part_x, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2730,7 +2730,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_x2", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_x2, position=1, real_position=0, script_path=file_path
+            trigger_part_x2, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2754,7 +2754,7 @@ async def test_trigger_entities():
         }
         file_path = init_automation_script("trigger_part_disabled", TRIGGER_DIR)
         results = _trigger_entities(
-            trigger_part_disabled, position=1, real_position=0, script_path=file_path
+            trigger_part_disabled, position=1, real_position=0, script=file_path
         )
         test_trigger_return(file_path)
 
@@ -2806,7 +2806,7 @@ async def test_condition_entities():
             condition_part_num_state_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -2861,7 +2861,7 @@ async def test_condition_entities():
             condition_part_num_state_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -2917,7 +2917,7 @@ async def test_condition_entities():
             condition_part_num_state_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -2988,7 +2988,7 @@ async def test_condition_entities():
             condition_part_num_state_4,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3052,7 +3052,7 @@ async def test_condition_entities():
             condition_part_num_state_5,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3103,7 +3103,7 @@ async def test_condition_entities():
             condition_part_num_state_6,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3173,7 +3173,7 @@ async def test_condition_entities():
             condition_part_num_state_7,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3228,7 +3228,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3275,7 +3275,7 @@ async def test_condition_entities():
             condition_part_num_state_9,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3351,7 +3351,7 @@ async def test_condition_entities():
             condition_part_num_state_10,
             position=2,
             real_position=2,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3454,7 +3454,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_state_1", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_state_1, position=1, real_position=0, script_path=file_path
+            condition_part_state_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -3496,7 +3496,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_state_2", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_state_2, position=1, real_position=0, script_path=file_path
+            condition_part_state_2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -3539,7 +3539,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_state_3", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_state_3, position=1, real_position=0, script_path=file_path
+            condition_part_state_3, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -3599,7 +3599,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3646,7 +3646,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3706,7 +3706,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3758,7 +3758,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -3787,7 +3787,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_state_8", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_state_8, position=1, real_position=0, script_path=file_path
+            condition_part_state_8, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -3850,7 +3850,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_state_9", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_state_9, position=1, real_position=0, script_path=file_path
+            condition_part_state_9, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -3990,7 +3990,7 @@ async def test_condition_entities():
             condition_part_state_10,
             position=23,
             real_position=19,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4192,7 +4192,7 @@ async def test_condition_entities():
             condition_part=condition_part_or_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4246,7 +4246,7 @@ async def test_condition_entities():
             condition_part_or_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4333,7 +4333,7 @@ async def test_condition_entities():
             condition_part_or_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4444,7 +4444,7 @@ async def test_condition_entities():
             condition_part_and_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4500,7 +4500,7 @@ async def test_condition_entities():
             condition_part_and_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4586,7 +4586,7 @@ async def test_condition_entities():
             condition_part_and_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4701,7 +4701,7 @@ async def test_condition_entities():
             condition_part_not_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4757,7 +4757,7 @@ async def test_condition_entities():
             condition_part_not_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4850,7 +4850,7 @@ async def test_condition_entities():
             condition_part_not_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4949,7 +4949,7 @@ async def test_condition_entities():
             condition_part_template_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -4997,7 +4997,7 @@ async def test_condition_entities():
             condition_part_template_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5057,7 +5057,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5106,7 +5106,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5159,7 +5159,7 @@ async def test_condition_entities():
             condition_part_template_5,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5205,7 +5205,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_sun_1", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_sun_1, position=1, real_position=0, script_path=file_path
+            condition_part_sun_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5244,7 +5244,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_sun_2", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_sun_2, position=1, real_position=0, script_path=file_path
+            condition_part_sun_2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5286,7 +5286,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_sun_3", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_sun_3, position=1, real_position=0, script_path=file_path
+            condition_part_sun_3, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5335,7 +5335,7 @@ async def test_condition_entities():
             position=3,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5381,7 +5381,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_device_1", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_device_1, position=1, real_position=0, script_path=file_path
+            condition_part_device_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5429,7 +5429,7 @@ async def test_condition_entities():
             position=5,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5473,7 +5473,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_time_1", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_time_1, position=1, real_position=0, script_path=file_path
+            condition_part_time_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5512,7 +5512,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_time_2", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_time_2, position=1, real_position=0, script_path=file_path
+            condition_part_time_2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5553,7 +5553,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_time_3", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_time_3, position=1, real_position=0, script_path=file_path
+            condition_part_time_3, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5601,7 +5601,7 @@ async def test_condition_entities():
             condition_part_time_4,
             position=12,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
             parent=10,
         )
         test_condition_return(file_path)
@@ -5643,7 +5643,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_trigger_1", CONDITION_DIR)
         test_trigger_fill(file_path, "trigger_1")
         results = _condition_entities(
-            condition_part_trigger_1, position=1, real_position=0, script_path=file_path
+            condition_part_trigger_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5669,7 +5669,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_trigger_2", CONDITION_DIR)
         test_trigger_fill(file_path, "trigger_1")
         results = _condition_entities(
-            condition_part_trigger_2, position=1, real_position=0, script_path=file_path
+            condition_part_trigger_2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5699,7 +5699,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5732,7 +5732,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -5768,7 +5768,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_zone_1", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_zone_1, position=1, real_position=0, script_path=file_path
+            condition_part_zone_1, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5816,7 +5816,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_zone_2", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_zone_2, position=1, real_position=0, script_path=file_path
+            condition_part_zone_2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5864,7 +5864,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_zone_3", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_zone_3, position=1, real_position=0, script_path=file_path
+            condition_part_zone_3, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -5952,7 +5952,7 @@ async def test_condition_entities():
             position=4,
             parent=2,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         test_condition_return(file_path)
 
@@ -6036,7 +6036,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_x", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_x, position=1, real_position=0, script_path=file_path
+            condition_part_x, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -6056,7 +6056,7 @@ async def test_condition_entities():
         file_path = init_automation_script("condition_part_x2", CONDITION_DIR)
         test_trigger_fill(file_path)
         results = _condition_entities(
-            condition_part_x2, position=1, real_position=0, script_path=file_path
+            condition_part_x2, position=1, real_position=0, script=file_path
         )
         test_condition_return(file_path)
 
@@ -6101,7 +6101,7 @@ async def test_action_entities():
             action_part_call_service_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6134,7 +6134,7 @@ async def test_action_entities():
             action_part_call_service_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6172,7 +6172,7 @@ async def test_action_entities():
             action_part_call_service_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6208,7 +6208,7 @@ async def test_action_entities():
             action_part_call_service_4,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6243,7 +6243,7 @@ async def test_action_entities():
             position=20,
             parent=10,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6273,7 +6273,7 @@ async def test_action_entities():
             action_part_call_service_6,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         close_action_section(file_path)
 
@@ -6306,7 +6306,7 @@ async def test_action_entities():
         action_part_call_service_7,
         position=1,
         real_position=0,
-        script_path=file_path,
+        script=file_path,
     )
     close_action_section(file_path)
     
@@ -6349,7 +6349,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_1, position=1, real_position=0, script_path=file_path
+            action_part_if_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6409,7 +6409,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_2, position=1, real_position=0, script_path=file_path
+            action_part_if_2, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6471,7 +6471,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_3, position=1, real_position=0, script_path=file_path
+            action_part_if_3, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6530,7 +6530,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_4", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_4, position=1, real_position=0, script_path=file_path
+            action_part_if_4, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6607,7 +6607,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_5", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_5, position=27, real_position=4, script_path=file_path
+            action_part_if_5, position=27, real_position=4, script=file_path
         )
         close_action_section(file_path)
 
@@ -6681,7 +6681,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_if_6", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_if_6, position=1, real_position=0, script_path=file_path
+            action_part_if_6, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6725,7 +6725,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_choose_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_choose_1, position=1, real_position=0, script_path=file_path
+            action_part_choose_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6803,7 +6803,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_choose_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_choose_2, position=1, real_position=0, script_path=file_path
+            action_part_choose_2, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -6911,7 +6911,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_choose_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_choose_3, position=1, real_position=0, script_path=file_path
+            action_part_choose_3, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7035,7 +7035,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_choose_4", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_choose_4, position=1, real_position=0, script_path=file_path
+            action_part_choose_4, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7128,7 +7128,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_choose_6", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_choose_6, position=18, real_position=2, script_path=file_path
+            action_part_choose_6, position=18, real_position=2, script=file_path
         )
         close_action_section(file_path)
 
@@ -7196,7 +7196,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_parallel_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_parallel_1, position=1, real_position=0, script_path=file_path
+            action_part_parallel_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7238,7 +7238,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_parallel_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_parallel_2, position=20, real_position=5, script_path=file_path
+            action_part_parallel_2, position=20, real_position=5, script=file_path
         )
         close_action_section(file_path)
 
@@ -7280,7 +7280,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_1, position=1, real_position=0, script_path=file_path
+            action_part_repeat_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7318,7 +7318,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_2, position=1, real_position=0, script_path=file_path
+            action_part_repeat_2, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7377,7 +7377,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_3, position=1, real_position=0, script_path=file_path
+            action_part_repeat_3, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7442,7 +7442,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_4", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_4, position=1, real_position=0, script_path=file_path
+            action_part_repeat_4, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7522,7 +7522,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_5", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_5, position=1, real_position=0, script_path=file_path
+            action_part_repeat_5, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7591,7 +7591,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_6", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_6, position=1, real_position=0, script_path=file_path
+            action_part_repeat_6, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7648,7 +7648,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_repeat_7", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_repeat_7, position=18, real_position=3, script_path=file_path
+            action_part_repeat_7, position=18, real_position=3, script=file_path
         )
         close_action_section(file_path)
 
@@ -7711,7 +7711,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_sequence_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_sequence_1, position=1, real_position=0, script_path=file_path
+            action_part_sequence_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7750,7 +7750,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_sequence_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_sequence_2, position=1, real_position=0, script_path=file_path
+            action_part_sequence_2, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -7800,7 +7800,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_sequence_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_sequence_3, position=557, real_position=9, script_path=file_path
+            action_part_sequence_3, position=557, real_position=9, script=file_path
         )
         close_action_section(file_path)
 
@@ -7836,7 +7836,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_condition_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_condition_1, position=1, real_position=0, script_path=file_path
+            action_part_condition_1, position=1, real_position=0, script=file_path
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -7880,7 +7880,7 @@ async def test_action_entities():
             action_part_condition_2,
             position=10,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
             parent=1,
         )
         create_dummy_action_return(file_path)
@@ -7931,7 +7931,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_condition_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_condition_3, position=1, real_position=0, script_path=file_path
+            action_part_condition_3, position=1, real_position=0, script=file_path
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8001,7 +8001,7 @@ async def test_action_entities():
             position=10,
             parent=5,
             real_position=2,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8060,7 +8060,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_event_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_event_1, position=1, real_position=0, script_path=file_path
+            action_part_event_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -8095,7 +8095,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_event_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_event_2, position=10, real_position=0, script_path=file_path
+            action_part_event_2, position=10, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -8142,7 +8142,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_1,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8193,7 +8193,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_2,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8251,7 +8251,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_3,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8323,7 +8323,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_4,
             position=10,
             real_position=5,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8406,7 +8406,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_5,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8459,7 +8459,7 @@ async def test_action_entities():
             action_part_wait_for_trigger_6,
             position=1,
             real_position=0,
-            script_path=file_path,
+            script=file_path,
         )
         create_dummy_action_return(file_path)
         close_action_section(file_path)
@@ -8507,7 +8507,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_device_1", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_device_1, position=1, real_position=0, script_path=file_path
+            action_part_device_1, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -8539,7 +8539,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_device_2", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_device_2, position=1, real_position=0, script_path=file_path
+            action_part_device_2, position=1, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -8569,7 +8569,7 @@ async def test_action_entities():
         file_path = init_automation_script("action_part_device_3", ACTION_DIR)
         test_condition_fill(file_path)
         results = _action_entities(
-            action_part_device_3, position=10, real_position=0, script_path=file_path
+            action_part_device_3, position=10, real_position=0, script=file_path
         )
         close_action_section(file_path)
 
@@ -2,33 +2,26 @@
 This module contains the tests for the utility functions of the automation script generator.
 """
 
-from os import mkdir, path, remove
+from concurrent.futures import ThreadPoolExecutor
+from os import path, remove
 
 from backend.automation_gen.automation_script_gen.utils import (
     init_automation_script,
     append_script_context_to_script,
     close_script,
     create_locked_message,
+    create_script_builder,
+    discard_script,
+    get_indentation,
+    get_script_version,
+    load_template,
 )
-from backend.utils.env_const import AUTOMATION_SCRIPT, TEMPLATE_PATH
+from backend.utils.env_const import TEMPLATE_PATH
 
 TEST_DIR = path.join("src", "test", "test_automation_gen", "test_scripts")
 
 
-def remove_test_files():
-    """
-    Remove the test files.
-    """
-    test_files = [
-        path.join(TEST_DIR, "test_automation_V_1.py"),
-        path.join(AUTOMATION_SCRIPT, "test_automation_V_1.py"),
-    ]
-    for file in test_files:
-        if path.exists(file):
-            remove(file)
-
-
-def test_init_automation_script():
+def test_init_automation_script(tmp_path, temp_script_dir):
     """
     Test the initialization of the automation script.
     """
@@ -42,15 +35,15 @@ def test_init_automation_script():
 
     # Test case 1: test the initialization of the automation script without a automation name
     try:
-        init_automation_script(automation_name=None, dir_path=TEST_DIR)
+        init_automation_script(automation_name=None, dir_path=tmp_path)
     except ValueError as e:
         error_message = str(e)
         assert error_message == "The automation name must be provided"
         
     
     # Test case 2: test the initialization of the automation script
-    init_automation_script(automation_name="test_automation", dir_path=TEST_DIR)
-    with open(path.join(TEST_DIR, "test_automation_V_1.py"), "r") as file:
+    init_automation_script(automation_name="test_automation", dir_path=tmp_path)
+    with open(path.join(tmp_path, "test_automation_V_1.py"), "r") as file:
         script_content = file.read()
         script_content = script_content.replace("    ", "\t")
         assert script_content == compare_content
@@ -58,11 +51,10 @@ def test_init_automation_script():
     
     # Test case 3: test the initialization of the automation script in the script directory
     init_automation_script(automation_name="test_automation")
-    with open(path.join(AUTOMATION_SCRIPT, "test_automation_V_1.py"), "r") as file:
+    with open(path.join(temp_script_dir, "test_automation_V_1.py"), "r") as file:
         script_content = file.read()
         assert script_content == compare_content
-        
-    remove_test_files()
+
 
 
 def test_append_script_context_to_script():
@@ -85,14 +77,122 @@ def test_append_script_context_to_script():
 def test_close_script():
     pass
 
+
+def test_buffered_script_generation(tmp_path):
+    """
+    Test that a buffered automation script is only written to its file when it is closed.
+    """
+    file_path = path.join(tmp_path, "test_automation_V_1.py")
+
+    # Test case 1: a discarded script leaves no file, its version is released again
+    script_builder = create_script_builder(automation_name="test_automation", dir_path=tmp_path)
+    assert script_builder.filepath == file_path
+    append_script_context_to_script(script_builder, "\treturn triggered\n")
+    with open(file_path, "r") as file:
+        assert file.read() == ""
+    discard_script(script_builder)
+    assert not path.exists(file_path)
+
+    # Test case 2: a closed script is written completely
+    script_builder = create_script_builder(automation_name="test_automation", dir_path=tmp_path)
+    assert script_builder.filepath == file_path
+    append_script_context_to_script(script_builder, "\treturn triggered\n")
+    close_script(script_builder)
+    with open(file_path, "r") as file:
+        script_content = file.read()
+    assert "\treturn triggered\n" in script_content
+    assert script_content.endswith("run_automation(input_vals)")
+
+
+def test_script_builder_indentation(tmp_path):
+    """
+    Test the indentation tracking of the script builder.
+    """
+    script_builder = create_script_builder(automation_name="test_automation", dir_path=tmp_path)
+    assert script_builder.get_indentation() == ""
+
+    # Test case 1: every opened block indents one level more
+    assert script_builder.indent() == 1
+    assert script_builder.indent() == 2
+    assert script_builder.get_indentation() == get_indentation(2) == "\t\t"
+    assert script_builder.get_indentation(extra_lvl=1) == "\t\t\t"
+
+    # Test case 2: a closed block returns to the former level
+    assert script_builder.dedent() == 1
+    assert script_builder.dedent() == 0
+
+    # Test case 3: no block can be closed on the top level
+    try:
+        script_builder.dedent()
+        assert False
+    except ValueError as e:
+        assert str(e) == "No block of the automation script is open"
+    discard_script(script_builder)
+
+
+def test_script_version_allocation(tmp_path):
+    """
+    Test that concurrent initializations of the same automation get distinct versions.
+    """
+    file_paths = [path.join(tmp_path, f"test_automation_V_{i}.py") for i in range(1, 9)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        created_paths = list(
+            executor.map(
+                lambda _: init_automation_script(automation_name="test_automation", dir_path=tmp_path),
+                range(8),
+            )
+        )
+
+    assert sorted(created_paths) == sorted(file_paths)
+
+    # the next version follows the latest version even if a former version is removed
+    remove(file_paths[3])
+    assert init_automation_script(automation_name="test_automation", dir_path=tmp_path) == path.join(
+        tmp_path, "test_automation_V_9.py"
+    )
+
+
+def test_script_versions_are_not_reused(tmp_path):
+    """
+    Test that a removed version is not allocated again, even if it is the first version.
+    """
+    for i in range(1, 10):
+        init_automation_script(automation_name="test_automation", dir_path=tmp_path)
+        remove(path.join(tmp_path, f"test_automation_V_{i}.py"))
+
+    assert init_automation_script(automation_name="test_automation", dir_path=tmp_path) == path.join(
+        tmp_path, "test_automation_V_10.py"
+    )
+
+
+def test_get_script_version():
+    """
+    Test that the version is read from the file name of a versioned automation script.
+    """
+    assert get_script_version(path.join(TEST_DIR, "test_automation_V_12.py")) == 12
+    assert get_script_version(path.join(TEST_DIR, "test_V_automation_V_3.py")) == 3
+    assert get_script_version(path.join(TEST_DIR, "example_automation.py")) is None
+
+
+def test_load_template():
+    """
+    Test that the templates are preprocessed once and then taken from the cache.
+    """
+    with open(path.join(TEMPLATE_PATH, "action_template.py"), "r") as file:
+        compare_content = file.read().replace("    ", "\t")
+
+    template_content = load_template("action_template.py")
+    assert template_content == compare_content
+    assert load_template("action_template.py") is template_content
+
+    try:
+        load_template("missing_template.py")
+        assert False
+    except FileNotFoundError as e:
+        assert "missing_template.py" in str(e)
+
+
 def test_create_locked_message():
     pass
 
-
-if __name__ == "__main__":
-    
-    if not path.exists(TEST_DIR):
-        mkdir(TEST_DIR)
-    
-    test_init_automation_script()
-    print("All tests passed.")
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+This module contains the tests for the creation of the automation test cases.
+"""
+
+import ast
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from itertools import combinations, islice, product
+from os import path
+
+from backend.automation_testing.test_case_gen import (
+    add_test_case_combinations_to_db,
+    add_test_cases_to_db,
+    count_test_case_input_combinations,
+    create_branch_covering_test_case_input_combinations,
+    create_covering_test_case_input_combinations,
+    create_test_case_input_combinations,
+    decode_combination_index,
+    get_reduction_ratio,
+    iter_test_case_input_combination_chunks,
+    iter_test_case_input_combinations,
+    sample_test_case_input_combinations,
+)
+from backend.database import db_create_test_cases, db_utils
+from backend.utils.env_helper_classes import Entity
+
+# the branch sections of a generated automation script with a state trigger, a condition and a nested numeric action
+BRANCH_SCRIPT = """
+import json
+
+def trigger_check(input_vals) -> bool:
+\ttriggered = False
+\ttrigger = input_vals[0]
+\tif (trigger[0] is not None and (trigger[0] == "on")):
+\t\ttriggered = True
+\treturn triggered
+
+def condition_evaluation(input_vals) -> dict:
+\tcondition = input_vals[1]
+\tcondition_passed = False
+\tif (
+\t\t(condition[0])
+\t\tand (condition[1] == "off")
+\t):
+\t\tcondition_passed = True
+\treturn condition_passed
+
+def action_execution(input_vals) -> None:
+\taction_inputs = input_vals[2]
+\tif (action_inputs[0]):
+\t\tprint(json.dumps([{"switch.first": "turn_on"}]))
+\telif (10.0 < action_inputs[1] < 20):
+\t\tprint(json.dumps([{"switch.second": "turn_on"}]))
+
+def run_automation(input_vals) -> None:
+\tif trigger_check(input_vals):
+\t\tif condition_evaluation(input_vals):
+\t\t\taction_execution(input_vals)
+\t\telse:
+\t\t\tprint(json.dumps({"AutomationResult":"Condition not met"}))
+\telse:
+\t\tprint(json.dumps({"AutomationResult":"No trigger detected"}))
+"""
+
+
+def _get_branch_outcomes(script_path: str, input_vals: list) -> set:
+    """
+    Run the automation script with the input values and get the outcomes of the branches it reached.
+    """
+    with open(script_path) as script:
+        script_tree = ast.parse(script.read())
+    branches = [node for node in ast.walk(script_tree) if isinstance(node, ast.If)]
+
+    executed_lines = set()
+
+    def _trace(frame, event, arg):
+        if frame.f_code.co_filename == script_path and event == "line":
+            executed_lines.add(frame.f_lineno)
+        return _trace
+
+    namespace = {"__name__": "branch_script"}
+    exec(compile(script_tree, script_path, "exec"), namespace)
+
+    sys.settrace(_trace)
+    try:
+        with redirect_stdout(io.StringIO()):
+            namespace["run_automation"](input_vals)
+    finally:
+        sys.settrace(None)
+
+    outcomes = set()
+    for branch in branches:
+        if executed_lines.isdisjoint(range(branch.lineno, branch.test.end_lineno + 1)):
+            continue
+        outcomes.add((branch.lineno, branch.body[0].lineno in executed_lines))
+
+    return outcomes
+
+
+def _create_input_value_list(automation_id: int) -> list:
+    """
+    Create the input value list with two test values for every input entity of the automation.
+    """
+    return [
+        {"entity": entity, "a_id": automation_id, "test_value": ["on", "off"]}
+        for entity in db_utils.get_automation_entities(automation_id, only_inputs=True)
+    ]
+
+
+def test_add_test_cases_to_db(temp_database):
+    """
+    Test that all test case combinations are inserted with their inputs.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    input_value_list = _create_input_value_list(automation_id)
+
+    combinations = create_test_case_input_combinations(input_value_list)
+    test_cases = add_test_cases_to_db(
+        automation_id,
+        combinations,
+        input_value_list,
+        ["requirement"] + [""] * (len(combinations) - 1),
+        ["1"] + [""] * (len(combinations) - 1),
+    )
+
+    assert len(test_cases) == 2 ** len(input_value_list)
+    assert all(len(test_case["input_ids"]) == len(input_value_list) for test_case in test_cases)
+
+    loaded_cases = {case["case_id"]: case for case in db_utils.load_test_cases(automation_id)}
+
+    assert len(loaded_cases) == len(test_cases)
+    first_case = loaded_cases[test_cases[0]["test_case_id"]]
+    assert first_case["requirement"] == "requirement"
+    assert first_case["priority"] == 1
+    assert [case_input["test_value"] for case_input in first_case["case_inputs"]] == combinations[0]
+    assert loaded_cases[test_cases[-1]["test_case_id"]]["case_inputs"][0]["test_value"] == "off"
+
+
+def test_add_stored_test_cases_to_db(temp_database):
+    """
+    Test that already stored test cases are not created again, but returned with their stored ids.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    input_value_list = _create_input_value_list(automation_id)
+    input_value_list[0]["test_value"] = ["on", "off", "unknown", "unavailable"]
+
+    combinations = create_test_case_input_combinations(input_value_list)
+    first_stats = {}
+    first_cases = add_test_cases_to_db(
+        automation_id, combinations[:2], input_value_list, ["", ""], ["", ""], stats=first_stats
+    )
+
+    stats = {}
+    test_cases = add_test_cases_to_db(
+        automation_id,
+        combinations + combinations[:1],
+        input_value_list,
+        [""] * (len(combinations) + 1),
+        [""] * (len(combinations) + 1),
+        stats=stats,
+    )
+
+    assert first_stats["created"] == 2
+    assert len(test_cases) == len(combinations) + 1
+    assert test_cases[:2] == first_cases
+    assert test_cases[-1] == first_cases[0]
+    assert stats["created"] == len(combinations) - 2
+    assert stats["skipped"] == 3
+    assert stats["inputs"] == stats["created"] * len(input_value_list)
+    assert stats["duration"] > 0 and stats["throughput"] > 0
+    assert len(db_utils.load_test_cases(automation_id)) == len(combinations)
+
+
+def test_stream_test_case_input_combinations():
+    """
+    Test that the streamed combinations are counted and chunked without creating the whole product.
+    """
+    input_value_list = [{"test_value": list(range(50))} for _ in range(12)]
+
+    # 50^12 combinations could never be created in memory
+    assert count_test_case_input_combinations(input_value_list) == 50**12
+    assert next(iter_test_case_input_combinations(input_value_list)) == [0] * 12
+
+    small_value_list = [{"test_value": ["on", "off"]}, {"test_value": [1, 2, 3]}, {"test_value": "fixed"}]
+    chunks = list(iter_test_case_input_combination_chunks(small_value_list, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert [combination for chunk in chunks for combination in chunk] == create_test_case_input_combinations(
+        small_value_list
+    )
+    assert len(list(islice(iter_test_case_input_combination_chunks(input_value_list, 1000), 2))) == 2
+
+
+def test_add_test_case_combinations_to_db(temp_database):
+    """
+    Test that the streamed combinations are inserted chunk by chunk.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    input_value_list = _create_input_value_list(automation_id)
+    input_value_list[0]["test_value"] = ["streamed", "unknown", "unavailable"]
+
+    num_cases = add_test_case_combinations_to_db(automation_id, input_value_list, "streamed", "2", chunk_size=2)
+
+    assert num_cases == count_test_case_input_combinations(input_value_list)
+
+    new_cases = db_utils.load_test_cases(automation_id)
+    assert len(new_cases) == num_cases
+    assert {case["case_inputs"][0]["test_value"] for case in new_cases} == {"streamed", "unknown", "unavailable"}
+    assert all(case["requirement"] == "streamed" and case["priority"] == 2 for case in new_cases)
+
+
+def test_skip_stored_test_cases(temp_database):
+    """
+    Test that test cases with an already stored input vector are not created again.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    input_value_list = _create_input_value_list(automation_id)
+    input_value_list[0]["test_value"] = [2.0, "dedup"]
+    entity = input_value_list[0]["entity"]
+
+    # a test case created without an input hash (like before the deduplication)
+    legacy_case_id = db_create_test_cases.create_test_case(automation_id)
+    db_create_test_cases.create_test_case_input(
+        2, legacy_case_id, automation_id, entity.entity_id, entity.parameter_role, entity.position
+    )
+
+    num_cases = add_test_case_combinations_to_db(automation_id, input_value_list)
+
+    # the value 2.0 is stored as 2 and already part of the former test case
+    assert num_cases == count_test_case_input_combinations(input_value_list) // 2
+    assert add_test_case_combinations_to_db(automation_id, input_value_list) == 0
+    assert len(db_utils.load_test_cases(automation_id)) == 1 + num_cases
+
+
+def test_covering_test_case_input_combinations():
+    """
+    Test that the covering array contains every t-way combination of the test values.
+    """
+    input_value_list = [
+        {"test_value": ["on", "off", "unavailable"]},
+        {"test_value": [1, 2, 3, 4]},
+        {"test_value": ["home", "away"]},
+        {"test_value": [True, False]},
+        {"test_value": ["a", "b", "c"]},
+        {"test_value": "fixed"},
+    ]
+    test_values = [value["test_value"] for value in input_value_list[:-1]] + [["fixed"]]
+
+    for strength in [1, 2, 3]:
+        covering_combinations = create_covering_test_case_input_combinations(input_value_list, strength)
+
+        for entities in combinations(range(len(input_value_list)), strength):
+            covered = {tuple(combination[entity] for entity in entities) for combination in covering_combinations}
+            assert covered == set(product(*[test_values[entity] for entity in entities]))
+
+    pairwise_combinations = create_covering_test_case_input_combinations(input_value_list)
+    assert len(pairwise_combinations) < count_test_case_input_combinations(input_value_list)
+    assert 0 < get_reduction_ratio(len(pairwise_combinations), input_value_list) < 1
+
+    # a strength of at least the number of entities creates the cartesian product
+    assert sorted(map(str, create_covering_test_case_input_combinations(input_value_list, 6))) == sorted(
+        map(str, create_test_case_input_combinations(input_value_list))
+    )
+
+
+def test_covering_test_case_input_combinations_size():
+    """
+    Test that the rows of the covering array are reused for the missing combinations of new entities.
+    """
+    input_value_list = [{"test_value": [f"value_{entity}_{x}" for x in range(3)]} for entity in range(10)]
+    test_values = [value["test_value"] for value in input_value_list]
+
+    pairwise_combinations = create_covering_test_case_input_combinations(input_value_list)
+
+    for entities in combinations(range(len(input_value_list)), 2):
+        covered = {tuple(combination[entity] for entity in entities) for combination in pairwise_combinations}
+        assert covered == set(product(*[test_values[entity] for entity in entities]))
+
+    # the 3^10 pairwise combinations needed 27 rows when only new rows were reused
+    assert len(pairwise_combinations) <= 20
+
+    # 4 entities with 3 values are covered by the 9 rows of two orthogonal latin squares
+    assert len(create_covering_test_case_input_combinations(input_value_list[:4])) == 9
+
+
+def test_branch_covering_test_case_input_combinations():
+    """
+    Test that the branch coverage keeps one value per equivalence class and covers every branch outcome.
+    """
+    test_values = [
+        ("trigger", ["on", "off", "unavailable", "unknown"]),
+        ("condition", ["on", "off", "home"]),
+        ("condition", ["on", "off", "idle"]),
+        ("action", ["on", "off", ""]),
+        ("action", ["5", "9", "10", "12", "15", "19", "20", "25"]),
+    ]
+    roles = {"trigger": 0, "condition": 1, "action": 2}
+    input_value_list = [
+        {"entity": Entity(roles[role], position, "sensor", f"sensor.{role}_{position}"), "test_value": values}
+        for position, (role, values) in enumerate(test_values)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_path = path.join(temp_dir, "branch_script.py")
+        with open(script_path, "w") as script:
+            script.write(BRANCH_SCRIPT)
+
+        branch_combinations = create_branch_covering_test_case_input_combinations(input_value_list, script_path)
+
+        # the outcomes of the branches reached by runs of the script with the test cases
+        outcomes = set()
+        for combination in branch_combinations:
+            input_vals = [[combination[0]], combination[1:3], [combination[3], float(combination[4])]]
+            outcomes.update(_get_branch_outcomes(script_path, input_vals))
+
+        with open(script_path) as script:
+            branch_lines = [node.lineno for node in ast.walk(ast.parse(script.read())) if isinstance(node, ast.If)]
+
+    assert len(branch_combinations) < count_test_case_input_combinations(input_value_list)
+
+    # "off", "unavailable" and "unknown" take the same branch of the trigger
+    assert {combination[0] for combination in branch_combinations} == {"on", "off"}
+    # the limits of the numeric comparison are tested with the closest values on both sides
+    assert {combination[4] for combination in branch_combinations} == {"9", "10", "12", "19", "20", "25"}
+
+    # every branch of the run is taken in both directions, including the condition and the actions
+    assert outcomes == {(line, outcome) for line in branch_lines for outcome in (True, False)}
+
+
+def test_sample_test_case_input_combinations():
+    """
+    Test that oversized combination spaces are sampled reproducibly without creating the product.
+    """
+    small_value_list = [{"test_value": ["on", "off"]}, {"test_value": [1, 2, 3]}]
+    combinations = create_test_case_input_combinations(small_value_list)
+
+    # the mixed-radix decoding follows the order of the cartesian product
+    assert [decode_combination_index(index, [["on", "off"], [1, 2, 3]]) for index in range(6)] == combinations
+    # combinations within the budget are not sampled
+    assert sample_test_case_input_combinations(small_value_list, budget=6) == combinations
+
+    input_value_list = [{"test_value": [f"value_{value}" for value in range(40)]} for _ in range(15)]
+
+    for stratified in [False, True]:
+        samples = sample_test_case_input_combinations(input_value_list, budget=200, seed=7, stratified=stratified)
+
+        assert len(samples) == 200
+        assert len({tuple(sample) for sample in samples}) == 200
+        assert samples == sample_test_case_input_combinations(input_value_list, budget=200, seed=7, stratified=stratified)
+        assert samples != sample_test_case_input_combinations(input_value_list, budget=200, seed=8, stratified=stratified)
+
+    # every value of an entity occurs equally often in the stratified samples
+    for entity in range(15):
+        occurrences = [sample[entity] for sample in samples]
+        assert {occurrences.count(value) for value in set(occurrences)} == {5}
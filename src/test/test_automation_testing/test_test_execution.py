@@ -0,0 +1,290 @@
+"""
+This module contains the tests for the execution of the automation test cases.
+"""
+
+from os import path
+
+from backend.automation_testing import test_execution
+from backend.automation_testing.test_execution import (
+    ALREADY_RUNNING,
+    MAX_RUNS_EXCEEDED,
+    STOPPED_BY_RESTART,
+    TIMEOUT_EXCEEDED,
+    _run_batch_automation,
+    _run_sync_automation,
+    run_distinct_automations,
+    run_pooled_automations,
+    run_simultaneous_automations,
+)
+from backend.automation_testing.execution_cache import ExecutionCache
+from backend.automation_testing.in_process_execution import (
+    is_generated_script,
+    run_in_process_automation,
+    run_in_process_automations,
+)
+from backend.automation_testing.parallel_execution import run_parallel_automations
+from backend.automation_testing.worker_pool import AutomationWorkerPool
+from backend.utils.env_const import EXAMPLE_SCRIPT, PARALLEL, QUEUED, RESTART, SINGLE
+
+# input vectors for the example automation (trigger, condition and action inputs)
+EXAMPLE_INPUTS = [
+    [["off"], [], ["playing"]],
+    [["on"], [], ["playing"]],
+    [["off"], [], [None]],
+]
+
+
+def _create_test_cases(inputs: list) -> list:
+    """
+    Create the test case dictionaries for the example automation script.
+    """
+    return [
+        {"id": i, "script_path": EXAMPLE_SCRIPT, "input_values": input_values}
+        for i, input_values in enumerate(inputs)
+    ]
+
+
+def test_worker_pool_matches_single_run():
+    """
+    Test that the worker pool returns the same results as a single run of the script.
+    """
+    with AutomationWorkerPool(pool_size=2) as pool:
+        for inputs in EXAMPLE_INPUTS:
+            assert pool.run_automation(EXAMPLE_SCRIPT, inputs) == _run_sync_automation(
+                EXAMPLE_SCRIPT, inputs
+            )
+
+
+def test_run_pooled_automations():
+    """
+    Test that the pooled execution keeps the order of the test cases.
+    """
+    test_cases = _create_test_cases(EXAMPLE_INPUTS * 5)
+    results = run_pooled_automations(test_cases, pool_size=3)
+
+    assert [result["testcase"] for result in results] == list(range(len(test_cases)))
+    assert results[0]["result"].strip() == '[{"media_player.test_actor": "media_pause"}]'
+    assert results[1]["result"].strip() == '{"AutomationResult": "No trigger detected"}'
+    assert "ValueError" in results[2]["result"]
+
+
+def test_batch_mode_matches_single_run():
+    """
+    Test that the batch mode of a script returns one result per input vector like single runs.
+    """
+    results = _run_batch_automation(EXAMPLE_SCRIPT, EXAMPLE_INPUTS)
+
+    assert results == [
+        _run_sync_automation(EXAMPLE_SCRIPT, inputs) for inputs in EXAMPLE_INPUTS
+    ]
+
+
+def test_run_distinct_automations():
+    """
+    Test that the distinct execution keeps the result format of the automation mode.
+    """
+    test_cases = _create_test_cases(EXAMPLE_INPUTS)
+
+    queued_results = run_distinct_automations(test_cases, QUEUED)
+    assert [result["testcase"] for result in queued_results] == [0, 1, 2]
+    assert queued_results[1]["result"].strip() == '{"AutomationResult": "No trigger detected"}'
+
+    single_results = run_distinct_automations(test_cases, SINGLE)
+    assert single_results[0]["result"] == [{"media_player.test_actor": "media_pause"}]
+
+
+def test_run_distinct_automations_with_script_error():
+    """
+    Test that an input vector raising in the script does not stop the batch of the other test cases.
+    """
+    # the empty trigger inputs raise an IndexError in the trigger check of the script
+    test_cases = _create_test_cases([EXAMPLE_INPUTS[0], [[], [], []], EXAMPLE_INPUTS[1]])
+
+    results = run_distinct_automations(test_cases, QUEUED)
+
+    assert [result["testcase"] for result in results] == [0, 1, 2]
+    assert results[0]["result"].strip() == '[{"media_player.test_actor": "media_pause"}]'
+    assert results[1]["result"].strip() == '{"ScriptError": "IndexError: list index out of range"}'
+    assert results[2]["result"].strip() == '{"AutomationResult": "No trigger detected"}'
+
+
+def test_in_process_execution_matches_single_run():
+    """
+    Test that the in-process execution returns the same results as a single run of the script.
+    """
+    assert is_generated_script(EXAMPLE_SCRIPT)
+
+    for inputs in EXAMPLE_INPUTS:
+        assert run_in_process_automation(EXAMPLE_SCRIPT, inputs) == _run_sync_automation(
+            EXAMPLE_SCRIPT, inputs
+        )
+
+    results = run_in_process_automations(_create_test_cases(EXAMPLE_INPUTS))
+    assert [result["testcase"] for result in results] == [0, 1, 2]
+
+
+def test_run_simultaneous_automations():
+    """
+    Test the handling of simultaneous test cases depending on the automation mode.
+    """
+    test_cases = _create_test_cases(EXAMPLE_INPUTS[:2] * 2)
+    action_result = [{"media_player.test_actor": "media_pause"}]
+
+    single_results = run_simultaneous_automations(test_cases, SINGLE, max_instances=10)
+    assert single_results[0]["result"] == action_result
+    assert all(result["result"] == ALREADY_RUNNING for result in single_results[1:])
+
+    restart_results = run_simultaneous_automations(test_cases, RESTART, max_instances=10)
+    assert all(result["result"] == STOPPED_BY_RESTART for result in restart_results[:-1])
+    assert restart_results[-1]["result"] == {"AutomationResult": "No trigger detected"}
+
+    for mode in (QUEUED, PARALLEL):
+        results = run_simultaneous_automations(test_cases, mode, max_instances=3)
+        assert [result["testcase"] for result in results] == [0, 1, 2, 3]
+        assert results[2]["result"] == action_result
+        assert results[3]["result"] == MAX_RUNS_EXCEEDED
+
+
+def test_run_simultaneous_automations_restart_stops_running_scripts(tmp_path, monkeypatch):
+    """
+    Test that a restart stops the running script of the former test case instead of never starting it.
+    """
+    slow_script = path.join(tmp_path, "slow_automation.py")
+    with open(slow_script, "w") as script:
+        script.write("import time\ntime.sleep(30)\n")
+
+    started_scripts = []
+    create_subprocess = test_execution.create_aync_subprocess_exec
+
+    async def _create_counted_subprocess(*command, **kwargs):
+        started_scripts.append(command[1])
+        return await create_subprocess(*command, **kwargs)
+
+    monkeypatch.setattr(test_execution, "create_aync_subprocess_exec", _create_counted_subprocess)
+
+    test_cases = [
+        {"id": i, "script_path": slow_script, "input_values": [[], [], []]} for i in range(2)
+    ] + _create_test_cases(EXAMPLE_INPUTS[:1])
+    results = run_simultaneous_automations(test_cases, RESTART, max_instances=10)
+
+    assert started_scripts == [slow_script, slow_script, EXAMPLE_SCRIPT]
+    assert [result["result"] for result in results] == [
+        STOPPED_BY_RESTART,
+        STOPPED_BY_RESTART,
+        [{"media_player.test_actor": "media_pause"}],
+    ]
+
+
+def test_run_simultaneous_automations_timeout(tmp_path):
+    """
+    Test that a test case is stopped after the timeout.
+    """
+    slow_script = path.join(tmp_path, "slow_automation.py")
+    with open(slow_script, "w") as script:
+        script.write("import time\ntime.sleep(30)\n")
+
+    test_cases = [{"id": 0, "script_path": slow_script, "input_values": [[], [], []]}]
+    results = run_simultaneous_automations(test_cases, PARALLEL, max_instances=1, timeout=0.5)
+
+    assert results[0]["result"] == TIMEOUT_EXCEEDED
+
+
+def test_run_simultaneous_automations_with_script_error(tmp_path):
+    """
+    Test that a crashed script only fails its own test case in a simultaneous run.
+    """
+    crashing_script = path.join(tmp_path, "crashing_automation.py")
+    with open(crashing_script, "w") as script:
+        script.write("raise RuntimeError('crashed')\n")
+
+    test_cases = _create_test_cases(EXAMPLE_INPUTS[:1])
+    test_cases.append({"id": 1, "script_path": crashing_script, "input_values": [[], [], []]})
+
+    results = run_simultaneous_automations(test_cases, PARALLEL, max_instances=2)
+
+    assert results[0]["result"] == [{"media_player.test_actor": "media_pause"}]
+    assert results[1]["testcase"] == 1
+    assert results[1]["result"]["ScriptError"].startswith("JSONDecodeError")
+
+
+def test_run_parallel_automations():
+    """
+    Test that the process pool runs every test case once and reports the progress.
+    """
+    test_cases = _create_test_cases(EXAMPLE_INPUTS * 4)
+    progress = []
+
+    results = run_parallel_automations(
+        test_cases,
+        max_workers=2,
+        chunk_size=5,
+        progress_callback=lambda finished, total: progress.append((finished, total)),
+    )
+
+    assert sorted(result["testcase"] for result in results) == list(range(len(test_cases)))
+    assert progress == [(finished, len(test_cases)) for finished in range(1, len(test_cases) + 1)]
+
+    results_by_case = {result["testcase"]: result["result"] for result in results}
+    assert results_by_case[0].strip() == '[{"media_player.test_actor": "media_pause"}]'
+
+
+def test_execution_cache(tmp_path):
+    """
+    Test that cached results are returned without running the script again.
+    """
+    cache = ExecutionCache(path.join(tmp_path, "cache.sqlite"), max_entries=2)
+    executed_cases = []
+
+    def _runner(testcases: list) -> list:
+        executed_cases.extend(testcase["id"] for testcase in testcases)
+        return run_in_process_automations(testcases)
+
+    test_cases = _create_test_cases(EXAMPLE_INPUTS[:2])
+    first_results = cache.run_test_cases(test_cases, runner=_runner)
+    second_results = cache.run_test_cases(test_cases, runner=_runner)
+
+    assert first_results == second_results
+    assert executed_cases == [0, 1]
+
+    # the least recently used result is removed if the cache is full
+    cache.run_test_cases(_create_test_cases(EXAMPLE_INPUTS[2:]), runner=_runner)
+    assert len(cache.get_results(test_cases)) == 1
+
+    cache.invalidate("example_automation")
+    assert cache.get_results(test_cases) == {}
+
+
+def test_runners_use_execution_cache(tmp_path):
+    """
+    Test that the runners only run the uncached test cases and keep their result format.
+    """
+    cache = ExecutionCache(path.join(tmp_path, "cache.sqlite"))
+    test_cases = _create_test_cases(EXAMPLE_INPUTS)
+    uncached_results = run_in_process_automations(test_cases)
+
+    assert run_in_process_automations(test_cases[:1], cache=cache) == uncached_results[:1]
+    assert len(cache.get_results(test_cases)) == 1
+
+    queued_results = run_distinct_automations(test_cases, QUEUED, cache=cache)
+    assert queued_results == run_distinct_automations(test_cases, QUEUED)
+    assert len(cache.get_results(test_cases)) == 3
+
+    # the cached plain output is parsed like the results of the async modes
+    single_results = run_distinct_automations(test_cases, SINGLE, cache=cache)
+    assert single_results == run_distinct_automations(test_cases, SINGLE)
+
+    # the cached results are returned first and only the others are run on the process pool
+    parallel_cache = ExecutionCache(path.join(tmp_path, "parallel_cache.sqlite"))
+    run_in_process_automations(test_cases[:1], cache=parallel_cache)
+    progress = []
+
+    parallel_results = run_parallel_automations(
+        test_cases,
+        max_workers=2,
+        progress_callback=lambda finished, total: progress.append((finished, total)),
+        cache=parallel_cache,
+    )
+    assert parallel_results[0] == uncached_results[0]
+    assert sorted(result["testcase"] for result in parallel_results) == [0, 1, 2]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert len(parallel_cache.get_results(test_cases)) == 3
@@ -0,0 +1,61 @@
+"""
+This test module is used to test the headless command line interface.
+"""
+
+import json
+import subprocess
+import sys
+from os import path
+
+import cli
+from backend.utils.env_const import EXAMPLE_AUTOMATION_PATH
+
+LOCK_THE_HOUSE = path.join(EXAMPLE_AUTOMATION_PATH, "2024.08.02", "lock_the_house.yaml")
+
+
+def test_cli_does_not_import_frontend():
+    """
+    Test that the command line interface runs without the frontend modules.
+    """
+    imported_modules = subprocess.run(
+        [sys.executable, "-c", "import sys, cli; print(' '.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+    ).stdout.decode("utf-8")
+
+    assert not any(module.split(".")[0] == "frontend" for module in imported_modules.split())
+
+
+def test_cli_workflow(capsys, temp_database, temp_script_dir):
+    """
+    Test the import, the test case generation, the run and the report of an automation.
+    """
+    assert cli.main(["import", LOCK_THE_HOUSE, "--project", "cli", "--workers", "1"]) == 0
+    automation_id = str(max(cli.db_utils.get_automations_with_same_name("Lock_the_house")))
+
+    entities = cli.db_utils.get_automation_entities(int(automation_id), only_inputs=True)
+    value_args = [f"{entity.entity_name}=on,off" for entity in entities]
+
+    assert cli.main(["gen-cases", automation_id] + [arg for value in value_args for arg in ("--value", value)]) == 0
+    assert cli.main(["run", automation_id]) == 0
+
+    capsys.readouterr()
+    assert cli.main(["report", automation_id, "--json"]) == 0
+    executions = json.loads(capsys.readouterr().out)
+
+    script = cli.db_utils.get_automation_data(int(automation_id)).script
+    assert path.dirname(script) == temp_script_dir
+
+    assert len(executions) == 2 ** len(entities)
+    assert len({execution["exec_group"] for execution in executions}) == 1
+    assert all(execution["exec_mode"] == "distinct" for execution in executions)
+
+
+def test_cli_errors(capsys, temp_database):
+    """
+    Test that invalid automations and test values are reported with an exit code.
+    """
+    assert cli.main(["run", "not_existing_automation"]) == 2
+    assert cli.main(["report", "999999"]) == 2
+    assert cli.main(["gen-cases", "example_automation", "--value", "sensor.unknown=on"]) == 2
+    assert "error:" in capsys.readouterr().err
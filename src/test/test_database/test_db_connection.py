@@ -0,0 +1,85 @@
+"""
+This module contains the tests for the connection manager of the database.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.database import db_create_test_cases
+from backend.database.db_connection import get_connection, on_rollback, savepoint, transaction
+from backend.database.db_utils import get_automations_with_same_name
+
+
+def _count_collections(name: str) -> int:
+    """
+    Count the test case collections with the name
+    """
+    cur = get_connection().cursor()
+    cur.execute("SELECT COUNT(*) FROM test_case_collection WHERE tcc_name = ?", (name,))
+    return cur.fetchone()[0]
+
+
+def test_thread_local_connection():
+    """
+    Test that every thread reuses its own connection.
+    """
+    assert get_connection() is get_connection()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_connection = executor.submit(lambda: id(get_connection())).result()
+
+    assert other_connection != id(get_connection())
+
+
+def test_unit_of_work(temp_database):
+    """
+    Test that the operations in a unit of work are committed or rolled back together.
+    """
+    automation_id = get_automations_with_same_name("example_automation")[0]
+
+    # Test case 1: an exception rolls back all operations of the unit of work
+    try:
+        with transaction():
+            db_create_test_cases.create_test_case_collection("rollback_collection", automation_id)
+            db_create_test_cases.create_test_case_collection("rollback_collection", automation_id)
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert _count_collections("rollback_collection") == 0
+
+    # Test case 2: nested units of work are committed with the outermost one
+    with transaction():
+        db_create_test_cases.create_test_case_collection("commit_collection", automation_id)
+        with transaction():
+            db_create_test_cases.create_test_case_collection("commit_collection", automation_id)
+        assert get_connection().in_transaction
+    assert not get_connection().in_transaction
+    assert _count_collections("commit_collection") == 2
+
+
+def test_savepoint_rollback_callbacks(temp_database):
+    """
+    Test that the rollback of a savepoint only calls the rollback functions registered in the savepoint.
+    """
+    called = []
+
+    try:
+        with transaction():
+            on_rollback(lambda: called.append("transaction"))
+            try:
+                with savepoint():
+                    on_rollback(lambda: called.append("rolled back savepoint"))
+                    raise RuntimeError("abort savepoint")
+            except RuntimeError:
+                pass
+            assert called == ["rolled back savepoint"]
+
+            with savepoint():
+                on_rollback(lambda: called.append("released savepoint"))
+            assert called == ["rolled back savepoint"]
+
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    # the released savepoint is rolled back with the unit of work
+    assert called == ["rolled back savepoint", "transaction", "released savepoint"]
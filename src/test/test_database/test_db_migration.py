@@ -0,0 +1,82 @@
+"""
+This module contains the tests for the migration of the database schema.
+"""
+
+import sqlite3 as sqlite
+import tempfile
+from os import path
+
+from backend.database.db_migration import get_migrations, migrate_database
+from backend.utils.env_const import INIT_FILE
+
+
+def _get_indexes(db_path: str) -> list:
+    """
+    Get the names of the indexes created by the migrations
+    """
+    with sqlite.connect(db_path) as con:
+        cur = con.cursor()
+        cur.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+        return [row[0] for row in cur.fetchall()]
+
+
+def test_migrate_new_database():
+    """
+    Test that a new database is created with the latest schema version in WAL mode.
+    """
+    latest_version = get_migrations()[-1][0]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = path.join(temp_dir, "test.sqlite")
+
+        assert migrate_database(db_path) == latest_version
+        # a second migration does not change the database
+        assert migrate_database(db_path) == latest_version
+
+        with sqlite.connect(db_path) as con:
+            cur = con.cursor()
+            cur.execute("PRAGMA journal_mode")
+            assert cur.fetchone()[0] == "wal"
+            cur.execute("SELECT version FROM schema_version ORDER BY version")
+            assert [row[0] for row in cur.fetchall()] == [
+                version for version, _ in get_migrations()
+            ]
+        con.close()
+
+        assert "entity_name" in _get_indexes(db_path)
+        assert "test_case_input_hash" in _get_indexes(db_path)
+
+
+def test_migrate_unversioned_database():
+    """
+    Test that a database created before the versioning gets the missing migrations.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = path.join(temp_dir, "test.sqlite")
+
+        with open(INIT_FILE) as model_creator:
+            con = sqlite.connect(db_path)
+            con.executescript(model_creator.read())
+            con.execute("INSERT INTO integration (i_name) VALUES ('test')")
+            con.execute(
+                "INSERT INTO automation (a_name, autom_mode, max_instances, script) VALUES ('test', 0, 1, '')"
+            )
+            con.execute(
+                "INSERT INTO additional_information (a_id, info_type, info) VALUES (1, 'version', '3')"
+            )
+            con.commit()
+            con.close()
+
+        assert _get_indexes(db_path) == []
+
+        migrate_database(db_path)
+
+        assert "entity_name" in _get_indexes(db_path)
+        with sqlite.connect(db_path) as con:
+            cur = con.cursor()
+            cur.execute("SELECT i_name FROM integration")
+            assert cur.fetchall() == [("test",)]
+            # the version information is taken over into the version column
+            cur.execute("SELECT version FROM automation WHERE a_name = 'test'")
+            assert cur.fetchone()[0] == 3
+        con.close()
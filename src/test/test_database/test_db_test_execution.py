@@ -0,0 +1,55 @@
+"""
+This module contains the tests for saving the test execution results in the database.
+"""
+
+from backend.database import db_create_test_cases
+from backend.database.db_test_execution import ExecutionResultSink, load_test_executions
+from backend.database.db_utils import get_automations_with_same_name
+
+
+def test_execution_result_sink(temp_database):
+    """
+    Test that the results are written in batches with their outputs and errors.
+    """
+    automation_id = get_automations_with_same_name("example_automation")[0]
+    case_id = db_create_test_cases.create_test_case(automation_id)
+
+    results = [
+        {"testcase": case_id, "result": '[{"media_player.test_actor": "media_pause"}]\n'},
+        {"testcase": case_id, "result": {"AutomationResult": "No trigger detected"}},
+        {"testcase": case_id, "result": '{"ValueError": "Action input values cannot be None"}\n'},
+    ]
+
+    with ExecutionResultSink(automation_id, "distinct", batch_size=2) as sink:
+        sink.add_all(results)
+        # the first batch is already written before the sink is closed
+        assert len(load_test_executions(automation_id, sink.exec_group)) == 2
+
+    executions = load_test_executions(automation_id, sink.exec_group)
+
+    assert [execution["case_id"] for execution in executions] == [case_id] * 3
+    assert executions[0]["outputs"] == [
+        {"e_name": "media_player.test_actor", "output_val": "media_pause"}
+    ]
+    assert executions[0]["error_type"] is None
+    assert executions[1]["error_type"] == "AutomationResult"
+    assert executions[2]["error_type"] == "ValueError"
+    assert executions[2]["outputs"] == []
+
+
+def test_execution_result_sinks_get_different_groups(temp_database):
+    """
+    Test that sinks created at the same time write their results into different execution groups.
+    """
+    automation_id = get_automations_with_same_name("example_automation")[0]
+    case_id = db_create_test_cases.create_test_case(automation_id)
+    result = {"testcase": case_id, "result": {"AutomationResult": "No trigger detected"}}
+
+    with ExecutionResultSink(automation_id, "distinct") as first_sink:
+        with ExecutionResultSink(automation_id, "distinct") as second_sink:
+            second_sink.add(result)
+        first_sink.add(result)
+
+    assert first_sink.exec_group == second_sink.exec_group + 1
+    assert len(load_test_executions(automation_id, first_sink.exec_group)) == 1
+    assert len(load_test_executions(automation_id, second_sink.exec_group)) == 1
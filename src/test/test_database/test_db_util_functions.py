@@ -2,8 +2,16 @@
 This file contains the test cases for the db utility functions. (in the future, the test cases will be added)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 
+from backend.database import add_integration, db_create_test_cases, db_utils, transaction
+from backend.database.db_create_autom import (
+    _create_automation_entities_in_db,
+    _create_automation_in_db,
+)
+from backend.utils.env_helper_classes import Automation, Entity
+
 
 TEST_SCRIPT_DIR = path.join("src", "test", "test_automation_gen", "test_scripts")
 
@@ -15,3 +23,160 @@ TEST_SCRIPT_DIR = path.join("src", "test", "test_automation_gen", "test_scripts"
 
 # test delete_automation(automation_id: int = None):
 
+
+
+def test_load_test_cases(temp_database):
+    """
+    Test that the test cases are loaded with their inputs at once and page by page.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    entities = db_utils.get_automation_entities(automation_id, only_inputs=True)
+
+    case_ids = []
+    for case_number in range(5):
+        case_id = db_create_test_cases.create_test_case(automation_id)
+        # the last test case has no inputs
+        if case_number < 4:
+            for entity in entities:
+                db_create_test_cases.create_test_case_input(
+                    f"value_{case_number}",
+                    case_id,
+                    automation_id,
+                    entity.entity_id,
+                    entity.parameter_role,
+                    entity.position,
+                )
+        case_ids.append(case_id)
+
+    test_cases = db_utils.load_test_cases(automation_id)
+
+    assert [case["case_id"] for case in test_cases] == case_ids
+    assert [len(case["case_inputs"]) for case in test_cases] == [len(entities)] * 4 + [0]
+    assert test_cases[1]["case_inputs"][0] == {
+        "test_value": "value_1",
+        "e_id": entities[0].entity_id,
+        "p_role": entities[0].parameter_role,
+        "position": entities[0].position,
+        "e_name": entities[0].entity_name,
+    }
+
+    # load the same test cases page by page
+    paged_cases = []
+    page = db_utils.load_test_case_page(automation_id, case_ids[0] - 1, page_size=2)
+    while page != []:
+        paged_cases += page
+        page = db_utils.load_test_case_page(automation_id, page[-1]["case_id"], page_size=2)
+
+    assert paged_cases == test_cases
+
+
+def test_entity_name_cache(temp_database):
+    """
+    Test that the name caches of the entities and integrations stay consistent with the database.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    entities = db_utils.get_automation_entities(automation_id)
+
+    # Test case 1: existing entities are resolved at once, unknown names are missing
+    entity_ids = db_utils.get_entity_ids([entities[0].entity_name, "sensor.unknown_entity"])
+    assert entity_ids == {entities[0].entity_name: entities[0].entity_id}
+
+    # Test case 2: a new integration is directly known to the cache
+    add_integration("cache_test_integration", [])
+    integration_id = db_utils.get_integration_id("cache_test_integration")
+    assert integration_id is not None
+
+    # Test case 3: entities of a rolled back unit of work are removed from the cache
+    new_entity = Entity(
+        entity_name="cache_test_integration.test_entity",
+        integration="cache_test_integration",
+        param_role=0,
+        position=0,
+    )
+    try:
+        with transaction():
+            _create_automation_entities_in_db(automation_id, [new_entity])
+            assert "cache_test_integration.test_entity" in db_utils.get_entity_ids(
+                ["cache_test_integration.test_entity"]
+            )
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert db_utils.get_entity_ids(["cache_test_integration.test_entity"]) == {}
+    assert db_utils.get_integration_id("cache_test_integration") == integration_id
+
+
+def test_entity_name_cache_per_thread(temp_database):
+    """
+    Test that the uncommitted entities of a unit of work are not cached for other threads.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    new_entity = Entity(
+        entity_name="thread_test_integration.test_entity",
+        integration="thread_test_integration",
+        param_role=0,
+        position=0,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            with transaction():
+                add_integration("thread_test_integration", [])
+                _create_automation_entities_in_db(automation_id, [new_entity])
+                assert "thread_test_integration.test_entity" in db_utils.get_entity_ids(
+                    ["thread_test_integration.test_entity"]
+                )
+                other_thread_ids = executor.submit(
+                    db_utils.get_entity_ids, ["thread_test_integration.test_entity"]
+                ).result()
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+
+    assert other_thread_ids == {}
+    assert db_utils.get_entity_ids(["thread_test_integration.test_entity"]) == {}
+
+
+def test_get_entity_names(temp_database):
+    """
+    Test that the entity names are returned in the order of the ids, even for more ids than one query can take.
+    """
+    automation_id = db_utils.get_automations_with_same_name("example_automation")[0]
+    entities = db_utils.get_automation_entities(automation_id)
+
+    entity_ids = [entity.entity_id for entity in reversed(entities)]
+    entity_names = [entity.entity_name for entity in reversed(entities)]
+
+    assert db_utils.get_entity_names(entity_ids) == entity_names
+    assert db_utils.get_entity_names(entity_ids + [-1]) == entity_names + [None]
+
+    # the existing entities are in the second chunk of the query
+    unknown_ids = list(range(-1, -db_utils.MAX_QUERY_PARAMETERS - 1, -1))
+    assert db_utils.get_entity_names(unknown_ids + entity_ids) == [None] * len(unknown_ids) + entity_names
+
+
+def test_automation_version(temp_database):
+    """
+    Test that every new automation with the same name gets the next version.
+    """
+    automation_info = Automation(automation_name="version_test_automation", automation_script="")
+
+    _, first_version = _create_automation_in_db(automation_info)
+    second_id, second_version = _create_automation_in_db(automation_info)
+
+    assert first_version == 1
+    assert second_version == 2
+
+    # a changed version information is also used for the next version
+    db_utils.update_additional_infos(
+        second_id, [{"info_type": "version", "info_content": str(second_version + 5)}]
+    )
+    assert _create_automation_in_db(automation_info)[1] == second_version + 6
+
+    # the version of a generated script is the version of the automation
+    script_info = Automation(
+        automation_name="version_test_automation",
+        automation_script=path.join(TEST_SCRIPT_DIR, "version_test_automation_V_3.py"),
+        version=3,
+    )
+    assert _create_automation_in_db(script_info)[1] == 3